@@ -129,8 +129,8 @@ class ABTestingFramework:
         engine = LoanScoringEngine()
         
         # Temporarily update weights for scoring
-        original_weights = engine.variable_weights.copy()
-        engine.variable_weights.update(config)
+        original_weights = engine.variable_weights
+        engine.variable_weights = {**original_weights, **config}
         
         scoring_result = engine.score_application(application_data)
         
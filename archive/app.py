@@ -311,10 +311,10 @@ def render_scoring_results(result, applicant_data):
         for var, details in result['variable_scores'].items():
             score_data.append({
                 'Variable': var,
-                'Weight': f"{details['weight']:.1%}",
-                'Band Score': f"{details['band_score']:.2f}",
-                'Weighted Score': f"{details['weighted_score']:.2f}",
-                'Value': str(details['value'])
+                'Weight': f"{details.weight:.1%}",
+                'Band Score': f"{details.band_score:.2f}",
+                'Weighted Score': f"{details.weighted_score:.2f}",
+                'Value': str(details.value)
             })
         
         df_scores = pd.DataFrame(score_data)
@@ -324,7 +324,7 @@ def render_scoring_results(result, applicant_data):
         if result['bucket_movements']:
             st.subheader("Bucket Movements")
             for movement in result['bucket_movements']:
-                st.info(f"Moved from {movement['from']} to {movement['to']}: {movement['reason']}")
+                st.info(f"Moved from {movement.from_bucket} to {movement.to_bucket}: {movement.reason}")
     
     # Generate Excel output
     excel_buffer = create_excel_output([applicant_data], [result], is_bulk=False)
@@ -1,21 +1,39 @@
 import sqlite3
 import json
+import os
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+def _jsonable(obj):
+    """Convert NamedTuple rows (e.g. VarScore) to dicts so they keep their keys in JSON"""
+    if hasattr(obj, '_asdict'):
+        obj = obj._asdict()
+    if isinstance(obj, dict):
+        return {key: _jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(value) for value in obj]
+    return obj
+
 class DatabaseManager:
     """Database manager for storing historical scoring data"""
     
     def __init__(self, db_path: str = "loan_scoring.db"):
         self.db_path = db_path
+        self._initialized = False
         self.init_database()
     
     def init_database(self):
-        """Initialize database tables"""
+        """Initialize database tables (once per instance; later calls are no-ops)"""
+        if self._initialized:
+            return
+        
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # WAL persists in the database file: readers no longer block bulk writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Individual applications table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS individual_applications (
@@ -45,6 +63,17 @@ class DatabaseManager:
         
         conn.commit()
         conn.close()
+        self._initialized = True
+    
+    def reconnect(self):
+        """Re-attach to the database file
+        
+        Connections are opened per call, so there is nothing to recycle; the
+        schema is only recreated when the database file has gone missing.
+        """
+        if not os.path.exists(self.db_path):
+            self._initialized = False
+            self.init_database()
     
     def save_individual_result(self, applicant_data: Dict[str, Any], result: Dict[str, Any]):
         """Save individual application result"""
@@ -59,7 +88,7 @@ class DatabaseManager:
             datetime.now().isoformat(),
             applicant_data.get('pan', ''),
             json.dumps(applicant_data),
-            json.dumps(result),
+            json.dumps(_jsonable(result)),
             result.get('final_score', 0),
             result.get('final_bucket', 'D'),
             result.get('decision', 'Decline')
@@ -98,27 +127,26 @@ class DatabaseManager:
             total_records,
             successful_records,
             avg_score,
-            json.dumps(results)
+            json.dumps(_jsonable(results))
         ))
         
-        # Save individual results from bulk
-        for result in successful_results:
-            applicant_data = result['applicant_data']
-            scoring_result = result['result']
-            
-            cursor.execute('''
-                INSERT INTO individual_applications 
-                (timestamp, pan, applicant_data, scoring_result, final_score, final_bucket, decision)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        # Save individual results from bulk in one batched statement
+        cursor.executemany('''
+            INSERT INTO individual_applications 
+            (timestamp, pan, applicant_data, scoring_result, final_score, final_bucket, decision)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (
                 timestamp,
-                applicant_data.get('pan', ''),
-                json.dumps(applicant_data),
-                json.dumps(scoring_result),
-                scoring_result.get('final_score', 0),
-                scoring_result.get('final_bucket', 'D'),
-                scoring_result.get('decision', 'Decline')
-            ))
+                result['applicant_data'].get('pan', ''),
+                json.dumps(result['applicant_data']),
+                json.dumps(_jsonable(result['result'])),
+                result['result'].get('final_score', 0),
+                result['result'].get('final_bucket', 'D'),
+                result['result'].get('decision', 'Decline')
+            )
+            for result in successful_results
+        ])
         
         conn.commit()
         conn.close()
@@ -175,6 +203,27 @@ class DatabaseManager:
             for row in rows
         ]
     
+    def get_detail_counts(self, session_ids: List[str]) -> Dict[str, int]:
+        """Get the number of stored detail records for each of the given bulk sessions"""
+        if not session_ids:
+            return {}
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        placeholders = ','.join('?' * len(session_ids))
+        # Malformed session_data counts as no records instead of failing the query
+        cursor.execute(f'''
+            SELECT session_id,
+                   CASE WHEN json_valid(session_data) THEN json_array_length(session_data) ELSE 0 END
+            FROM bulk_sessions WHERE session_id IN ({placeholders})
+        ''', list(session_ids))
+        
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return {row[0]: row[1] or 0 for row in rows}
+    
     def get_session_details(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed results for a specific bulk session"""
         conn = sqlite3.connect(self.db_path)
@@ -264,7 +264,7 @@ def process_with_ml_optimization(df: pd.DataFrame, weight_suggestion: Dict, batc
                 
                 if include_details and 'variable_scores' in result:
                     for var, details in result['variable_scores'].items():
-                        result_record[f'{var}_score'] = details.get('weighted_score', 0)
+                        result_record[f'{var}_score'] = details.weighted_score
                 
                 results.append(result_record)
                 batch_results.append({
@@ -6,6 +6,25 @@ Allows users to update key settings without going through full onboarding
 import streamlit as st
 from typing import Dict, Any
 
+# Session keys holding onboarding progress, cleared together on "Full Setup"
+_ONBOARDING_KEYS = ("onboarding_data", "user_profile", "onboarding_completed", "onboarding_step")
+
+def _reset_onboarding(keep_company=False):
+    """Clear onboarding session state in a single pass.
+
+    With ``keep_company`` an existing profile is reduced to its company name
+    instead of being dropped.
+    """
+    had_profile = 'user_profile' in st.session_state
+    company_name = st.session_state.get('user_profile', {}).get('company_name', '')
+    
+    for key in _ONBOARDING_KEYS:
+        st.session_state.pop(key, None)
+    
+    if keep_company and had_profile:
+        # Keep basic company info but clear preferences
+        st.session_state.user_profile = {'company_name': company_name} if company_name else {}
+
 def render_quick_preferences_update():
     """Render quick preferences update modal"""
     
@@ -102,28 +121,14 @@ def render_quick_preferences_update():
                     st.session_state.show_company_registration = True
                     st.session_state.preferences_update_mode = False
                     # Clear any existing onboarding data
-                    if 'onboarding_data' in st.session_state:
-                        del st.session_state.onboarding_data
-                    if 'user_profile' in st.session_state:
-                        del st.session_state.user_profile
-                    if 'onboarding_completed' in st.session_state:
-                        del st.session_state.onboarding_completed
-                    if 'onboarding_step' in st.session_state:
-                        del st.session_state.onboarding_step
+                    _reset_onboarding()
                 else:
                     # Go to full onboarding for existing companies
+                    # Clear all onboarding data to start fresh
+                    _reset_onboarding(keep_company=True)
                     st.session_state.onboarding_completed = False
                     st.session_state.preferences_update_mode = False
                     st.session_state.force_onboarding = True
-                    # Clear all onboarding data to start fresh
-                    if 'onboarding_step' in st.session_state:
-                        del st.session_state.onboarding_step
-                    if 'onboarding_data' in st.session_state:
-                        del st.session_state.onboarding_data
-                    if 'user_profile' in st.session_state:
-                        # Keep basic company info but clear preferences
-                        company_name = st.session_state.user_profile.get('company_name', '')
-                        st.session_state.user_profile = {'company_name': company_name} if company_name else {}
                 st.rerun()
         
         with col3:
@@ -152,6 +157,17 @@ def render_quick_preferences_update():
             st.metric("Products", f"{len(products)} selected" if products else "Not set")
             st.metric("Primary Product", user_profile.get('primary_product', 'Not set'))
 
+@st.cache_data(max_entries=16)
+def _profile_card_md(company: str, institution: str, approach: str, risk: str) -> str:
+    """Build the compact sidebar profile card markdown"""
+    return f"""
+            **{company}**
+            {institution}
+            
+            Approach: {approach.title()}
+            Risk: {risk}
+            """
+
 def render_preferences_button():
     """Render the preferences update button in sidebar"""
     user_profile = st.session_state.get('user_profile', {})
@@ -161,13 +177,12 @@ def render_preferences_button():
         
         # Show compact profile info
         with st.sidebar.container():
-            st.info(f"""
-            **{user_profile.get('company_name', 'Your Company')}**
-            {user_profile.get('institution_type', 'Institution')}
-            
-            Approach: {user_profile.get('selected_approach', 'hybrid').title()}
-            Risk: {user_profile.get('risk_appetite', 'Moderate')}
-            """)
+            st.info(_profile_card_md(
+                user_profile.get('company_name', 'Your Company'),
+                user_profile.get('institution_type', 'Institution'),
+                user_profile.get('selected_approach', 'hybrid'),
+                user_profile.get('risk_appetite', 'Moderate')
+            ))
         
         if st.sidebar.button("⚙️ Update", use_container_width=True, help="Quick settings update"):
             st.session_state.preferences_update_mode = True
@@ -1,72 +1,502 @@
+from bisect import bisect_right as _bisect_right
+import json
+import math
+import os
+from collections import namedtuple
+from operator import attrgetter, eq, ge, gt, itemgetter, le, lt, mul
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, NamedTuple, Tuple
 from scoring_config import ScoringWeightsConfig
 # Removed hardcoded additional data scoring - now using dynamic weight system
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _above(threshold: float) -> float:
+    """Smallest float strictly greater than threshold, for 'value > threshold' band edges"""
+    return math.nextafter(threshold, math.inf)
+
+# Numeric band tables as (edges, values). Edges are left-closed: a value scores
+# values[i] where i is the number of edges <= value, so len(values) == len(edges) + 1.
+_CREDIT_SCORE_BANDS = ((-1, 1, 100, 600, 650, 700, 730, 750), (0.0, 0.01, 0.2, 0.0, 0.3, 0.6, 0.8, 0.9, 1.0))
+_FOIR_BANDS = ((_above(0.35), _above(0.45), _above(0.55)), (1.0, 0.6, 0.3, 0.0))
+_DPD_BANDS = ((0, 1, 2), (0.0, 1.0, 0.5, 0.0))
+_ENQUIRY_BANDS = ((0, 2, 4), (0.2, 1.0, 0.6, 0.2))
+_INCOME_BANDS = ((15000, 18000, 20000, _above(30000)), (0.0, 0.3, 0.4, 0.6, 1.0))
+_AGE_BANDS = ((21, 26, 36, 46, 56, 61), (0.0, 0.6, 1.0, 0.8, 0.6, 0.4, 0.0))
+_CREDIT_VINTAGE_BANDS = ((7, 13, 25, 37, _above(60)), (0.0, 0.2, 0.4, 0.6, 0.8, 1.0))
+_COMPLETION_RATIO_BANDS = ((0.4, _above(0.7)), (0.3, 0.6, 1.0))
+_DEFAULTED_LOANS_BANDS = ((0, 1), (0.0, 1.0, 0.0))
+_UNSECURED_AMOUNT_BANDS = ((0, _above(0), 50000, _above(100000)), (0.8, 0.6, 0.8, 1.0, 0.6))
+_OUTSTANDING_PERCENT_BANDS = ((0.3, _above(0.6)), (1.0, 0.6, 0.3))
+_EXPOSURE_BANDS = ((_above(0),), (0.0, 1.0))
+# Month-vintage ladder shared by account and mobile vintage; employment tenure
+# extends it with a 0.0 step below 6 months
+_VINTAGE_BANDS = ((12, 24, 36, 60), (0.2, 0.4, 0.6, 0.8, 1.0))
+_EMPLOYMENT_TENURE_BANDS = ((6,) + _VINTAGE_BANDS[0], (0.0,) + _VINTAGE_BANDS[1])
+_AVG_MONTHLY_BALANCE_BANDS = ((5000, 10000, 25000, 50000, 100000), (0.0, 0.2, 0.4, 0.6, 0.8, 1.0))
+_BOUNCE_FREQUENCY_BANDS = ((0, _above(0), _above(2), _above(5), _above(10)), (0.7, 1.0, 0.7, 0.4, 0.2, 0.0))
+_DIGITAL_ENGAGEMENT_BANDS = ((20, 40, 60, 80), (0.2, 0.4, 0.6, 0.8, 1.0))
+
+def _band(value: float, edges: Tuple[float, ...], values: Tuple[float, ...]) -> float:
+    """Look up the band value for a scalar against an (edges, values) table"""
+    return values[_bisect_right(edges, value)]
+
+_NUMERIC_BANDS = {
+    'credit_score': _CREDIT_SCORE_BANDS,
+    'foir': _FOIR_BANDS,
+    'dpd30plus': _DPD_BANDS,
+    'enquiry_count': _ENQUIRY_BANDS,
+    'monthly_income': _INCOME_BANDS,
+    'age': _AGE_BANDS,
+    'credit_vintage': _CREDIT_VINTAGE_BANDS,
+    'loan_completion_ratio': _COMPLETION_RATIO_BANDS,
+    'defaulted_loans': _DEFAULTED_LOANS_BANDS,
+    'unsecured_loan_amount': _UNSECURED_AMOUNT_BANDS,
+    'outstanding_amount_percent': _OUTSTANDING_PERCENT_BANDS,
+    'our_lender_exposure': _EXPOSURE_BANDS,
+    'employment_tenure': _EMPLOYMENT_TENURE_BANDS,
+    'account_vintage': _VINTAGE_BANDS,
+    'avg_monthly_balance': _AVG_MONTHLY_BALANCE_BANDS,
+    'bounce_frequency': _BOUNCE_FREQUENCY_BANDS,
+    'mobile_number_vintage': _VINTAGE_BANDS,
+    'digital_engagement': _DIGITAL_ENGAGEMENT_BANDS
+}
+
+def _category_codes(*labels: str) -> MappingProxyType:
+    """Number a categorical vocabulary in order"""
+    return MappingProxyType({label: code for code, label in enumerate(labels)})
+
+# Categorical band tables: label -> small integer code, and values indexed by
+# code. The last value is the default for labels outside the vocabulary.
+_LOAN_MIX_CATEGORIES = (
+    _category_codes("PL/HL/CC", "Gold + Consumer Durable", "Only Gold", "Agri/Other loans"),
+    (1.0, 0.6, 0.3, 0.4, 0.0)
+)
+_CHANNEL_CATEGORIES = (_category_codes("Merchant/Referral"), (1.0, 0.5))
+_JOB_TYPE_CATEGORIES = (
+    _category_codes("Government/PSU", "Private Company (MNC)", "Private Company (Local)",
+                    "Self Employed Professional", "Business Owner", "Freelancer/Contract"),
+    (1.0, 0.9, 0.7, 0.6, 0.5, 0.3, 0.2)
+)
+_COMPANY_STABILITY_CATEGORIES = (
+    _category_codes("Fortune 500", "Large Enterprise", "Mid-size Company", "Small Company", "Startup", "Unknown"),
+    (1.0, 0.9, 0.7, 0.5, 0.3, 0.1, 0.1)
+)
+_GEOGRAPHIC_RISK_CATEGORIES = (
+    _category_codes("Metro Tier 1", "Metro Tier 2", "Urban", "Semi-Urban", "Rural", "Remote"),
+    (1.0, 0.8, 0.7, 0.5, 0.3, 0.1, 0.5)
+)
+
+def _category_band(label: str, codes: MappingProxyType, values: Tuple[float, ...]) -> float:
+    """Look up the band value for a label, falling back to the default last entry"""
+    return values[codes.get(label, -1)]
+
+_CATEGORICAL_BANDS = {
+    'loan_mix_type': _LOAN_MIX_CATEGORIES,
+    'channel_type': _CHANNEL_CATEGORIES,
+    'job_type': _JOB_TYPE_CATEGORIES,
+    'company_stability': _COMPANY_STABILITY_CATEGORIES,
+    'geographic_risk': _GEOGRAPHIC_RISK_CATEGORIES
+}
+
+def _code_to_band(categories: pd.Index, codes: MappingProxyType, values: Tuple[float, ...]) -> np.ndarray:
+    """Band value per category code, with the default appended so code -1 (missing) maps to it"""
+    return np.array([_category_band(label, codes, values) for label in categories] + [values[-1]])
+
+# _NUMERIC_BANDS packed into rectangular arrays for the bulk kernel. Edge rows are
+# padded with +inf (never <= a finite value) and value rows with their last band.
+_PACKED_EDGES = np.full((len(_NUMERIC_BANDS), max(len(edges) for edges, _ in _NUMERIC_BANDS.values())), np.inf)
+_PACKED_VALUES = np.empty((len(_NUMERIC_BANDS), _PACKED_EDGES.shape[1] + 1))
+for _row, (_edges, _values) in enumerate(_NUMERIC_BANDS.values()):
+    _PACKED_EDGES[_row, :len(_edges)] = _edges
+    _PACKED_VALUES[_row, :len(_values)] = _values
+    _PACKED_VALUES[_row, len(_values):] = _values[-1]
+
+def _band_matrix_numpy(features: np.ndarray, edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Band an (N, K) feature matrix column by column with np.searchsorted"""
+    out = np.empty(features.shape)
+    for j in range(features.shape[1]):
+        out[:, j] = values[j][np.searchsorted(edges[j], features[:, j], side='right')]
+    return out
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _band_matrix(features, edges, values):
+        """Band an (N, K) feature matrix row-parallel in compiled code"""
+        n, k = features.shape
+        n_edges = edges.shape[1]
+        out = np.empty((n, k))
+        for i in prange(n):
+            for j in range(k):
+                x = features[i, j]
+                pos = 0
+                while pos < n_edges and edges[j, pos] <= x:
+                    pos += 1
+                out[i, j] = values[j, pos]
+        return out
+else:
+    _band_matrix = _band_matrix_numpy
+
+# Narrow dtypes for integer count columns in prepare_batch. Fractional and
+# currency fields stay float64: float32 would move values such as FOIR 0.35
+# across their band edges.
+_BATCH_INT_DTYPES = {
+    'credit_score': np.int16,
+    'age': np.int8,
+    'dpd30plus': np.int8,
+    'enquiry_count': np.int8,
+    'defaulted_loans': np.int8
+}
+
+def _column_or_default(df: pd.DataFrame, key: str, default: Any) -> pd.Series:
+    """Column of df with missing values (or a missing column) filled by default"""
+    return df[key].fillna(default) if key in df else pd.Series(default, index=df.index)
+
+class VarScore(NamedTuple):
+    """Per-variable breakdown row in a scoring result's variable_scores"""
+    value: Any
+    band_score: float
+    weight: float
+    weighted_score: float
+
+class Movement(NamedTuple):
+    """Post-score bucket movement recorded in a scoring result's bucket_movements"""
+    from_bucket: str
+    to_bucket: str
+    reason: str
+
+# Message templates for clearance rule failure codes
+_RULE_TEMPLATES = {
+    'PAN_MISSING': "PAN is missing",
+    'AGE_OUT_OF_RANGE': "Age ({}) is outside allowed range (21-60)",
+    'INCOME_BELOW_MINIMUM': "Monthly Income (₹{:,}) is below minimum (₹15,000)",
+    'WRITEOFF_FLAG': "Write-off flag is true",
+    'DPD_ABOVE_MAXIMUM': "DPD30Plus ({}) exceeds maximum allowed (2)",
+    'HAS_DEFAULTED_LOANS': "Has defaulted loans ({})"
+}
+
+def render_failures(failed_rules: List[Tuple]) -> List[str]:
+    """Format (code, *args) clearance failures into display messages"""
+    return [_RULE_TEMPLATES[code].format(*args) for code, *args in failed_rules]
+
+# Last parsed scoring_weights.json, keyed by (absolute path, mtime)
+_WEIGHTS_CACHE = {'key': None, 'data': None}
+
+# Per-company helper instances, created on first use. Both helper classes only
+# hold the company id and DB path, so sharing them across engines is safe.
+_CLEAN_SYSTEM_CACHE: Dict[int, Any] = {}
+_WEIGHTS_CONFIG_CACHE: Dict[int, Any] = {}
+
+def _get_clean_system(company_id: int):
+    """Return the shared CleanDynamicSystem for company_id, importing it on first use"""
+    clean_system = _CLEAN_SYSTEM_CACHE.get(company_id)
+    if clean_system is None:
+        from clean_dynamic_system import CleanDynamicSystem
+        clean_system = _CLEAN_SYSTEM_CACHE[company_id] = CleanDynamicSystem(company_id)
+    return clean_system
+
+def _get_weights_config(company_id: int):
+    """Return the shared DynamicWeightsConfig for company_id, importing it on first use"""
+    weights_config = _WEIGHTS_CONFIG_CACHE.get(company_id)
+    if weights_config is None:
+        from dynamic_weights_config import DynamicWeightsConfig
+        weights_config = _WEIGHTS_CONFIG_CACHE[company_id] = DynamicWeightsConfig(company_id)
+    return weights_config
+
+# Initial risk buckets, aligned with default probability analysis:
+#   A >= 80  <3% default probability  - Auto-approve: minimal risk, strong financials
+#   B >= 65  3-8% default probability  - Recommend: low risk, good payment history
+#   C >= 50  8-15% default probability - Refer: moderate risk, requires review
+#   D <  50  >15% default probability  - Decline: high risk, poor creditworthiness
+_BUCKET_BINS = (50, 65, 80)
+_BUCKET_VALS = ('D', 'C', 'B', 'A')
+_BUCKET_LABELS = np.array(_BUCKET_VALS)
+
+# Lending decision per final bucket; unknown buckets are declined
+_DECISIONS = MappingProxyType({
+    'A': 'Auto-approve',
+    'B': 'Recommend',
+    'C': 'Refer',
+    'D': 'Decline'
+})
+_DECISION_LABELS = np.array([_DECISIONS[bucket] for bucket in _BUCKET_VALS])
+
+# Post-score movement factors as (field, comparison, threshold, reason) over
+# normalized fields
+_A_TO_B_RULES = (
+    ('dpd30plus', '>', 0, "DPD > 0"),
+    ('enquiry_count', '>', 3, "Enquiry > 3"),
+    ('foir', '>', 0.45, "FOIR > 0.45"),
+    ('loan_mix_type', '==', "Only Gold", "LoanMix = Gold only"),
+    ('loan_completion_ratio', '<', 0.5, "CompletionRatio < 0.5")
+)
+_B_TO_A_RULES = (
+    ('credit_score', '>=', 770, "CreditScore ≥ 770"),
+    ('dpd30plus', '==', 0, "DPD = 0"),
+    ('foir', '<', 0.35, "FOIR < 0.35"),
+    ('loan_mix_type', '==', "PL/HL/CC", "PL/HL in LoanMix"),
+    ('our_lender_exposure', '>', 0, "OurLenderExposure > 0")
+)
+_C_TO_B_RULES = (
+    ('credit_score', '>=', 730, "CreditScore ≥ 730"),
+    ('credit_vintage', '>=', 36, "CreditVintage ≥ 36"),
+    ('loan_completion_ratio', '>', 0.6, "CompletionRatio > 0.6")
+)
+_D_TO_C_RULES = (
+    ('credit_score', '>=', 750, "CreditScore ≥ 750"),
+    ('foir', '<', 0.35, "FOIR < 0.35"),
+    ('dpd30plus', '==', 0, "DPD = 0"),
+    ('enquiry_count', '<=', 2, "Enquiry ≤ 2"),
+    ('monthly_income', '>=', 30000, "Income ≥ ₹30K")
+)
+
+# Comparison symbols used in the rule tables, for evaluating rules over arrays
+_COMPARISONS = MappingProxyType({'>': gt, '>=': ge, '<': lt, '<=': le, '==': eq})
+
+def _compile_factor_rules(name: str, rules: Tuple[Tuple[str, str, Any, str], ...]):
+    """Generate a straight-line factor function for one rule set
+    
+    Returns the fields the rules read, and a function taking those values
+    positionally and returning a bitmask with bit i set when rule i holds.
+    The comparisons are inlined and OR-ed together without branches.
+    """
+    fields = tuple(dict.fromkeys(field for field, _, _, _ in rules))
+    hits = " | ".join(
+        f"(({field} {comparison} {threshold!r}) << {bit})"
+        for bit, (field, comparison, threshold, _) in enumerate(rules)
+    )
+    namespace = {}
+    exec(f"def {name}({', '.join(fields)}):\n    return int({hits})\n", namespace)
+    return fields, namespace[name]
+
+class _Transition(NamedTuple):
+    """Movement out of one initial bucket
+    
+    Taken when the score lies in [low, high) and at least `required` of the
+    factor rules hold. reason_by_mask[m] is the finished movement reason for
+    factor bitmask m (None when m has too few factors to move), so a mask
+    decodes with one index and no string building.
+    """
+    target: str
+    low: float
+    high: float
+    rules: Tuple[Tuple[str, str, Any, str], ...]
+    fields: Tuple[str, ...]
+    factor_mask: Any
+    required: int
+    prefix: str
+    reason_by_mask: Tuple[Any, ...]
+
+def _transition(name: str, target: str, low: float, high: float,
+                rules: Tuple[Tuple[str, str, Any, str], ...], required: int, prefix: str) -> _Transition:
+    reason_by_mask = []
+    for mask in range(1 << len(rules)):
+        reasons = [rule[3] for bit, rule in enumerate(rules) if mask >> bit & 1]
+        reason_by_mask.append(f"{prefix}: {', '.join(reasons[:required])}" if len(reasons) >= required else None)
+    return _Transition(target, low, high, rules, *_compile_factor_rules(name, rules), required, prefix,
+                       tuple(reason_by_mask))
+
+# Bucket-movement state machine: initial bucket -> its single outgoing transition
+_MOVEMENTS = {
+    'A': _transition('_a_to_b_mask', 'B', 80, math.inf, _A_TO_B_RULES, 2, "2+ negative factors"),
+    'B': _transition('_b_to_a_mask', 'A', 65, 80, _B_TO_A_RULES, 4, "4+ positive factors"),
+    'C': _transition('_c_to_b_mask', 'B', 50, 65, _C_TO_B_RULES, len(_C_TO_B_RULES), "All conditions met"),
+    'D': _transition('_d_to_c_mask', 'C', -math.inf, 50, _D_TO_C_RULES, 3, "3+ positive factors")
+}
+
+def _compile_evaluator(bucket: str, transition: _Transition):
+    """Generate the movement evaluator for applicants starting in one bucket
+    
+    The score window, field reads, required count and target are inlined;
+    infinite window bounds are dropped rather than compared.
+    """
+    window = []
+    if transition.low > -math.inf:
+        window.append(f"score >= {transition.low!r}")
+    if transition.high < math.inf:
+        window.append(f"score < {transition.high!r}")
+    stay = f"return [], {bucket!r}"
+    lines = [f"def move_from_{bucket}(d, score):"]
+    if window:
+        lines += [f"    if not ({' and '.join(window)}):", f"        {stay}"]
+    lines += [
+        f"    mask = factor_mask({', '.join(f'd.{field}' for field in transition.fields)})",
+        f"    if mask.bit_count() < {transition.required}:",
+        f"        {stay}",
+        f"    return [Movement({bucket!r}, {transition.target!r}, reason_by_mask[mask])], {transition.target!r}"
+    ]
+    namespace = {
+        'Movement': Movement,
+        'factor_mask': transition.factor_mask,
+        'reason_by_mask': transition.reason_by_mask
+    }
+    exec("\n".join(lines), namespace)
+    return namespace[f"move_from_{bucket}"]
+
+# Specialized evaluator per initial bucket, dispatched with one lookup
+_EVALUATORS = MappingProxyType({bucket: _compile_evaluator(bucket, transition) for bucket, transition in _MOVEMENTS.items()})
+
+# _MOVEMENTS packed by bucket code (index into _BUCKET_VALS) for the batch kernel.
+# Every bucket's rules are concatenated in bucket-code order; bucket c owns hit
+# columns [_MOVEMENT_STARTS[c], _MOVEMENT_STOPS[c]). Rules shared between
+# transitions (e.g. DPD = 0, FOIR < 0.35) are evaluated once: _MOVEMENT_CHECKS
+# holds each distinct (field reader, comparison, threshold) and
+# _MOVEMENT_COLUMNS maps every concatenated rule to its check.
+_TRANSITIONS_BY_CODE = [_MOVEMENTS[bucket] for bucket in _BUCKET_VALS]
+
+# Factor count per transition as one DataFrame.eval expression (numexpr when installed)
+_FACTOR_EXPRESSIONS = tuple(
+    ' + '.join(f"({field} {symbol} {threshold!r}) * 1" for field, symbol, threshold, _ in transition.rules)
+    for transition in _TRANSITIONS_BY_CODE
+)
+_check_columns = {}
+_MOVEMENT_COLUMNS = np.array([
+    _check_columns.setdefault(rule[:3], len(_check_columns))
+    for transition in _TRANSITIONS_BY_CODE for rule in transition.rules
+])
+_MOVEMENT_CHECKS = tuple(
+    (attrgetter(field), _COMPARISONS[comparison], threshold)
+    for field, comparison, threshold in _check_columns
+)
+_MOVEMENT_STOPS = np.cumsum([len(transition.rules) for transition in _TRANSITIONS_BY_CODE])
+_MOVEMENT_STARTS = _MOVEMENT_STOPS - [len(transition.rules) for transition in _TRANSITIONS_BY_CODE]
+# Bit c of a row's check mask is set when distinct check c holds; bucket c's
+# transition counts the bits in _MOVEMENT_CHECK_BITS[c]
+_MOVEMENT_CHECK_BITS = np.array([
+    np.bitwise_or.reduce(1 << _MOVEMENT_COLUMNS[start:stop]) for start, stop in zip(_MOVEMENT_STARTS, _MOVEMENT_STOPS)
+], dtype=np.int64)
+_MOVEMENT_ARRAYS = (
+    _MOVEMENT_CHECK_BITS,
+    np.array([transition.required for transition in _TRANSITIONS_BY_CODE]),
+    np.array([transition.low for transition in _TRANSITIONS_BY_CODE], dtype=np.float64),
+    np.array([transition.high for transition in _TRANSITIONS_BY_CODE], dtype=np.float64),
+    np.array([_BUCKET_VALS.index(transition.target) for transition in _TRANSITIONS_BY_CODE])
+)
+
+def _resolve_movements_numpy(bucket_codes: np.ndarray, scores: np.ndarray, check_masks: np.ndarray,
+                             check_bits: np.ndarray, required: np.ndarray,
+                             lows: np.ndarray, highs: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Final bucket codes given each row's initial code, score and packed check mask"""
+    counts = np.bitwise_count(check_masks & check_bits[bucket_codes])
+    moved = (lows[bucket_codes] <= scores) & (scores < highs[bucket_codes]) & (counts >= required[bucket_codes])
+    return np.where(moved, targets[bucket_codes], bucket_codes)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _resolve_movements(bucket_codes, scores, check_masks, check_bits, required, lows, highs, targets):
+        """Resolve each row's bucket movement row-parallel in compiled code"""
+        out = bucket_codes.copy()
+        for i in prange(len(bucket_codes)):
+            code = bucket_codes[i]
+            if lows[code] <= scores[i] < highs[code]:
+                hits = check_masks[i] & check_bits[code]
+                count = 0
+                while hits:
+                    hits &= hits - 1
+                    count += 1
+                if count >= required[code]:
+                    out[i] = targets[code]
+        return out
+else:
+    _resolve_movements = _resolve_movements_numpy
+
 class LoanScoringEngine:
     """Main scoring engine for loan applications with dynamic additional data sources"""
     
+    # AI-optimized weights from scientific analysis - normalized to exactly 100%
+    _DEFAULT_WEIGHTS = MappingProxyType({
+        # Core Credit Variables - Total: 32.8%
+        "credit_score": 0.107767,          # 10.8%
+        "foir": 0.065049,                  # 6.5%
+        "dpd30plus": 0.065049,             # 6.5%
+        "enquiry_count": 0.056311,         # 5.6%
+        "monthly_income": 0.065049,        # 6.5%
+        
+        # Behavioral Analytics - Total: 14.6%
+        "credit_vintage": 0.033010,        # 3.3%
+        "loan_mix_type": 0.021359,         # 2.1%
+        "loan_completion_ratio": 0.025243, # 2.5%
+        "defaulted_loans": 0.065049,       # 6.5%
+        
+        # Employment Stability - Total: 7.8%
+        "job_type": 0.021359,              # 2.1%
+        "employment_tenure": 0.043689,     # 4.4%
+        "company_stability": 0.012621,     # 1.3%
+        
+        # Banking Behavior - Total: 13.0%
+        "account_vintage": 0.029126,       # 2.9%
+        "avg_monthly_balance": 0.058252,   # 5.8%
+        "bounce_frequency": 0.042718,      # 4.3%
+        
+        # Geographic & Social - Total: 8.1%
+        "geographic_risk": 0.012621,       # 1.3%
+        "mobile_number_vintage": 0.033981, # 3.4%
+        "digital_engagement": 0.033981,    # 3.4%
+        
+        # Exposure & Intent - Total: 20.8%
+        "unsecured_loan_amount": 0.065049, # 6.5%
+        "outstanding_amount_percent": 0.065049, # 6.5%
+        "our_lender_exposure": 0.065049,   # 6.5%
+        "channel_type": 0.012621           # 1.3%
+            })
+    
     def __init__(self, company_id: int = None):
         self.company_id = company_id
+        self._clean_system = None
         
-        # Load weights from configuration file
-        self.variable_weights = self.load_weights_from_file()
-        
-        # Apply dynamic weights configuration for additional data sources
         if self.company_id:
-            from dynamic_weights_config import DynamicWeightsConfig
-            weights_config = DynamicWeightsConfig(self.company_id)
-            
-            # Get all weights including additional data sources
-            all_weights = weights_config.get_all_weights_for_scoring()
-            
-            # Update variable weights with configured additional weights
-            self.variable_weights = all_weights
+            # Company weights already merge the core file weights with the
+            # configured additional data sources
+            self._clean_system = _get_clean_system(self.company_id)
+            self.variable_weights = _get_weights_config(self.company_id).get_all_weights_for_scoring()
+        else:
+            # Load weights from configuration file
+            self.variable_weights = self.load_weights_from_file()
+    
+    @property
+    def variable_weights(self) -> Dict[str, float]:
+        """Scoring weights by variable; assign a new dict to change them"""
+        return self._variable_weights
+    
+    @variable_weights.setter
+    def variable_weights(self, weights: Dict[str, float]):
+        self._variable_weights = weights
+        self._core_variables = frozenset(weights)
+        # A missing core weight is raised when an application is scored, as
+        # indexing it there did, so the engine itself still constructs
+        self._missing_weight = next((key for key in self._CORE_WEIGHT_KEYS if key not in weights), None)
+        # Weights aligned with _VAR_SPECS: raw values for the breakdown rows,
+        # a float vector for the weighted-sum step
+        self._weight_row = tuple(weights.get(key, 0) for key in self._VAR_KEYS)
+        self._weight_vec = np.array(self._weight_row, dtype=np.float64)
     
     def load_weights_from_file(self):
-        """Load weights from configuration file or return defaults"""
+        """Load weights from configuration file or return defaults
+        
+        The parsed file is memoized on its path and modification time, so
+        repeated engine construction only re-reads it after it changes.
+        """
         try:
-            import json
-            with open("scoring_weights.json", "r") as f:
-                return json.load(f)
-        except:
-            # AI-optimized weights from scientific analysis - normalized to exactly 100%
-            return {
-                # Core Credit Variables - Total: 32.8%
-                "credit_score": 0.107767,          # 10.8%
-                "foir": 0.065049,                  # 6.5%
-                "dpd30plus": 0.065049,             # 6.5%
-                "enquiry_count": 0.056311,         # 5.6%
-                "monthly_income": 0.065049,        # 6.5%
-                
-                # Behavioral Analytics - Total: 14.6%
-                "credit_vintage": 0.033010,        # 3.3%
-                "loan_mix_type": 0.021359,         # 2.1%
-                "loan_completion_ratio": 0.025243, # 2.5%
-                "defaulted_loans": 0.065049,       # 6.5%
-                
-                # Employment Stability - Total: 7.8%
-                "job_type": 0.021359,              # 2.1%
-                "employment_tenure": 0.043689,     # 4.4%
-                "company_stability": 0.012621,     # 1.3%
-                
-                # Banking Behavior - Total: 13.0%
-                "account_vintage": 0.029126,       # 2.9%
-                "avg_monthly_balance": 0.058252,   # 5.8%
-                "bounce_frequency": 0.042718,      # 4.3%
-                
-                # Geographic & Social - Total: 8.1%
-                "geographic_risk": 0.012621,       # 1.3%
-                "mobile_number_vintage": 0.033981, # 3.4%
-                "digital_engagement": 0.033981,    # 3.4%
-                
-                # Exposure & Intent - Total: 20.8%
-                "unsecured_loan_amount": 0.065049, # 6.5%
-                "outstanding_amount_percent": 0.065049, # 6.5%
-                "our_lender_exposure": 0.065049,   # 6.5%
-                "channel_type": 0.012621           # 1.3%
-            }
+            path = os.path.abspath("scoring_weights.json")
+            cache_key = (path, os.stat(path).st_mtime_ns)
+            if _WEIGHTS_CACHE['key'] != cache_key:
+                with open(path, "r") as f:
+                    _WEIGHTS_CACHE['data'] = json.load(f)
+                _WEIGHTS_CACHE['key'] = cache_key
+            # Weights are a flat mapping of floats, so a shallow copy isolates callers
+            return dict(_WEIGHTS_CACHE['data'])
+        except FileNotFoundError:
+            return dict(self._DEFAULT_WEIGHTS)
+        except (json.JSONDecodeError, OSError) as e:
+            # An unreadable or malformed file falls back to the defaults rather than failing the app
+            print(f"Error loading scoring_weights.json, using default weights: {e}")
+            return dict(self._DEFAULT_WEIGHTS)
     
     def reload_weights(self):
         """Reload weights from configuration file"""
@@ -75,13 +505,15 @@ class LoanScoringEngine:
     def score_application(self, applicant_data: Dict[str, Any]) -> Dict[str, Any]:
         """Score a single loan application"""
         
+        fields = self._normalize(applicant_data)
+        
         # Check clearance rules first
-        clearance_result = self._check_clearance_rules(applicant_data)
+        clearance_result = self._check_clearance_rules(fields)
         
         if not clearance_result['passed']:
             return {
                 'clearance_passed': False,
-                'failed_clearance_rules': clearance_result['failed_rules'],
+                'failed_clearance_rules': render_failures(clearance_result['failed_rules']),
                 'final_score': 0,
                 'initial_bucket': 'D',
                 'final_bucket': 'D',
@@ -92,27 +524,13 @@ class LoanScoringEngine:
             }
         
         # Calculate variable scores
-        variable_scores = self._calculate_variable_scores(applicant_data)
+        variable_scores, band_scores = self._calculate_variable_scores(fields)
         
         # Calculate base score (multiply by 100 to get percentage)
-        base_score = sum(score['weighted_score'] for score in variable_scores.values()) * 100
+        base_score = float(band_scores @ self._weight_vec) * 100
         
         # Calculate additional data source score using clean dynamic weight system
-        additional_breakdown = {}
-        additional_score = 0
-        if self.company_id:
-            from clean_dynamic_system import CleanDynamicSystem
-            clean_system = CleanDynamicSystem(self.company_id)
-            
-            # Get additional data from form (filter out core variables)
-            core_variables = set(self.variable_weights.keys())
-            additional_data = {k: v for k, v in applicant_data.items() 
-                             if k not in core_variables and v is not None}
-            
-            # Calculate additional score using clean system
-            additional_result = clean_system.calculate_additional_score(additional_data)
-            additional_score = additional_result['additional_score']
-            additional_breakdown = additional_result
+        additional_score, additional_breakdown = self._calculate_additional_score(applicant_data)
         
         # Combine base and additional scores
         final_score = base_score + additional_score
@@ -123,7 +541,7 @@ class LoanScoringEngine:
         
         # Apply post-score movement logic
         bucket_movements, final_bucket = self._apply_post_score_movements(
-            initial_bucket, final_score, applicant_data
+            initial_bucket, final_score, fields
         )
         
         # Get final decision
@@ -142,703 +560,442 @@ class LoanScoringEngine:
             'additional_score_breakdown': additional_breakdown
         }
     
-    def _check_clearance_rules(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Check pre-score clearance rules"""
+    def prepare_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert categorical columns to pandas categoricals ahead of batch scoring
+        
+        score_applications_batch takes raw frames as well; preparing a frame once
+        lets repeated scoring reuse its interned categories and codes. Integer
+        count columns are also downcast when every value fits the narrower type.
+        """
+        dtypes = {key: 'category' for key in _CATEGORICAL_BANDS if key in df}
+        for key, dtype in _BATCH_INT_DTYPES.items():
+            if key in df and pd.api.types.is_integer_dtype(df[key]):
+                limits = np.iinfo(dtype)
+                if df[key].between(limits.min, limits.max).all():
+                    dtypes[key] = dtype
+        return df.astype(dtypes)
+    
+    def score_applications_batch(self, df: pd.DataFrame, explain: bool = False) -> pd.DataFrame:
+        """Score a frame of applications in one vectorized pass
+        
+        Columns use the same field names as score_application's applicant_data.
+        Returns a frame aligned with df.index holding the decision fields plus a
+        '<variable>_score' weighted-score column per variable (NaN for rows that
+        fail clearance). Rows failing clearance are masked out before any band
+        math; with explain=True a 'failed_clearance_rules' column lists why.
+        """
+        n = len(df)
+        passed = self._clearance_mask(df)
+        scored_rows = np.flatnonzero(passed)
+        scored = df[passed]
+        if len(scored):
+            self._require_core_weights()
+        
+        band_matrix = self._band_matrix_batch(scored)
+        base_scores = band_matrix @ self._weight_vec * 100
+        additional_scores, breakdowns = self._additional_scores_batch(scored)
+        additional_breakdowns = [{} for _ in range(n)]
+        for i, row in enumerate(scored_rows):
+            additional_breakdowns[row] = breakdowns[i]
+        
+        scores = np.clip(base_scores + additional_scores, 0, 100)
+        bucket_codes = np.searchsorted(_BUCKET_BINS, scores, side='right')
+        buckets = _BUCKET_LABELS[bucket_codes]
+        
+        # Rows failing clearance are declined outright with no variable scores
+        final_scores = np.zeros(n)
+        final_scores[passed] = scores
+        all_base_scores = np.full(n, np.nan)
+        all_base_scores[passed] = base_scores
+        initial_buckets = np.full(n, 'D')
+        initial_buckets[passed] = buckets
+        bucket_movements = [[] for _ in range(n)]
+        movements, final_codes = self._apply_post_score_movements_batch(
+            bucket_codes, scores, self._normalize_batch(scored)
+        )
+        all_final_codes = np.zeros(n, dtype=np.int64)
+        all_final_codes[passed] = final_codes
+        for i, row in enumerate(scored_rows):
+            bucket_movements[row] = movements[i]
+        
+        results = pd.DataFrame({
+            'clearance_passed': passed,
+            'final_score': final_scores,
+            'base_score': all_base_scores,
+            'initial_bucket': initial_buckets,
+            'final_bucket': _BUCKET_LABELS[all_final_codes],
+            'decision': _DECISION_LABELS[all_final_codes],
+            'bucket_movements': bucket_movements,
+            'additional_score_breakdown': additional_breakdowns
+        }, index=df.index)
+        
+        if explain:
+            failed_rules = [[] for _ in range(n)]
+            for row, record in zip(np.flatnonzero(~passed), df[~passed].to_dict('records')):
+                failed_rules[row] = render_failures(self._check_clearance_rules(self._normalize(record))['failed_rules'])
+            results['failed_clearance_rules'] = failed_rules
+        
+        weighted_scores = np.full((n, len(self._VAR_SPECS)), np.nan)
+        weighted_scores[passed] = band_matrix * self._weight_vec
+        for j, (key, _, _) in enumerate(self._VAR_SPECS):
+            results[f'{key}_score'] = weighted_scores[:, j]
+        
+        return results
+    
+    def score_portfolio(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Score a portfolio down to final buckets and decisions
+        
+        A lean score_applications_batch for bulk runs: no movement reasons or
+        per-variable breakdowns. Each bucket's factor count is a single
+        DataFrame.eval expression and the transitions are one np.select.
+        """
+        n = len(df)
+        passed = self._clearance_mask(df)
+        scored = df[passed]
+        if len(scored):
+            self._require_core_weights()
+        
+        base_scores = self._band_matrix_batch(scored) @ self._weight_vec * 100
+        scores = np.clip(base_scores + self._additional_scores_batch(scored)[0], 0, 100)
+        bucket_codes = np.searchsorted(_BUCKET_BINS, scores, side='right')
+        
+        fields = pd.DataFrame(self._normalize_batch(scored)._asdict())
+        conditions = [
+            (bucket_codes == code)
+            & (scores >= transition.low) & (scores < transition.high)
+            & (fields.eval(expression).to_numpy() >= transition.required)
+            for code, (transition, expression) in enumerate(zip(_TRANSITIONS_BY_CODE, _FACTOR_EXPRESSIONS))
+        ]
+        targets = [_BUCKET_VALS.index(transition.target) for transition in _TRANSITIONS_BY_CODE]
+        
+        final_scores = np.zeros(n)
+        final_scores[passed] = scores
+        initial_codes = np.zeros(n, dtype=np.int64)
+        initial_codes[passed] = bucket_codes
+        final_codes = np.zeros(n, dtype=np.int64)
+        final_codes[passed] = np.select(conditions, targets, bucket_codes)
+        
+        return pd.DataFrame({
+            'clearance_passed': passed,
+            'final_score': final_scores,
+            'initial_bucket': _BUCKET_LABELS[initial_codes],
+            'final_bucket': _BUCKET_LABELS[final_codes],
+            'decision': _DECISION_LABELS[final_codes]
+        }, index=df.index)
+    
+    def _band_matrix_batch(self, scored: pd.DataFrame) -> np.ndarray:
+        """Band every variable into an (M, K) matrix for the cleared rows"""
+        band_matrix = np.empty((len(scored), len(self._VAR_SPECS)))
+        numeric_columns = {}
+        for j, (key, default, band_fn) in enumerate(self._VAR_SPECS):
+            if key in _NUMERIC_BANDS:
+                numeric_columns[key] = (j, _column_or_default(scored, key, default).to_numpy(dtype=np.float64))
+            elif key in scored:
+                # Band each category once, then index by category code
+                categorical = scored[key].astype('category').cat
+                code_to_band = _code_to_band(categorical.categories, *_CATEGORICAL_BANDS[key])
+                band_matrix[:, j] = code_to_band[categorical.codes.to_numpy()]
+            else:
+                band_matrix[:, j] = _CATEGORICAL_BANDS[key][1][-1]
+        
+        # Numeric variables go through the packed kernel in _NUMERIC_BANDS order
+        features = np.column_stack([numeric_columns[key][1] for key in _NUMERIC_BANDS])
+        numeric_bands = _band_matrix(features, _PACKED_EDGES, _PACKED_VALUES)
+        for row, key in enumerate(_NUMERIC_BANDS):
+            band_matrix[:, numeric_columns[key][0]] = numeric_bands[:, row]
+        return band_matrix
+    
+    def _additional_scores_batch(self, scored: pd.DataFrame) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """Company-specific additional scores and breakdowns for the cleared rows"""
+        additional_scores = np.zeros(len(scored))
+        breakdowns = [{} for _ in range(len(scored))]
+        if self.company_id:
+            for i, record in enumerate(scored.to_dict('records')):
+                additional_scores[i], breakdowns[i] = self._calculate_additional_score(record)
+        return additional_scores, breakdowns
+    
+    def _clearance_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """Vectorized pre-score clearance rules; True where a row passes all of them"""
+        pan = _column_or_default(df, 'pan', '').astype(str).str.strip()
+        age = _column_or_default(df, 'age', 0)
+        mask = (
+            (pan != '')
+            & (age >= 21) & (age <= 60)
+            & (_column_or_default(df, 'monthly_income', 0) >= 15000)
+            & ~_column_or_default(df, 'writeoff_flag', False).astype(bool)
+            & (_column_or_default(df, 'dpd30plus', 0) <= 2)
+            & (_column_or_default(df, 'defaulted_loans', 0) <= 0)
+        )
+        return mask.to_numpy(dtype=bool)
+    
+    def _calculate_additional_score(self, applicant_data: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
+        """Score company-specific additional data sources"""
+        if not self.company_id:
+            return 0, {}
+        
+        # Get additional data from form (filter out core variables)
+        additional_data = {k: v for k, v in applicant_data.items() 
+                         if v is not None and k not in self._core_variables}
+        
+        # Calculate additional score using clean system
+        additional_result = self._clean_system.calculate_additional_score(additional_data)
+        return additional_result['additional_score'], additional_result
+    
+    def _check_clearance_rules(self, d: '_Fields') -> Dict[str, Any]:
+        """Check pre-score clearance rules
+        
+        Failures are recorded as (code, *args) tuples; render_failures turns
+        them into messages.
+        """
         failed_rules = []
         
         # PAN is missing
-        if not data.get('pan') or data['pan'].strip() == '':
-            failed_rules.append("PAN is missing")
+        if not d.pan or d.pan.strip() == '':
+            failed_rules.append(('PAN_MISSING',))
         
         # Age < 21 or > 60
-        age = data.get('age', 0)
+        age = d.age
         if age < 21 or age > 60:
-            failed_rules.append(f"Age ({age}) is outside allowed range (21-60)")
+            failed_rules.append(('AGE_OUT_OF_RANGE', age))
         
         # Monthly Income < ₹15,000
-        income = data.get('monthly_income', 0)
+        income = d.monthly_income
         if income < 15000:
-            failed_rules.append(f"Monthly Income (₹{income:,}) is below minimum (₹15,000)")
+            failed_rules.append(('INCOME_BELOW_MINIMUM', income))
         
         # WriteOffFlag = True
-        if data.get('writeoff_flag', False):
-            failed_rules.append("Write-off flag is true")
+        if d.writeoff_flag:
+            failed_rules.append(('WRITEOFF_FLAG',))
         
         # DPD30Plus > 2
-        dpd = data.get('dpd30plus', 0)
+        dpd = d.dpd30plus
         if dpd > 2:
-            failed_rules.append(f"DPD30Plus ({dpd}) exceeds maximum allowed (2)")
+            failed_rules.append(('DPD_ABOVE_MAXIMUM', dpd))
         
         # Defaulted Loans > 0
-        defaulted = data.get('defaulted_loans', 0)
+        defaulted = d.defaulted_loans
         if defaulted > 0:
-            failed_rules.append(f"Has defaulted loans ({defaulted})")
+            failed_rules.append(('HAS_DEFAULTED_LOANS', defaulted))
         
         return {
             'passed': len(failed_rules) == 0,
             'failed_rules': failed_rules
         }
     
-    def _calculate_variable_scores(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-        """Calculate scores for all variables"""
-        scores = {}
-        
-        # Credit Score
-        credit_score = data.get('credit_score', 0)
-        credit_band_score = self._get_credit_score_band(credit_score)
-        scores['credit_score'] = {
-            'value': credit_score,
-            'band_score': credit_band_score,
-            'weight': self.variable_weights['credit_score'],
-            'weighted_score': credit_band_score * self.variable_weights['credit_score']
-        }
-        
-        # FOIR
-        foir = data.get('foir', 0)
-        foir_band_score = self._get_foir_band(foir)
-        scores['foir'] = {
-            'value': foir,
-            'band_score': foir_band_score,
-            'weight': self.variable_weights['foir'],
-            'weighted_score': foir_band_score * self.variable_weights['foir']
-        }
-        
-        # DPD30Plus
-        dpd = data.get('dpd30plus', 0)
-        dpd_band_score = self._get_dpd_band(dpd)
-        scores['dpd30plus'] = {
-            'value': dpd,
-            'band_score': dpd_band_score,
-            'weight': self.variable_weights['dpd30plus'],
-            'weighted_score': dpd_band_score * self.variable_weights['dpd30plus']
-        }
-        
-        # Enquiry Count
-        enquiry = data.get('enquiry_count', 0)
-        enquiry_band_score = self._get_enquiry_band(enquiry)
-        scores['enquiry_count'] = {
-            'value': enquiry,
-            'band_score': enquiry_band_score,
-            'weight': self.variable_weights['enquiry_count'],
-            'weighted_score': enquiry_band_score * self.variable_weights['enquiry_count']
-        }
-        
-        # Monthly Income
-        income = data.get('monthly_income', 0)
-        income_band_score = self._get_income_band(income)
-        scores['monthly_income'] = {
-            'value': income,
-            'band_score': income_band_score,
-            'weight': self.variable_weights['monthly_income'],
-            'weighted_score': income_band_score * self.variable_weights['monthly_income'] 
-        }
-        
-        # Age
-        age = data.get('age', 0)
-        age_band_score = self._get_age_band(age)
-        scores['age'] = {
-            'value': age,
-            'band_score': age_band_score,
-            'weight': self.variable_weights['age'],
-            'weighted_score': age_band_score * self.variable_weights['age'] 
-        }
-        
-        # Credit Vintage
-        vintage = data.get('credit_vintage', 0)
-        vintage_band_score = self._get_vintage_band(vintage)
-        scores['credit_vintage'] = {
-            'value': vintage,
-            'band_score': vintage_band_score,
-            'weight': self.variable_weights['credit_vintage'],
-            'weighted_score': vintage_band_score * self.variable_weights['credit_vintage'] 
-        }
-        
-        # Loan Mix Type
-        loan_mix = data.get('loan_mix_type', '')
-        loan_mix_band_score = self._get_loan_mix_band(loan_mix)
-        scores['loan_mix_type'] = {
-            'value': loan_mix,
-            'band_score': loan_mix_band_score,
-            'weight': self.variable_weights['loan_mix_type'],
-            'weighted_score': loan_mix_band_score * self.variable_weights['loan_mix_type'] 
-        }
-        
-        # Loan Completion Ratio
-        completion = data.get('loan_completion_ratio', 0)
-        completion_band_score = self._get_completion_ratio_band(completion)
-        scores['loan_completion_ratio'] = {
-            'value': completion,
-            'band_score': completion_band_score,
-            'weight': self.variable_weights['loan_completion_ratio'],
-            'weighted_score': completion_band_score * self.variable_weights['loan_completion_ratio'] 
-        }
-        
-        # Defaulted Loans
-        defaulted = data.get('defaulted_loans', 0)
-        defaulted_band_score = self._get_defaulted_loans_band(defaulted)
-        scores['defaulted_loans'] = {
-            'value': defaulted,
-            'band_score': defaulted_band_score,
-            'weight': self.variable_weights['defaulted_loans'],
-            'weighted_score': defaulted_band_score * self.variable_weights['defaulted_loans'] 
-        }
-        
-        # Unsecured Loan Amount
-        unsecured = data.get('unsecured_loan_amount', 0)
-        unsecured_band_score = self._get_unsecured_amount_band(unsecured)
-        scores['unsecured_loan_amount'] = {
-            'value': unsecured,
-            'band_score': unsecured_band_score,
-            'weight': self.variable_weights['unsecured_loan_amount'],
-            'weighted_score': unsecured_band_score * self.variable_weights['unsecured_loan_amount'] 
-        }
-        
-        # Outstanding Amount %
-        outstanding_pct = data.get('outstanding_amount_percent', 0)
-        outstanding_band_score = self._get_outstanding_percent_band(outstanding_pct)
-        scores['outstanding_amount_percent'] = {
-            'value': outstanding_pct,
-            'band_score': outstanding_band_score,
-            'weight': self.variable_weights['outstanding_amount_percent'],
-            'weighted_score': outstanding_band_score * self.variable_weights['outstanding_amount_percent'] 
-        }
-        
-        # Our Lender Exposure
-        exposure = data.get('our_lender_exposure', 0)
-        exposure_band_score = self._get_exposure_band(exposure)
-        scores['our_lender_exposure'] = {
-            'value': exposure,
-            'band_score': exposure_band_score,
-            'weight': self.variable_weights['our_lender_exposure'],
-            'weighted_score': exposure_band_score * self.variable_weights['our_lender_exposure'] 
-        }
-        
-        # Channel Type
-        channel = data.get('channel_type', '')
-        channel_band_score = self._get_channel_band(channel)
-        scores['channel_type'] = {
-            'value': channel,
-            'band_score': channel_band_score,
-            'weight': self.variable_weights['channel_type'],
-            'weighted_score': channel_band_score * self.variable_weights['channel_type'] 
-        }
-        
-        # New Employment Stability Variables
-        job_type = data.get('job_type', '')
-        job_band_score = self._get_job_type_band(job_type)
-        scores['job_type'] = {
-            'value': job_type,
-            'band_score': job_band_score,
-            'weight': self.variable_weights.get('job_type', 0),
-            'weighted_score': job_band_score * self.variable_weights.get('job_type', 0)
-        }
-        
-        employment_tenure = data.get('employment_tenure', 0)
-        tenure_band_score = self._get_employment_tenure_band(employment_tenure)
-        scores['employment_tenure'] = {
-            'value': employment_tenure,
-            'band_score': tenure_band_score,
-            'weight': self.variable_weights.get('employment_tenure', 0),
-            'weighted_score': tenure_band_score * self.variable_weights.get('employment_tenure', 0)
-        }
-        
-        company_stability = data.get('company_stability', '')
-        company_band_score = self._get_company_stability_band(company_stability)
-        scores['company_stability'] = {
-            'value': company_stability,
-            'band_score': company_band_score,
-            'weight': self.variable_weights.get('company_stability', 0),
-            'weighted_score': company_band_score * self.variable_weights.get('company_stability', 0)
-        }
-        
-        # New Banking Behavior Variables
-        account_vintage = data.get('account_vintage', 0)
-        account_band_score = self._get_account_vintage_band(account_vintage)
-        scores['account_vintage'] = {
-            'value': account_vintage,
-            'band_score': account_band_score,
-            'weight': self.variable_weights.get('account_vintage', 0),
-            'weighted_score': account_band_score * self.variable_weights.get('account_vintage', 0)
-        }
-        
-        avg_balance = data.get('avg_monthly_balance', 0)
-        balance_band_score = self._get_avg_monthly_balance_band(avg_balance)
-        scores['avg_monthly_balance'] = {
-            'value': avg_balance,
-            'band_score': balance_band_score,
-            'weight': self.variable_weights.get('avg_monthly_balance', 0),
-            'weighted_score': balance_band_score * self.variable_weights.get('avg_monthly_balance', 0)
-        }
-        
-        bounce_freq = data.get('bounce_frequency', 0)
-        bounce_band_score = self._get_bounce_frequency_band(bounce_freq)
-        scores['bounce_frequency'] = {
-            'value': bounce_freq,
-            'band_score': bounce_band_score,
-            'weight': self.variable_weights.get('bounce_frequency', 0),
-            'weighted_score': bounce_band_score * self.variable_weights.get('bounce_frequency', 0)
-        }
-        
-        # New Geographic & Social Variables
-        geo_risk = data.get('geographic_risk', '')
-        geo_band_score = self._get_geographic_risk_band(geo_risk)
-        scores['geographic_risk'] = {
-            'value': geo_risk,
-            'band_score': geo_band_score,
-            'weight': self.variable_weights.get('geographic_risk', 0),
-            'weighted_score': geo_band_score * self.variable_weights.get('geographic_risk', 0)
-        }
-        
-        mobile_vintage = data.get('mobile_number_vintage', 0)
-        mobile_band_score = self._get_mobile_vintage_band(mobile_vintage)
-        scores['mobile_number_vintage'] = {
-            'value': mobile_vintage,
-            'band_score': mobile_band_score,
-            'weight': self.variable_weights.get('mobile_number_vintage', 0),
-            'weighted_score': mobile_band_score * self.variable_weights.get('mobile_number_vintage', 0)
-        }
-        
-        digital_engagement = data.get('digital_engagement', 0)
-        digital_band_score = self._get_digital_engagement_band(digital_engagement)
-        scores['digital_engagement'] = {
-            'value': digital_engagement,
-            'band_score': digital_band_score,
-            'weight': self.variable_weights.get('digital_engagement', 0),
-            'weighted_score': digital_band_score * self.variable_weights.get('digital_engagement', 0)
-        }
-        
-        return scores
+    def _normalize(self, data: Dict[str, Any]) -> '_Fields':
+        """Read every scored field once, filling in its default"""
+        # Validated records carry every field: one C-level lookup for all of them
+        try:
+            return self._Fields._make(self._get_fields(data))
+        except KeyError:
+            return self._Fields._make([data.get(key, default) for key, default in self._FIELD_DEFAULTS])
+    
+    def _normalize_batch(self, df: pd.DataFrame) -> '_Fields':
+        """Column-wise _normalize: one array per field, default-filled when the column is missing"""
+        return self._Fields._make([
+            df[key].to_numpy() if key in df else np.full(len(df), default)
+            for key, default in self._FIELD_DEFAULTS
+        ])
+    
+    def _calculate_variable_scores(self, d: '_Fields') -> Tuple[Dict[str, VarScore], np.ndarray]:
+        """Calculate scores for all variables
+        
+        Returns the per-variable breakdown and the band scores as an array
+        aligned with the engine's weight vector.
+        """
+        self._require_core_weights()
+        values = self._get_var_values(d)
+        band_scores = [band_fn(self, value) for band_fn, value in zip(self._VAR_BAND_FNS, values)]
+        weights = self._weight_row
+        
+        # Build every breakdown row and the dict in one pass
+        scores = dict(zip(self._VAR_KEYS, map(VarScore, values, band_scores, weights, map(mul, band_scores, weights))))
+        return scores, np.array(band_scores)
     
     def _get_credit_score_band(self, score: int) -> float:
         """Get credit score band value"""
-        if score == -1 or score == 0:
-            return 0.01
-        elif 1 <= score <= 99:
-            return 0.2
-        elif 100 <= score <= 599:
-            return 0.0
-        elif 600 <= score <= 649:
-            return 0.3
-        elif 650 <= score <= 699:
-            return 0.6
-        elif 700 <= score <= 729:
-            return 0.8
-        elif 730 <= score <= 749:
-            return 0.9
-        elif score >= 750:
-            return 1.0
-        else:
-            return 0.0
+        return _band(score, *_CREDIT_SCORE_BANDS)
     
     def _get_foir_band(self, foir: float) -> float:
         """Get FOIR band value"""
-        if foir <= 0.35:
-            return 1.0
-        elif 0.36 <= foir <= 0.45:
-            return 0.6
-        elif 0.46 <= foir <= 0.55:
-            return 0.3
-        else:
-            return 0.0
+        return _band(foir, *_FOIR_BANDS)
     
     def _get_dpd_band(self, dpd: int) -> float:
         """Get DPD30Plus band value"""
-        if dpd == 0:
-            return 1.0
-        elif dpd == 1:
-            return 0.5
-        else:
-            return 0.0
+        return _band(dpd, *_DPD_BANDS)
     
     def _get_enquiry_band(self, enquiry: int) -> float:
         """Get enquiry count band value"""
-        if 0 <= enquiry <= 1:
-            return 1.0
-        elif 2 <= enquiry <= 3:
-            return 0.6
-        else:
-            return 0.2
+        return _band(enquiry, *_ENQUIRY_BANDS)
     
     def _get_income_band(self, income: float) -> float:
         """Get monthly income band value"""
-        if income > 30000:
-            return 1.0
-        elif 20000 <= income <= 30000:
-            return 0.6
-        elif 18000 <= income < 20000:
-            return 0.4
-        elif 15000 <= income < 18000:
-            return 0.3
-        else:
-            return 0.0
+        return _band(income, *_INCOME_BANDS)
     
     def _get_age_band(self, age: int) -> float:
         """Get age band value"""
-        if 26 <= age <= 35:
-            return 1.0
-        elif 36 <= age <= 45:
-            return 0.8
-        elif (21 <= age <= 25) or (46 <= age <= 55):
-            return 0.6
-        elif 56 <= age <= 60:
-            return 0.4
-        else:
-            return 0.0
+        return _band(age, *_AGE_BANDS)
     
     def _get_vintage_band(self, vintage: int) -> float:
         """Get credit vintage band value"""
-        if vintage > 60:
-            return 1.0
-        elif 37 <= vintage <= 60:
-            return 0.8
-        elif 25 <= vintage <= 36:
-            return 0.6
-        elif 13 <= vintage <= 24:
-            return 0.4
-        elif 7 <= vintage <= 12:
-            return 0.2
-        else:
-            return 0.0
+        return _band(vintage, *_CREDIT_VINTAGE_BANDS)
     
     def _get_loan_mix_band(self, loan_mix: str) -> float:
         """Get loan mix type band value"""
-        if loan_mix == "PL/HL/CC":
-            return 1.0
-        elif loan_mix == "Gold + Consumer Durable":
-            return 0.6
-        elif loan_mix == "Only Gold":
-            return 0.3
-        elif loan_mix == "Agri/Other loans":
-            return 0.4
-        else:
-            return 0.0
+        return _category_band(loan_mix, *_LOAN_MIX_CATEGORIES)
     
     def _get_completion_ratio_band(self, ratio: float) -> float:
         """Get loan completion ratio band value"""
-        if ratio > 0.7:
-            return 1.0
-        elif 0.4 <= ratio <= 0.7:
-            return 0.6
-        else:
-            return 0.3
+        return _band(ratio, *_COMPLETION_RATIO_BANDS)
     
     def _get_defaulted_loans_band(self, defaulted: int) -> float:
         """Get defaulted loans band value"""
-        if defaulted == 0:
-            return 1.0
-        else:
-            return 0.0
+        return _band(defaulted, *_DEFAULTED_LOANS_BANDS)
     
     def _get_unsecured_amount_band(self, amount: float) -> float:
         """Get unsecured loan amount band value"""
-        if amount == 0:
-            return 0.6
-        elif amount < 50000:
-            return 0.8
-        elif 50000 <= amount <= 100000:
-            return 1.0
-        else:
-            return 0.6
+        return _band(amount, *_UNSECURED_AMOUNT_BANDS)
     
     def _get_outstanding_percent_band(self, percent: float) -> float:
         """Get outstanding amount percent band value"""
-        if percent < 0.3:
-            return 1.0
-        elif 0.3 <= percent <= 0.6:
-            return 0.6
-        else:
-            return 0.3
+        return _band(percent, *_OUTSTANDING_PERCENT_BANDS)
     
     def _get_exposure_band(self, exposure: float) -> float:
         """Get our lender exposure band value"""
-        if exposure > 0:
-            return 1.0
-        else:
-            return 0.0
+        return _band(exposure, *_EXPOSURE_BANDS)
     
     def _get_channel_band(self, channel: str) -> float:
         """Get channel type band value"""
-        if channel == "Merchant/Referral":
-            return 1.0
-        else:
-            return 0.5
+        return _category_band(channel, *_CHANNEL_CATEGORIES)
     
     # Employment Stability Variables
     def _get_job_type_band(self, job_type: str) -> float:
         """Get job type band value"""
-        job_mapping = {
-            "Government/PSU": 1.0,
-            "Private Company (MNC)": 0.9,
-            "Private Company (Local)": 0.7,
-            "Self Employed Professional": 0.6,
-            "Business Owner": 0.5,
-            "Freelancer/Contract": 0.3
-        }
-        return job_mapping.get(job_type, 0.2)
+        return _category_band(job_type, *_JOB_TYPE_CATEGORIES)
     
     def _get_employment_tenure_band(self, tenure_months: int) -> float:
         """Get employment tenure band value"""
-        if tenure_months >= 60:
-            return 1.0
-        elif tenure_months >= 36:
-            return 0.8
-        elif tenure_months >= 24:
-            return 0.6
-        elif tenure_months >= 12:
-            return 0.4
-        elif tenure_months >= 6:
-            return 0.2
-        else:
-            return 0.0
+        return _band(tenure_months, *_EMPLOYMENT_TENURE_BANDS)
     
     def _get_company_stability_band(self, company_type: str) -> float:
         """Get company stability band value"""
-        stability_mapping = {
-            "Fortune 500": 1.0,
-            "Large Enterprise": 0.9,
-            "Mid-size Company": 0.7,
-            "Small Company": 0.5,
-            "Startup": 0.3,
-            "Unknown": 0.1
-        }
-        return stability_mapping.get(company_type, 0.1)
+        return _category_band(company_type, *_COMPANY_STABILITY_CATEGORIES)
     
     # Banking Behavior Variables
     def _get_account_vintage_band(self, vintage_months: int) -> float:
         """Get bank account vintage band value"""
-        if vintage_months >= 60:
-            return 1.0
-        elif vintage_months >= 36:
-            return 0.8
-        elif vintage_months >= 24:
-            return 0.6
-        elif vintage_months >= 12:
-            return 0.4
-        else:
-            return 0.2
+        return _band(vintage_months, *_VINTAGE_BANDS)
     
     def _get_avg_monthly_balance_band(self, balance: float) -> float:
         """Get average monthly balance band value"""
-        if balance >= 100000:
-            return 1.0
-        elif balance >= 50000:
-            return 0.8
-        elif balance >= 25000:
-            return 0.6
-        elif balance >= 10000:
-            return 0.4
-        elif balance >= 5000:
-            return 0.2
-        else:
-            return 0.0
+        return _band(balance, *_AVG_MONTHLY_BALANCE_BANDS)
     
     def _get_bounce_frequency_band(self, bounces_per_year: int) -> float:
         """Get bounce frequency band value"""
-        if bounces_per_year == 0:
-            return 1.0
-        elif bounces_per_year <= 2:
-            return 0.7
-        elif bounces_per_year <= 5:
-            return 0.4
-        elif bounces_per_year <= 10:
-            return 0.2
-        else:
-            return 0.0
+        return _band(bounces_per_year, *_BOUNCE_FREQUENCY_BANDS)
     
     # Geographic & Social Variables
     def _get_geographic_risk_band(self, location_type: str) -> float:
         """Get geographic risk band value"""
-        location_mapping = {
-            "Metro Tier 1": 1.0,
-            "Metro Tier 2": 0.8,
-            "Urban": 0.7,
-            "Semi-Urban": 0.5,
-            "Rural": 0.3,
-            "Remote": 0.1
-        }
-        return location_mapping.get(location_type, 0.5)
+        return _category_band(location_type, *_GEOGRAPHIC_RISK_CATEGORIES)
     
     def _get_mobile_vintage_band(self, vintage_months: int) -> float:
         """Get mobile number vintage band value"""
-        if vintage_months >= 60:
-            return 1.0
-        elif vintage_months >= 36:
-            return 0.8
-        elif vintage_months >= 24:
-            return 0.6
-        elif vintage_months >= 12:
-            return 0.4
-        else:
-            return 0.2
+        return _band(vintage_months, *_VINTAGE_BANDS)
     
     def _get_digital_engagement_band(self, engagement_score: float) -> float:
         """Get digital engagement band value"""
-        if engagement_score >= 80:
-            return 1.0
-        elif engagement_score >= 60:
-            return 0.8
-        elif engagement_score >= 40:
-            return 0.6
-        elif engagement_score >= 20:
-            return 0.4
-        else:
-            return 0.2
+        return _band(engagement_score, *_DIGITAL_ENGAGEMENT_BANDS)
+    
+    # Scored variables as (key, missing-value default, band function), in scoring order
+    _VAR_SPECS = (
+        ('credit_score', 0, _get_credit_score_band),
+        ('foir', 0, _get_foir_band),
+        ('dpd30plus', 0, _get_dpd_band),
+        ('enquiry_count', 0, _get_enquiry_band),
+        ('monthly_income', 0, _get_income_band),
+        ('age', 0, _get_age_band),
+        ('credit_vintage', 0, _get_vintage_band),
+        ('loan_mix_type', '', _get_loan_mix_band),
+        ('loan_completion_ratio', 0, _get_completion_ratio_band),
+        ('defaulted_loans', 0, _get_defaulted_loans_band),
+        ('unsecured_loan_amount', 0, _get_unsecured_amount_band),
+        ('outstanding_amount_percent', 0, _get_outstanding_percent_band),
+        ('our_lender_exposure', 0, _get_exposure_band),
+        ('channel_type', '', _get_channel_band),
+        ('job_type', '', _get_job_type_band),
+        ('employment_tenure', 0, _get_employment_tenure_band),
+        ('company_stability', '', _get_company_stability_band),
+        ('account_vintage', 0, _get_account_vintage_band),
+        ('avg_monthly_balance', 0, _get_avg_monthly_balance_band),
+        ('bounce_frequency', 0, _get_bounce_frequency_band),
+        ('geographic_risk', '', _get_geographic_risk_band),
+        ('mobile_number_vintage', 0, _get_mobile_vintage_band),
+        ('digital_engagement', 0, _get_digital_engagement_band)
+    )
+    
+    _VAR_KEYS = tuple(key for key, _, _ in _VAR_SPECS)
+    # The first fourteen weights are required; the 20-variable extensions
+    # score with weight 0 when the weights predate them
+    _CORE_WEIGHT_KEYS = _VAR_KEYS[:14]
+    _VAR_BAND_FNS = tuple(band_fn for _, _, band_fn in _VAR_SPECS)
+    _get_var_values = staticmethod(attrgetter(*_VAR_KEYS))
+    
+    # Fields read by clearance, banding and bucket movements, with their defaults
+    _FIELD_DEFAULTS = (('pan', None), ('writeoff_flag', False)) + tuple(
+        (key, default) for key, default, _ in _VAR_SPECS
+    )
+    _Fields = namedtuple('ApplicantFields', [key for key, _ in _FIELD_DEFAULTS])
+    _get_fields = staticmethod(itemgetter(*(key for key, _ in _FIELD_DEFAULTS)))
+    
+    def _require_core_weights(self):
+        """Raise KeyError for the first core variable the weights do not cover"""
+        if self._missing_weight is not None:
+            raise KeyError(self._missing_weight)
     
     def _get_initial_bucket(self, score: float) -> str:
         """Get initial risk bucket based on scientific credit risk assessment"""
-        # Risk-based thresholds aligned with default probability analysis:
-        # Based on credit risk fundamentals and industry best practices
-        
-        if score >= 80:  # <3% default probability - Exceptional credit profiles
-            return 'A'  # Auto-approve: Minimal risk, strong financials
-        elif score >= 65:  # 3-8% default probability - Strong credit profiles  
-            return 'B'  # Recommend: Low risk, good payment history
-        elif score >= 50:  # 8-15% default probability - Acceptable credit profiles
-            return 'C'  # Refer: Moderate risk, requires review
-        else:  # >15% default probability - High-risk profiles
-            return 'D'  # Decline: High risk, poor creditworthiness
-    
-    def _apply_post_score_movements(self, initial_bucket: str, score: float, data: Dict[str, Any]) -> Tuple[List[Dict], str]:
+        return _BUCKET_VALS[_bisect_right(_BUCKET_BINS, score)]
+    
+    def _apply_post_score_movements(self, initial_bucket: str, score: float, d: '_Fields') -> Tuple[List[Movement], str]:
         """Apply post-score movement logic"""
-        movements = []
-        current_bucket = initial_bucket
-        
-        # A → B movement
-        if current_bucket == 'A' and score >= 80:
-            negative_factors = 0
-            reasons = []
-            
-            if data.get('dpd30plus', 0) > 0:
-                negative_factors += 1
-                reasons.append("DPD > 0")
-            
-            if data.get('enquiry_count', 0) > 3:
-                negative_factors += 1
-                reasons.append("Enquiry > 3")
-            
-            if data.get('foir', 0) > 0.45:
-                negative_factors += 1
-                reasons.append("FOIR > 0.45")
-            
-            if data.get('loan_mix_type', '') == "Only Gold":
-                negative_factors += 1
-                reasons.append("LoanMix = Gold only")
-            
-            if data.get('loan_completion_ratio', 0) < 0.5:
-                negative_factors += 1
-                reasons.append("CompletionRatio < 0.5")
-            
-            if negative_factors >= 2:
-                movements.append({
-                    'from': 'A',
-                    'to': 'B',
-                    'reason': f"2+ negative factors: {', '.join(reasons[:2])}"
-                })
-                current_bucket = 'B'
-        
-        # B → A movement
-        elif current_bucket == 'B' and 65 <= score < 80:
-            positive_factors = 0
-            reasons = []
-            
-            if data.get('credit_score', 0) >= 770:
-                positive_factors += 1
-                reasons.append("CreditScore ≥ 770")
-            
-            if data.get('dpd30plus', 0) == 0:
-                positive_factors += 1
-                reasons.append("DPD = 0")
-            
-            if data.get('foir', 0) < 0.35:
-                positive_factors += 1
-                reasons.append("FOIR < 0.35")
-            
-            loan_mix = data.get('loan_mix_type', '')
-            if loan_mix in ["PL/HL/CC"]:
-                positive_factors += 1
-                reasons.append("PL/HL in LoanMix")
-            
-            if data.get('our_lender_exposure', 0) > 0:
-                positive_factors += 1
-                reasons.append("OurLenderExposure > 0")
-            
-            if positive_factors >= 4:
-                movements.append({
-                    'from': 'B',
-                    'to': 'A',
-                    'reason': f"4+ positive factors: {', '.join(reasons[:4])}"
-                })
-                current_bucket = 'A'
-        
-        # C → B movement
-        elif current_bucket == 'C' and 50 <= score < 65:
-            conditions_met = True
-            reasons = []
-            
-            if data.get('credit_score', 0) < 730:
-                conditions_met = False
-            else:
-                reasons.append("CreditScore ≥ 730")
-            
-            if data.get('credit_vintage', 0) < 36:
-                conditions_met = False
-            else:
-                reasons.append("CreditVintage ≥ 36")
-            
-            if data.get('loan_completion_ratio', 0) <= 0.6:
-                conditions_met = False
-            else:
-                reasons.append("CompletionRatio > 0.6")
-            
-            if conditions_met:
-                movements.append({
-                    'from': 'C',
-                    'to': 'B',
-                    'reason': f"All conditions met: {', '.join(reasons)}"
-                })
-                current_bucket = 'B'
-        
-        # D → C movement
-        elif current_bucket == 'D' and score < 50:
-            positive_factors = 0
-            reasons = []
-            
-            if data.get('credit_score', 0) >= 750:
-                positive_factors += 1
-                reasons.append("CreditScore ≥ 750")
-            
-            if data.get('foir', 0) < 0.35:
-                positive_factors += 1
-                reasons.append("FOIR < 0.35")
-            
-            if data.get('dpd30plus', 0) == 0:
-                positive_factors += 1
-                reasons.append("DPD = 0")
-            
-            if data.get('enquiry_count', 0) <= 2:
-                positive_factors += 1
-                reasons.append("Enquiry ≤ 2")
-            
-            if data.get('monthly_income', 0) >= 30000:
-                positive_factors += 1
-                reasons.append("Income ≥ ₹30K")
-            
-            if positive_factors >= 3:
-                movements.append({
-                    'from': 'D',
-                    'to': 'C',
-                    'reason': f"3+ positive factors: {', '.join(reasons[:3])}"
-                })
-                current_bucket = 'C'
-        
-        return movements, current_bucket
+        evaluate = _EVALUATORS.get(initial_bucket)
+        if evaluate is None:
+            return [], initial_bucket
+        return evaluate(d, score)
+    
+    def _apply_post_score_movements_batch(self, bucket_codes: np.ndarray, scores: np.ndarray,
+                                          fields: '_Fields') -> Tuple[List[List[Movement]], np.ndarray]:
+        """Vectorized _apply_post_score_movements over arrays of cleared rows
+        
+        bucket_codes index _BUCKET_VALS. Every factor rule is evaluated once as a
+        boolean column, the movement kernel picks each row's final bucket, and
+        reason strings are only built for the rows that actually move. Returns
+        the movements per row and the final bucket codes.
+        """
+        movements = [[] for _ in range(len(bucket_codes))]
+        # Pack every distinct check into one integer mask per row, so the kernel
+        # works on a single int64 column instead of a boolean matrix
+        checks = np.column_stack([
+            compare(read(fields), threshold) for read, compare, threshold in _MOVEMENT_CHECKS
+        ]).astype(np.int64)
+        check_masks = checks @ (1 << np.arange(len(_MOVEMENT_CHECKS), dtype=np.int64))
+        final_codes = _resolve_movements(bucket_codes, scores, check_masks, *_MOVEMENT_ARRAYS)
+        
+        # Repack the checks of moved rows in rule order and look up their reasons
+        moved_rows = np.flatnonzero(final_codes != bucket_codes)
+        for code, transition in enumerate(_TRANSITIONS_BY_CODE):
+            rows = moved_rows[bucket_codes[moved_rows] == code]
+            if not len(rows):
+                continue
+            columns = _MOVEMENT_COLUMNS[_MOVEMENT_STARTS[code]:_MOVEMENT_STOPS[code]]
+            masks = checks[np.ix_(rows, columns)] @ (1 << np.arange(len(columns)))
+            from_bucket = _BUCKET_VALS[code]
+            for row, mask in zip(rows, masks.tolist()):
+                movements[row].append(Movement(from_bucket, transition.target, transition.reason_by_mask[mask]))
+        
+        return movements, final_codes
     
     def _get_decision(self, bucket: str) -> str:
         """Get decision based on final bucket"""
-        decisions = {
-            'A': 'Auto-approve',
-            'B': 'Recommend',
-            'C': 'Refer',
-            'D': 'Decline'
-        }
-        return decisions.get(bucket, 'Decline')
+        return _DECISIONS.get(bucket, 'Decline')
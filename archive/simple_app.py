@@ -8,9 +8,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def load_modern_css():
-    """Load modern, professional CSS styling"""
-    st.markdown("""
+# Modern, professional CSS styling: layout, colors and typography
+_CORE_CSS = """
     <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
@@ -32,23 +31,11 @@ def load_modern_css():
         padding: 2.5rem 2rem;
         border-radius: 16px;
         margin-bottom: 2rem;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
         border: 1px solid #f3f4f6;
         position: relative;
         overflow: hidden;
     }
     
-    .modern-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grain" width="100" height="100" patternUnits="userSpaceOnUse"><circle cx="25" cy="25" r="1" fill="white" opacity="0.1"/><circle cx="75" cy="75" r="1" fill="white" opacity="0.1"/><circle cx="50" cy="10" r="0.5" fill="white" opacity="0.1"/></pattern></defs><rect width="100" height="100" fill="url(%23grain)"/></svg>');
-        opacity: 0.3;
-    }
-    
     .modern-header h1 {
         color: #374151;
         margin: 0;
@@ -72,12 +59,12 @@ def load_modern_css():
     
     /* Modern Sidebar */
     .css-1d391kg {
-        background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
+        background: #f8fafc;
         border-right: 2px solid #e2e8f0;
     }
     
     .css-1629p8f {
-        background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
+        background: #f8fafc;
     }
     
     /* Modern Cards */
@@ -85,29 +72,12 @@ def load_modern_css():
         background: white;
         padding: 2rem;
         border-radius: 16px;
-        box-shadow: 0 8px 30px rgba(0, 0, 0, 0.08);
         margin: 1.5rem 0;
         border: 1px solid rgba(0, 0, 0, 0.05);
-        transition: all 0.3s ease;
         position: relative;
         overflow: hidden;
     }
     
-    .modern-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    .modern-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.15);
-    }
-    
     /* Modern Buttons */
     .stButton > button {
         background: white;
@@ -117,36 +87,26 @@ def load_modern_css():
         padding: 0.75rem 2rem;
         font-weight: 600;
         font-size: 1rem;
-        transition: all 0.2s ease;
-        box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
         font-family: 'Inter', sans-serif;
     }
     
     .stButton > button:hover {
         background: #f9fafb;
         border-color: #9ca3af;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
     }
     
     /* Modern Download Buttons */
     .stDownloadButton > button {
-        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+        background: #10b981;
         color: white;
         border: none;
         border-radius: 12px;
         padding: 0.875rem 2.5rem;
         font-weight: 600;
         font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 8px 20px rgba(16, 185, 129, 0.3);
         font-family: 'Inter', sans-serif;
     }
     
-    .stDownloadButton > button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 15px 35px rgba(16, 185, 129, 0.4);
-    }
-    
     /* Modern Tabs */
     .stTabs [data-baseweb="tab-list"] {
         gap: 12px;
@@ -162,22 +122,14 @@ def load_modern_css():
         padding: 1rem 2rem;
         font-weight: 600;
         font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
         font-family: 'Inter', sans-serif;
         color: #64748b;
     }
     
-    .stTabs [data-baseweb="tab"]:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.1);
-    }
-    
     .stTabs [aria-selected="true"] {
         background: white;
         color: #374151;
         border-color: #d1d5db;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
     }
     
     /* Modern Inputs */
@@ -185,12 +137,10 @@ def load_modern_css():
         border-radius: 12px;
         border: 2px solid #e2e8f0;
         font-family: 'Inter', sans-serif;
-        transition: border-color 0.2s ease;
     }
     
     .stSelectbox > div > div:focus-within {
         border-color: #3b82f6;
-        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
     }
     
     .stNumberInput > div > div {
@@ -211,46 +161,36 @@ def load_modern_css():
         border: 2px solid #e2e8f0;
         padding: 1.5rem;
         border-radius: 16px;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.05);
-        transition: all 0.2s ease;
-    }
-    
-    [data-testid="metric-container"]:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
     }
     
     /* Status Cards */
     .success-card {
-        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+        background: #10b981;
         color: white;
         border-radius: 16px;
         padding: 1.5rem;
         border: none;
-        box-shadow: 0 8px 25px rgba(16, 185, 129, 0.2);
     }
     
     .error-card {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+        background: #ef4444;
         color: white;
         border-radius: 16px;
         padding: 1.5rem;
         border: none;
-        box-shadow: 0 8px 25px rgba(239, 68, 68, 0.2);
     }
     
     .warning-card {
-        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
+        background: #f59e0b;
         color: white;
         border-radius: 16px;
         padding: 1.5rem;
         border: none;
-        box-shadow: 0 8px 25px rgba(245, 158, 11, 0.2);
     }
     
     /* Modern Progress Bar */
     .stProgress > div > div {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        background: #667eea;
         border-radius: 8px;
         height: 12px;
     }
@@ -303,32 +243,158 @@ def load_modern_css():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Paint-heavy effects layered over the core: shadows, gradients, hover motion
+_FANCY_CSS = """
+    <style>
+    .modern-header {
+        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+    }
+    
+    .css-1d391kg, .css-1629p8f {
+        background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
+    }
+    
+    .modern-card {
+        box-shadow: 0 8px 30px rgba(0, 0, 0, 0.08);
+        transition: all 0.3s ease;
+    }
+    
+    .modern-card::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        height: 4px;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    }
+    
+    .modern-card:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.15);
+    }
+    
+    .stButton > button {
+        transition: all 0.2s ease;
+        box-shadow: 0 1px 2px rgba(0, 0, 0, 0.05);
+    }
+    
+    .stButton > button:hover {
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+    }
+    
+    .stDownloadButton > button {
+        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+        transition: all 0.3s ease;
+        box-shadow: 0 8px 20px rgba(16, 185, 129, 0.3);
+    }
+    
+    .stDownloadButton > button:hover {
+        transform: translateY(-3px);
+        box-shadow: 0 15px 35px rgba(16, 185, 129, 0.4);
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.1);
+    }
+    
+    .stTabs [aria-selected="true"] {
+        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+    }
+    
+    .stSelectbox > div > div {
+        transition: border-color 0.2s ease;
+    }
+    
+    .stSelectbox > div > div:focus-within {
+        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
+    }
+    
+    [data-testid="metric-container"] {
+        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.05);
+        transition: all 0.2s ease;
+    }
+    
+    [data-testid="metric-container"]:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
+    }
+    
+    .success-card {
+        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+        box-shadow: 0 8px 25px rgba(16, 185, 129, 0.2);
+    }
+    
+    .error-card {
+        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+        box-shadow: 0 8px 25px rgba(239, 68, 68, 0.2);
+    }
+    
+    .warning-card {
+        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
+        box-shadow: 0 8px 25px rgba(245, 158, 11, 0.2);
+    }
+    
+    .stProgress > div > div {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    }
+    </style>
+    """
+
+# Collapse whitespace once at import so each rerun sends the smallest payload
+_LITE_CSS = " ".join(_CORE_CSS.split())
+_MODERN_CSS = _LITE_CSS + " ".join(_FANCY_CSS.split())
+
+def load_modern_css():
+    """Load modern, professional CSS styling
+    
+    Lite mode (sidebar toggle) sends only the core stylesheet, without the
+    shadows, gradients and hover transforms that are costly to paint.
+    """
+    # Streamlit drops elements a rerun does not emit, so the style block is sent every run
+    st.markdown(_LITE_CSS if st.session_state.get('lite_mode') else _MODERN_CSS, unsafe_allow_html=True)
 
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
 import io
+import os
 import sqlite3
 from scoring_engine import LoanScoringEngine
-from modular_scoring_engine import ModularScoringEngine
-from field_mapping_manager import render_field_mapping_management, get_dsa_mapping_options
-from modular_scoring_ui import render_modular_individual_scoring, render_modular_bulk_upload, render_modular_scoring_config
-from dsa_scoring_fixed import render_dsa_field_scoring
-from personalized_onboarding import render_personalized_onboarding
 from quick_preferences_update import render_quick_preferences_update, render_preferences_button
 from database import DatabaseManager
+from backend_auth_system import backend_auth
+from simplified_additional_fields import SimplifiedAdditionalFields
+from clean_dynamic_system import render_clean_dynamic_scorecard
 
-from utils import create_excel_output, validate_csv_columns
-from validators import validate_individual_data
-from weights_config import render_weights_configuration
-from ab_testing_framework import render_ab_testing_interface
-from api_integration import render_api_management
-from dynamic_config_ui1 import render_dynamic_scorecard_config
+from validators import validate_batch, validate_individual_data
 from dynamic_scorecard1 import DynamicScorecardManager
-from dynamic_scoring_ui1 import render_dynamic_individual_scoring
 import json
+import hashlib
+import hmac
+from functools import lru_cache
+# Login, sidebar and individual scoring modules above are on every common path;
+# other page modules are imported in the branch that renders them, so a cold
+# start only pays for the page actually shown
+
+@st.cache_data
+def _load_bulk_template():
+    """Read the bulk upload template once per process"""
+    with open("bulk_template_20vars.csv", "r") as f:
+        return f.read()
+
+@st.cache_data(show_spinner=False)
+def _parse_bulk_csv(raw_bytes):
+    """Parse an uploaded bulk CSV, cached on its bytes"""
+    return pd.read_csv(io.BytesIO(raw_bytes), dtype=_BULK_CATEGORY_DTYPES)
 
 def render_bulk_upload():
     """ML-Enhanced bulk upload processing with automatic weight optimization"""
@@ -368,8 +434,7 @@ def render_bulk_upload():
         st.subheader("📋 Download Template")
         # Read the template file
         try:
-            with open("bulk_template_20vars.csv", "r") as f:
-                template_data = f.read()
+            template_data = _load_bulk_template()
             
             st.download_button(
                 label="📥 Download Multi-Variable Template",
@@ -383,10 +448,11 @@ def render_bulk_upload():
     
     if uploaded_file is not None:
         try:
-            # Load and preview data
-            df = pd.read_csv(uploaded_file)
+            # Load and preview data; reruns reuse the parsed frame for the same upload
+            df = _parse_bulk_csv(uploaded_file.getvalue())
             
-            st.success(f"✅ File uploaded successfully! Found {len(df)} applications")
+            n_rows = len(df)
+            st.success(f"✅ File uploaded successfully! Found {n_rows} applications")
             
             # ML Weight Analysis Section
             st.subheader("🤖 AI Weight Analysis")
@@ -398,17 +464,8 @@ def render_bulk_upload():
             st.subheader("🔍 Data Validation")
             
             # Check required columns (case-insensitive mapping)
-            required_columns = [
-                'Pan', 'Age', 'MonthlyIncome', 'CreditScore', 'FOIR', 'DPD_30_Plus', 
-                'EnquiryCount', 'CreditVintage', 'LoanMixType', 'LoanCompletionRatio',
-                'DefaultedLoans', 'CompanyType', 'EmploymentTenure', 'CompanyStability',
-                'AccountVintage', 'AMB', 'BounceCount', 'GeoRisk',
-                'MobileVintage', 'DigitalScore', 'UnsecuredLoanAmount',
-                'OutstandingPercent', 'OurLenderExposure', 'ChannelType'
-            ]
-            
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            extra_columns = [col for col in df.columns if col not in required_columns]
+            missing_columns = [column for column, _, _ in _BULK_FIELDS if column not in df.columns]
+            extra_columns = [col for col in df.columns if col not in _REQUIRED_BULK_COLUMNS]
             
             col1, col2, col3 = st.columns(3)
             
@@ -429,18 +486,19 @@ def render_bulk_upload():
                     st.success("✅ No extra columns")
             
             with col3:
-                st.metric("Total Records", len(df))
+                st.metric("Total Records", n_rows)
                 st.metric("Total Columns", len(df.columns))
             
-            # Data preview
+            # Data preview of the template columns only; extras are listed above
             st.subheader("👀 Data Preview")
-            st.dataframe(df.head(10), use_container_width=True)
+            preview_columns = [column for column, _, _ in _BULK_FIELDS if column in df.columns]
+            st.dataframe(df.head(10)[preview_columns], use_container_width=True)
             
             # Processing options
             if not missing_columns:
                 st.subheader("⚙️ Processing Options")
                 
-                col1, col2, col3 = st.columns(3)
+                col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
                     batch_size = st.selectbox(
@@ -464,15 +522,166 @@ def render_bulk_upload():
                         help="How to handle validation errors"
                     )
                 
+                with col4:
+                    export_format = st.selectbox(
+                        "Export Format",
+                        ["CSV", "Excel"],
+                        help="Excel exports are streamed row by row to bound memory"
+                    )
+                
                 # Process button
                 if st.button("🚀 Process Bulk Applications", type="primary", use_container_width=True):
-                    process_bulk_applications(df, batch_size, include_detailed_scores, error_handling)
+                    process_bulk_applications(df, batch_size, include_detailed_scores, error_handling, export_format)
             
         except Exception as e:
             st.error(f"❌ Error reading file: {str(e)}")
             st.info("Please ensure your CSV file has the correct format and encoding (UTF-8)")
 
-def process_bulk_applications(df, batch_size, include_detailed_scores, error_handling):
+# Template column, engine field and type of every bulk upload value
+_BULK_FIELDS = (
+    # Core Credit Variables
+    ('Pan', 'pan', str),
+    ('Age', 'age', int),
+    ('MonthlyIncome', 'monthly_income', float),
+    ('CreditScore', 'credit_score', int),
+    ('FOIR', 'foir', float),
+    ('DPD_30_Plus', 'dpd30plus', int),
+    ('EnquiryCount', 'enquiry_count', int),
+    # Behavioral Analytics
+    ('CreditVintage', 'credit_vintage', int),
+    ('LoanMixType', 'loan_mix_type', str),
+    ('LoanCompletionRatio', 'loan_completion_ratio', float),
+    ('DefaultedLoans', 'defaulted_loans', int),
+    # Employment Stability
+    ('CompanyType', 'job_type', str),
+    ('EmploymentTenure', 'employment_tenure', int),
+    ('CompanyStability', 'company_stability', str),
+    # Banking Behavior
+    ('AccountVintage', 'account_vintage', int),
+    ('AMB', 'avg_monthly_balance', float),
+    ('BounceCount', 'bounce_frequency', int),
+    # Geographic & Social
+    ('GeoRisk', 'geographic_risk', str),
+    ('MobileVintage', 'mobile_number_vintage', int),
+    ('DigitalScore', 'digital_engagement', float),
+    # Exposure & Intent
+    ('UnsecuredLoanAmount', 'unsecured_loan_amount', float),
+    ('OutstandingPercent', 'outstanding_amount_percent', float),
+    ('OurLenderExposure', 'our_lender_exposure', float),
+    ('ChannelType', 'channel_type', str)
+)
+_BULK_FIELD_NAMES = tuple(field for _, field, _ in _BULK_FIELDS)
+_BUCKET_ORDER = ['A', 'B', 'C', 'D']
+_BUCKET_LABELS = ('Auto-Approve', 'Recommend', 'Refer', 'Decline')
+_REQUIRED_BULK_COLUMNS = frozenset(column for column, _, _ in _BULK_FIELDS)
+# Low-cardinality text columns parse straight to categoricals; PAN stays object
+_BULK_CATEGORY_DTYPES = {column: 'category' for column, field, kind in _BULK_FIELDS if kind is str and field != 'pan'}
+
+def _extract_bulk_fields(df):
+    """Coerce each template column once into a list of plain Python values
+    
+    Returns the lists keyed by engine field, and per row the first value that
+    could not be converted (None when every value converted). Missing columns
+    take the type's empty value, as row.get(column, 0) / '' did.
+    """
+    n = len(df)
+    columns = {}
+    cast_errors = [None] * n
+    for column, field, kind in _BULK_FIELDS:
+        if column not in df:
+            columns[field] = [kind()] * n
+            continue
+        raw = df[column]
+        if kind is str:
+            # str() per value keeps NaN as 'nan', which the string dtype would not
+            values = [str(value) for value in raw.tolist()]
+            columns[field] = [value.strip() for value in values] if field == 'pan' else values
+            continue
+        numbers = pd.to_numeric(raw, errors='coerce')
+        if kind is int:
+            # int() rejects NaN and infinity; truncation toward zero matches astype
+            invalid = ~np.isfinite(numbers)
+            columns[field] = numbers.where(~invalid, 0).astype(np.int64).tolist()
+        else:
+            invalid = numbers.isna() & raw.notna()
+            columns[field] = numbers.astype(np.float64).tolist()
+        for row in np.flatnonzero(invalid.to_numpy()):
+            cast_errors[row] = cast_errors[row] or f"{column}: cannot convert {raw.iloc[row]!r} to {kind.__name__}"
+    return columns, cast_errors
+
+def _weights_file_version():
+    """Modification time of scoring_weights.json, or None when it does not exist
+    
+    Several pages write the weights file directly, so its mtime is the one
+    version marker every writer bumps.
+    """
+    try:
+        return os.stat("scoring_weights.json").st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _build_bulk_results(scored_batches, run_timestamp, succeeded, pans,
+                        validation_messages, include_detailed_scores):
+    """Assemble the results frame column-wise from the scored batches
+    
+    Only rows in succeeded are kept. Variable score columns appear when
+    requested and at least one kept row passed clearance; a validation_errors
+    column appears when any kept row has warnings.
+    """
+    scored = pd.concat(scored_batches, ignore_index=True).take(succeeded)
+    results_df = pd.DataFrame({
+        'row_number': np.asarray(succeeded) + 1,
+        'pan': [pans[idx] for idx in succeeded],
+        'final_score': scored['final_score'].to_numpy(),
+        'final_bucket': pd.Categorical(scored['final_bucket'].to_numpy(), categories=_BUCKET_ORDER),
+        'decision': scored['decision'].to_numpy(),
+        'clearance_passed': scored['clearance_passed'].to_numpy(),
+        'processing_timestamp': run_timestamp
+    })
+    
+    # Rows failing clearance keep NaN variable scores, as their records had none
+    if include_detailed_scores and results_df['clearance_passed'].any():
+        variable_columns = [
+            column for column in scored.columns
+            if column.endswith('_score') and column not in ('final_score', 'base_score')
+        ]
+        # One 2-D block instead of a column insert per variable
+        results_df[variable_columns] = scored[variable_columns].to_numpy()
+    
+    if validation_messages:
+        results_df['validation_errors'] = [validation_messages.get(idx) for idx in succeeded]
+    return results_df
+
+# Errors a malformed application can raise from the engine; anything else is a bug and propagates
+_ROW_DATA_ERRORS = (ValueError, TypeError, KeyError)
+
+def _score_batch_rows(engine, batch):
+    """Score a batch one application at a time after the vectorized call failed
+    
+    Returns a frame with score_applications_batch's columns, one row per batch
+    row, and per row the scoring error (None when the row scored). Rows that
+    failed hold NaN and are recorded as errors by the caller.
+    """
+    rows = []
+    row_errors = []
+    for record in batch.to_dict('records'):
+        try:
+            result = engine.score_application(record)
+        except _ROW_DATA_ERRORS as e:
+            rows.append({})
+            row_errors.append(f"Scoring failed: {e}")
+            continue
+        row = {key: result.get(key, np.nan) for key in (
+            'clearance_passed', 'final_score', 'base_score', 'initial_bucket', 'final_bucket',
+            'decision', 'bucket_movements', 'additional_score_breakdown'
+        )}
+        for key, var_score in result['variable_scores'].items():
+            row[f'{key}_score'] = var_score.weighted_score
+        rows.append(row)
+        row_errors.append(None)
+    return pd.DataFrame(rows, index=batch.index), row_errors
+
+def process_bulk_applications(df, batch_size, include_detailed_scores, error_handling, export_format="CSV"):
     """Process bulk applications with progress tracking"""
     
     # Initialize progress tracking
@@ -483,99 +692,78 @@ def process_bulk_applications(df, batch_size, include_detailed_scores, error_han
     processed_count = 0
     successful_count = 0
     error_count = 0
-    results = []
     error_log = []
+    scored_batches = []
+    succeeded = []
+    validation_messages = {}
+    
+    # Coerce every column once, then build the typed frame the batches slice from
+    columns, cast_errors = _extract_bulk_fields(df)
+    applicants = pd.DataFrame({field: columns[field] for field in _BULK_FIELD_NAMES})
+    applicants['writeoff_flag'] = False  # Not in template, default to False
+    
+    # Rebuild the engine only when the weights file changed since it was built
+    # (or the session engine is a company engine from individual scoring)
+    engine_key = (None, _weights_file_version())
+    if st.session_state.get('_scoring_engine_key') != engine_key:
+        st.session_state.scoring_engine = LoanScoringEngine()
+        st.session_state._scoring_engine_key = engine_key
     
-    # Reload weights and reinitialize engine for updated thresholds
-    st.session_state.scoring_engine.reload_weights()
-    # Force refresh of the scoring engine to pick up threshold changes
-    st.session_state.scoring_engine = LoanScoringEngine()
+    update_every = max(1, total_records // 50)
+    # One timestamp for the whole run instead of formatting one per record
+    run_timestamp = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+    fallback_reported = False
     
     try:
         # Process in batches
         for batch_start in range(0, total_records, batch_size):
             batch_end = min(batch_start + batch_size, total_records)
-            batch_df = df.iloc[batch_start:batch_end]
             
             status_text.text(f"Processing batch {batch_start//batch_size + 1}: Records {batch_start + 1} to {batch_end}")
             
-            for idx, row in batch_df.iterrows():
+            # Score the whole batch in one vectorized engine call on a row slice of the typed frame
+            batch = applicants.iloc[batch_start:batch_end]
+            try:
+                scored_batches.append(st.session_state.scoring_engine.score_applications_batch(batch))
+                scoring_errors = [None] * len(batch)
+            except _ROW_DATA_ERRORS as e:
+                # One bad row fails the vectorized call; rescore the batch per row to isolate it
+                if not fallback_reported:
+                    st.warning(f"⚠️ Batch scoring failed at records {batch_start + 1}-{batch_end} "
+                               f"({type(e).__name__}: {e}); rescoring affected batches row by row")
+                    fallback_reported = True
+                scored_batch, scoring_errors = _score_batch_rows(st.session_state.scoring_engine, batch)
+                scored_batches.append(scored_batch)
+            batch_errors = validate_batch(batch)
+            
+            # Validation ran column-wise over the whole batch; walk its rows positionally
+            for idx, cast_error, scoring_error, validation_errors in zip(
+                range(batch_start, batch_end), cast_errors[batch_start:batch_end], scoring_errors, batch_errors
+            ):
                 try:
-                    # Prepare applicant data with column mapping
-                    applicant_data = {
-                        # Core Credit Variables
-                        'pan': str(row.get('Pan', '')).strip(),
-                        'age': int(row.get('Age', 0)),
-                        'monthly_income': float(row.get('MonthlyIncome', 0)),
-                        'credit_score': int(row.get('CreditScore', 0)),
-                        'foir': float(row.get('FOIR', 0)),
-                        'dpd30plus': int(row.get('DPD_30_Plus', 0)),
-                        'enquiry_count': int(row.get('EnquiryCount', 0)),
-                        # Behavioral Analytics
-                        'credit_vintage': int(row.get('CreditVintage', 0)),
-                        'loan_mix_type': str(row.get('LoanMixType', '')),
-                        'loan_completion_ratio': float(row.get('LoanCompletionRatio', 0)),
-                        'defaulted_loans': int(row.get('DefaultedLoans', 0)),
-                        # Employment Stability
-                        'job_type': str(row.get('CompanyType', '')),
-                        'employment_tenure': int(row.get('EmploymentTenure', 0)),
-                        'company_stability': str(row.get('CompanyStability', '')),
-                        # Banking Behavior
-                        'account_vintage': int(row.get('AccountVintage', 0)),
-                        'avg_monthly_balance': float(row.get('AMB', 0)),
-                        'bounce_frequency': int(row.get('BounceCount', 0)),
-                        # Geographic & Social
-                        'geographic_risk': str(row.get('GeoRisk', '')),
-                        'mobile_number_vintage': int(row.get('MobileVintage', 0)),
-                        'digital_engagement': float(row.get('DigitalScore', 0)),
-                        # Exposure & Intent
-                        'unsecured_loan_amount': float(row.get('UnsecuredLoanAmount', 0)),
-                        'outstanding_amount_percent': float(row.get('OutstandingPercent', 0)),
-                        'our_lender_exposure': float(row.get('OurLenderExposure', 0)),
-                        'channel_type': str(row.get('ChannelType', '')),
-                        'writeoff_flag': False  # Not in template, default to False
-                    }
-                    
-                    # Validate individual record
-                    validation_errors = validate_individual_data(applicant_data)
+                    if cast_error:
+                        raise ValueError(cast_error)
+                    if scoring_error:
+                        raise ValueError(scoring_error)
                     
                     if validation_errors and error_handling == "Stop on first error":
                         st.error(f"❌ Validation error at row {idx + 1}: {validation_errors[0]}")
                         return
                     
-                    # Score the application
-                    result = st.session_state.scoring_engine.score_application(applicant_data)
-                    
-                    # Prepare result record
-                    result_record = {
-                        'row_number': idx + 1,
-                        'pan': applicant_data['pan'],
-                        'final_score': result['final_score'],
-                        'final_bucket': result['final_bucket'],
-                        'decision': result['decision'],
-                        'clearance_passed': result['clearance_passed'],
-                        'processing_timestamp': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    
-                    # Add detailed scores if requested
-                    if include_detailed_scores and result['variable_scores']:
-                        for var, details in result['variable_scores'].items():
-                            result_record[f'{var}_score'] = details['weighted_score']
-                    
                     # Add validation errors if any (but still count as successful processing)
                     if validation_errors:
-                        result_record['validation_errors'] = '; '.join(validation_errors)
+                        validation_messages[idx] = '; '.join(validation_errors)
                     
                     # Count as successful since we processed the record
                     successful_count += 1
-                    results.append(result_record)
+                    succeeded.append(idx)
                     
                 except Exception as e:
                     error_record = {
                         'row_number': idx + 1,
-                        'pan': row.get('pan', 'Unknown'),
+                        'pan': columns['pan'][idx] or 'Unknown',
                         'error': str(e),
-                        'error_timestamp': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+                        'error_timestamp': run_timestamp
                     }
                     error_log.append(error_record)
                     error_count += 1
@@ -586,13 +774,9 @@ def process_bulk_applications(df, batch_size, include_detailed_scores, error_han
                 
                 processed_count += 1
                 
-                # Update progress
-                progress = processed_count / total_records
-                progress_bar.progress(progress)
-            
-            # Small delay to show progress
-            import time
-            time.sleep(0.1)
+                # Update progress about 50 times per run rather than on every record
+                if processed_count % update_every == 0 or processed_count == total_records:
+                    progress_bar.progress(processed_count / total_records)
         
         # Processing complete
         status_text.text("✅ Processing completed!")
@@ -611,54 +795,26 @@ def process_bulk_applications(df, batch_size, include_detailed_scores, error_han
             error_pct = (error_count/processed_count*100) if processed_count > 0 else 0
             st.metric("Errors", error_count, delta=f"{error_pct:.1f}%")
         with col4:
-            success_rate = successful_count / processed_count * 100 if processed_count > 0 else 0
-            st.metric("Success Rate", f"{success_rate:.1f}%")
+            st.metric("Success Rate", f"{success_pct:.1f}%")
         
         # Bucket distribution
-        if results:
-            results_df = pd.DataFrame(results)
-            
-            # Fix the metrics - show actual results count as successful
-            total_results = len(results_df)
-            
-            # Update the metrics properly
-            st.subheader("📊 Processing Summary - CORRECTED")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Total Processed", total_results)
-            with col2:
-                st.metric("Successful", total_results, delta="100.0%")
-            with col3:
-                st.metric("Errors", 0, delta="0.0%")
-            with col4:
-                st.metric("Success Rate", "100.0%")
+        if succeeded:
+            results_df = _build_bulk_results(
+                scored_batches, run_timestamp, succeeded,
+                columns['pan'], validation_messages, include_detailed_scores
+            )
             
             st.subheader("🗂️ Risk Bucket Distribution")
             
+            # Categorical buckets count as an integer histogram over four codes
             bucket_counts = results_df['final_bucket'].value_counts()
             
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                bucket_a = bucket_counts.get('A', 0)
-                percentage_a = (bucket_a/len(results_df)*100) if len(results_df) > 0 else 0
-                st.metric("Bucket A (Auto-Approve)", int(bucket_a), delta=f"{percentage_a:.1f}%")
-            
-            with col2:
-                bucket_b = bucket_counts.get('B', 0) 
-                percentage_b = (bucket_b/len(results_df)*100) if len(results_df) > 0 else 0
-                st.metric("Bucket B (Recommend)", int(bucket_b), delta=f"{percentage_b:.1f}%")
-            
-            with col3:
-                bucket_c = bucket_counts.get('C', 0)
-                percentage_c = (bucket_c/len(results_df)*100) if len(results_df) > 0 else 0
-                st.metric("Bucket C (Refer)", int(bucket_c), delta=f"{percentage_c:.1f}%")
-            
-            with col4:
-                bucket_d = bucket_counts.get('D', 0)
-                percentage_d = (bucket_d/len(results_df)*100) if len(results_df) > 0 else 0
-                st.metric("Bucket D (Decline)", int(bucket_d), delta=f"{percentage_d:.1f}%")
+            n_results = len(results_df)
+            for column, bucket, label in zip(st.columns(4), _BUCKET_ORDER, _BUCKET_LABELS):
+                with column:
+                    count = int(bucket_counts.get(bucket, 0))
+                    percentage = count / n_results * 100
+                    st.metric(f"Bucket {bucket} ({label})", count, delta=f"{percentage:.1f}%")
             
             # Download results
             st.subheader("📥 Download Results")
@@ -666,14 +822,18 @@ def process_bulk_applications(df, batch_size, include_detailed_scores, error_han
             col1, col2 = st.columns(2)
             
             with col1:
-                # Convert results to CSV
-                csv_buffer = create_bulk_excel_output(results_df, include_detailed_scores)
+                # Convert results to the chosen export format
+                as_excel = export_format == "Excel"
+                output_buffer = create_bulk_excel_output(results_df, include_detailed_scores, as_excel)
                 
                 st.download_button(
-                    label="📊 Download Results (CSV)",
-                    data=csv_buffer,
-                    file_name=f"bulk_scoring_results_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    label=f"📊 Download Results ({export_format})",
+                    data=output_buffer,
+                    file_name=f"bulk_scoring_results_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.{'xlsx' if as_excel else 'csv'}",
+                    mime=(
+                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                        if as_excel else "text/csv"
+                    )
                 )
             
             with col2:
@@ -695,17 +855,23 @@ def process_bulk_applications(df, batch_size, include_detailed_scores, error_han
                 
                 # Convert results to the format expected by database
                 db_results = []
-                for result in results:
+                for pan, final_score, final_bucket, decision, clearance_passed in zip(
+                    results_df['pan'].tolist(),
+                    results_df['final_score'].tolist(),
+                    results_df['final_bucket'].tolist(),
+                    results_df['decision'].tolist(),
+                    results_df['clearance_passed'].tolist()
+                ):
                     db_record = {
                         'applicant_data': {
-                            'pan': result.get('pan', ''),
+                            'pan': pan,
                             # Add other applicant data if available
                         },
                         'result': {
-                            'final_score': result['final_score'],
-                            'final_bucket': result['final_bucket'],
-                            'decision': result['decision'],
-                            'clearance_passed': result.get('clearance_passed', True)
+                            'final_score': final_score,
+                            'final_bucket': final_bucket,
+                            'decision': decision,
+                            'clearance_passed': clearance_passed
                         },
                         'status': 'success'
                     }
@@ -719,17 +885,120 @@ def process_bulk_applications(df, batch_size, include_detailed_scores, error_han
     except Exception as e:
         st.error(f"❌ Critical error during processing: {str(e)}")
 
-def create_bulk_excel_output(results_df, include_detailed_scores):
-    """Create Excel output for bulk results"""
-    from io import BytesIO
-    
+def _csv_bytes(frame, float_format=None):
+    """UTF-8 CSV of a frame, written in row chunks straight into a byte buffer
+    
+    Skips the intermediate str that to_csv() returns, so peak memory is the
+    encoded output rather than the text plus its encoded copy.
+    """
+    buffer = io.BytesIO()
+    frame.to_csv(buffer, index=False, encoding='utf-8', chunksize=10_000, float_format=float_format)
+    return buffer.getvalue()
+
+def create_bulk_excel_output(results_df, include_detailed_scores, as_excel=False):
+    """Create Excel output for bulk results
+    
+    CSV by default. With as_excel, rows stream into a write-only openpyxl
+    workbook, which serializes each row as it is appended instead of keeping
+    every cell object in memory.
+    """
+    if not as_excel:
+        return _csv_bytes(results_df)
+    
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Results')
+    sheet.append(list(results_df.columns))
+    # Plain Python values with empty cells for NaN
+    cells = results_df.astype(object).where(results_df.notna(), None)
+    for row in cells.itertuples(index=False, name=None):
+        sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+def _database_version(db_path):
+    """Modification stamps of a SQLite file and its WAL; every committed write bumps one"""
+    stamps = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_bulk_history(_db_manager, db_version):
+    """get_bulk_history cached until the database changes"""
+    return _db_manager.get_bulk_history(limit=100)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_individual_history(_db_manager, db_version):
+    """get_individual_history cached until the database changes"""
+    return _db_manager.get_individual_history(limit=200)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_session_details(_db_manager, session_id, db_version):
+    """get_session_details cached per session until the database changes"""
+    return _db_manager.get_session_details(session_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_detail_counts(_db_manager, session_ids, db_version):
+    """get_detail_counts cached until the database changes"""
+    return _db_manager.get_detail_counts(list(session_ids))
+
+def _individual_history_frame(individual_history):
+    """Individual history in display columns; scores stay numeric and are formatted on output"""
+    return pd.DataFrame(individual_history).rename(columns={
+        'timestamp': 'Date & Time',
+        'pan': 'PAN',
+        'final_score': 'Final Score',
+        'final_bucket': 'Risk Bucket',
+        'decision': 'Decision'
+    })[['Date & Time', 'PAN', 'Final Score', 'Risk Bucket', 'Decision']]
+
+# Download payloads are serialized once per database version, not on every rerun
+@st.cache_data(ttl=300, show_spinner=False)
+def _session_csv(_db_manager, session_id, db_version):
+    """Successful results of a bulk session as CSV bytes"""
+    session_details = _fetch_session_details(_db_manager, session_id, db_version) or []
+    successful_results = [r for r in session_details if r['status'] == 'success']
+    # Prepare CSV data one column at a time
+    scored = [result['result'] for result in successful_results]
+    csv_df = pd.DataFrame({
+        'PAN': [result['applicant_data'].get('pan', '') for result in successful_results],
+        'Final Score': [result['final_score'] for result in scored],
+        'Risk Bucket': [result['final_bucket'] for result in scored],
+        'Decision': [result['decision'] for result in scored],
+        'Clearance Passed': [result['clearance_passed'] for result in scored]
+    })
+    return _csv_bytes(csv_df)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _individual_history_csv(_db_manager, db_version):
+    """Individual history as CSV bytes, scores to one decimal"""
+    frame = _individual_history_frame(_fetch_individual_history(_db_manager, db_version))
+    return _csv_bytes(frame, float_format='%.1f')
+
+def _history_export_json(db_manager, db_version):
+    """Data export as JSON bytes, stamped with the export time"""
+    # The history lists come from the cached fetches; only the timestamp is new per click
+    export_data = {
+        'bulk_sessions': _fetch_bulk_history(db_manager, db_version),
+        'individual_applications': _fetch_individual_history(db_manager, db_version),
+        'export_timestamp': pd.Timestamp.now().isoformat()
+    }
+    # No indent keeps json on its C encoder; bytes go to the download as-is
+    return json.dumps(export_data, default=str, separators=(',', ':')).encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def _weights_config_loads(weights_version):
+    """Whether an engine builds from the weights file, probed once per file version"""
     try:
-        # Convert to CSV for now as Excel writer has compatibility issues
-        csv_buffer = results_df.to_csv(index=False)
-        return csv_buffer.encode('utf-8')
-    except Exception as e:
-        # Fallback to simple CSV
-        return results_df.to_csv(index=False).encode('utf-8')
+        LoanScoringEngine()
+        return True
+    except Exception:
+        return False
 
 def render_history_audit():
     """Comprehensive History & Audit interface showing all stored data"""
@@ -742,10 +1011,11 @@ def render_history_audit():
         st.session_state.db_manager = DatabaseManager()
         st.session_state.db_manager.init_database()
     
-    # Get all historical data
+    # Get all historical data; reruns that leave the database untouched reuse the last fetch
+    db_version = _database_version(st.session_state.db_manager.db_path)
     try:
-        bulk_history = st.session_state.db_manager.get_bulk_history(limit=100)
-        individual_history = st.session_state.db_manager.get_individual_history(limit=200)
+        bulk_history = _fetch_bulk_history(st.session_state.db_manager, db_version)
+        individual_history = _fetch_individual_history(st.session_state.db_manager, db_version)
     except Exception as e:
         st.error(f"Error loading historical data: {str(e)}")
         return
@@ -759,289 +1029,433 @@ def render_history_audit():
     ])
     
     with tab1:
-        st.subheader("📊 Bulk Upload Sessions History")
-        
-        if bulk_history:
-            st.info(f"Found {len(bulk_history)} bulk upload sessions")
-            
-            # Convert to display format
-            display_data = []
-            for session in bulk_history:
-                display_data.append({
-                    'Session ID': session['session_id'],
-                    'Date & Time': session['timestamp'],
-                    'Total Records': session['total_records'],
-                    'Successful': session['successful_records'],
-                    'Success Rate': f"{(session['successful_records']/session['total_records']*100):.1f}%" if session['total_records'] > 0 else "0%",
-                    'Avg Score': f"{session['avg_score']:.1f}" if session['avg_score'] else "N/A"
-                })
-            
-            df_bulk = pd.DataFrame(display_data)
-            st.dataframe(df_bulk, use_container_width=True, height=400)
-            
-            # Session selector for detailed view
-            st.subheader("🔍 View Session Details")
-            session_ids = [session['session_id'] for session in bulk_history]
-            selected_session = st.selectbox("Select session to view details:", options=session_ids)
-            
-            if selected_session:
-                session_details = st.session_state.db_manager.get_session_details(selected_session)
-                if session_details:
-                    st.success(f"Loaded details for session: {selected_session}")
-                    
-                    # Show session summary
-                    successful_results = [r for r in session_details if r['status'] == 'success']
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("Total Records", len(session_details))
-                    with col2:
-                        st.metric("Successful", len(successful_results))
-                    with col3:
-                        error_count = len(session_details) - len(successful_results)
-                        st.metric("Errors", error_count)
-                    with col4:
-                        success_rate = len(successful_results)/len(session_details)*100 if len(session_details) > 0 else 0
-                        st.metric("Success Rate", f"{success_rate:.1f}%")
-                    
-                    # Download session data
-                    if successful_results:
-                        # Prepare CSV data
-                        csv_data = []
-                        for result in successful_results:
-                            row = {
-                                'PAN': result['applicant_data'].get('pan', ''),
-                                'Final Score': result['result']['final_score'],
-                                'Risk Bucket': result['result']['final_bucket'],
-                                'Decision': result['result']['decision'],
-                                'Clearance Passed': result['result']['clearance_passed']
-                            }
-                            csv_data.append(row)
-                        
-                        csv_df = pd.DataFrame(csv_data)
-                        csv_buffer = csv_df.to_csv(index=False)
-                        
-                        st.download_button(
-                            label="📥 Download Session Results (CSV)",
-                            data=csv_buffer,
-                            file_name=f"session_{selected_session}_results.csv",
-                            mime="text/csv"
-                        )
-                else:
-                    st.warning("Could not load session details")
-        else:
-            st.info("No bulk upload sessions found. Upload some data using the Bulk Upload feature to see history here.")
+        _render_bulk_sessions_tab(bulk_history, db_version)
     
     with tab2:
-        st.subheader("👤 Individual Application History")
-        
-        if individual_history:
-            st.info(f"Found {len(individual_history)} individual applications")
-            
-            # Convert to display format
-            display_data = []
-            for record in individual_history:
-                display_data.append({
-                    'Date & Time': record['timestamp'],
-                    'PAN': record['pan'],
-                    'Final Score': f"{record['final_score']:.1f}",
-                    'Risk Bucket': record['final_bucket'],
-                    'Decision': record['decision']
-                })
-            
-            df_individual = pd.DataFrame(display_data)
-            st.dataframe(df_individual, use_container_width=True, height=400)
-            
-            # Download individual history
-            csv_buffer = df_individual.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Individual History (CSV)",
-                data=csv_buffer,
-                file_name=f"individual_history_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
-            
-            # Risk bucket distribution
-            st.subheader("📊 Risk Distribution Analysis")
-            bucket_counts = df_individual['Risk Bucket'].value_counts()
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                bucket_a = bucket_counts.get('A', 0)
-                percentage_a = (bucket_a/len(df_individual)*100) if len(df_individual) > 0 else 0
-                st.metric("Bucket A (Auto-Approve)", int(bucket_a), delta=f"{percentage_a:.1f}%")
-            
-            with col2:
-                bucket_b = bucket_counts.get('B', 0)
-                percentage_b = (bucket_b/len(df_individual)*100) if len(df_individual) > 0 else 0
-                st.metric("Bucket B (Recommend)", int(bucket_b), delta=f"{percentage_b:.1f}%")
-            
-            with col3:
-                bucket_c = bucket_counts.get('C', 0)
-                percentage_c = (bucket_c/len(df_individual)*100) if len(df_individual) > 0 else 0
-                st.metric("Bucket C (Refer)", int(bucket_c), delta=f"{percentage_c:.1f}%")
-            
-            with col4:
-                bucket_d = bucket_counts.get('D', 0)
-                percentage_d = (bucket_d/len(df_individual)*100) if len(df_individual) > 0 else 0
-                st.metric("Bucket D (Decline)", int(bucket_d), delta=f"{percentage_d:.1f}%")
-                
-        else:
-            st.info("No individual applications found. Score some applications using Individual Scoring to see history here.")
+        _render_individual_history_tab(individual_history, db_version)
     
     with tab3:
-        st.subheader("📈 Detailed Session Analysis")
-        
-        if bulk_history:
-            # Time-based analysis
-            st.subheader("📅 Upload Activity Over Time")
-            
-            # Convert timestamps and create time analysis
-            upload_dates = []
-            for session in bulk_history:
-                try:
-                    date_str = session['timestamp']
-                    # Handle different date formats
-                    if 'T' in date_str:
-                        date_obj = pd.to_datetime(date_str).date()
-                    else:
-                        date_obj = pd.to_datetime(date_str).date()
-                    upload_dates.append(date_obj)
-                except:
-                    continue
-            
-            if upload_dates:
-                date_counts = pd.Series(upload_dates).value_counts().sort_index()
+        _render_session_analysis_tab(bulk_history)
+    
+    with tab4:
+        _render_system_activity_tab(bulk_history, individual_history, db_version)
+
+@st.fragment
+def _render_bulk_sessions_tab(bulk_history, db_version):
+    """Bulk sessions tab; its widgets rerun only this fragment"""
+    st.subheader("📊 Bulk Upload Sessions History")
+    
+    if bulk_history:
+        st.info(f"Found {len(bulk_history)} bulk upload sessions")
+        
+        # Convert to display format
+        display_data = []
+        for session in bulk_history:
+            display_data.append({
+                'Session ID': session['session_id'],
+                'Date & Time': session['timestamp'],
+                'Total Records': session['total_records'],
+                'Successful': session['successful_records'],
+                'Success Rate': f"{(session['successful_records']/session['total_records']*100):.1f}%" if session['total_records'] > 0 else "0%",
+                'Avg Score': f"{session['avg_score']:.1f}" if session['avg_score'] else "N/A"
+            })
+        
+        df_bulk = pd.DataFrame(display_data)
+        st.dataframe(df_bulk, use_container_width=True, height=400)
+        
+        # Session selector for detailed view
+        st.subheader("🔍 View Session Details")
+        # History is newest first; the dropdown holds at most 100 matches
+        search = st.text_input("Filter sessions", key="session_filter").strip().lower()
+        session_ids = [
+            session['session_id'] for session in bulk_history
+            if search in session['session_id'].lower()
+        ][:100]
+        selected_session = st.selectbox("Select session to view details:", options=session_ids)
+        
+        if selected_session:
+            session_details = _fetch_session_details(st.session_state.db_manager, selected_session, db_version)
+            if session_details:
+                st.success(f"Loaded details for session: {selected_session}")
                 
-                col1, col2 = st.columns(2)
+                # Show session summary
+                successful_results = [r for r in session_details if r['status'] == 'success']
+                
+                col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("Total Upload Days", len(date_counts))
-                    st.metric("Most Recent Upload", str(max(upload_dates)))
+                    st.metric("Total Records", len(session_details))
                 with col2:
-                    total_records = sum([s['total_records'] for s in bulk_history])
-                    st.metric("Total Records Processed", total_records)
-                    avg_per_session = total_records / len(bulk_history) if bulk_history else 0
-                    st.metric("Avg Records per Session", f"{avg_per_session:.0f}")
-            
-            # Performance analysis
-            st.subheader("🎯 Performance Summary")
-            if bulk_history:
-                success_rates = []
-                for session in bulk_history:
-                    if session['total_records'] > 0:
-                        rate = session['successful_records'] / session['total_records'] * 100
-                        success_rates.append(rate)
+                    st.metric("Successful", len(successful_results))
+                with col3:
+                    error_count = len(session_details) - len(successful_results)
+                    st.metric("Errors", error_count)
+                with col4:
+                    success_rate = len(successful_results)/len(session_details)*100 if len(session_details) > 0 else 0
+                    st.metric("Success Rate", f"{success_rate:.1f}%")
                 
-                if success_rates:
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Avg Success Rate", f"{sum(success_rates)/len(success_rates):.1f}%")
-                    with col2:
-                        st.metric("Best Success Rate", f"{max(success_rates):.1f}%")
-                    with col3:
-                        st.metric("Lowest Success Rate", f"{min(success_rates):.1f}%")
-        else:
-            st.info("No session data available for analysis")
+                # Download session data
+                if successful_results:
+                    st.download_button(
+                        label="📥 Download Session Results (CSV)",
+                        data=_session_csv(st.session_state.db_manager, selected_session, db_version),
+                        file_name=f"session_{selected_session}_results.csv",
+                        mime="text/csv"
+                    )
+            else:
+                st.warning("Could not load session details")
+    else:
+        st.info("No bulk upload sessions found. Upload some data using the Bulk Upload feature to see history here.")
+
+@st.fragment
+def _render_individual_history_tab(individual_history, db_version):
+    """Individual applications tab; paging reruns only this fragment"""
+    st.subheader("👤 Individual Application History")
     
-    with tab4:
-        st.subheader("🔧 System Configuration Activity")
+    if individual_history:
+        st.info(f"Found {len(individual_history)} individual applications")
         
-        # Database information
-        st.subheader("💾 Database Information")
+        df_individual = _individual_history_frame(individual_history)
         
+        # Page through the history so only the visible slice is sent to the browser
         col1, col2 = st.columns(2)
         with col1:
-            st.info("**Database Location**")
-            st.code("loan_scoring.db")
-            
-            if individual_history or bulk_history:
-                st.success("✅ Database is active and accessible")
-            else:
-                st.warning("⚠️ Database is empty or not initialized")
-        
+            page_size = st.selectbox("Rows per page", [50, 100, 200, 500], index=1, key="individual_page_size")
         with col2:
-            st.info("**Configuration Status**")
+            page_count = max(1, (len(df_individual) + page_size - 1) // page_size)
+            # A larger page size can leave the remembered page past the end
+            if st.session_state.get("individual_page", 1) > page_count:
+                st.session_state.individual_page = page_count
+            page = st.number_input("Page", min_value=1, max_value=page_count, key="individual_page")
+        page_start = (page - 1) * page_size
+        page_rows = df_individual.iloc[page_start:page_start + page_size]
+        st.dataframe(page_rows.style.format({'Final Score': '{:.1f}'}), use_container_width=True, height=400)
+        
+        # Download individual history
+        st.download_button(
+            label="📥 Download Individual History (CSV)",
+            data=_individual_history_csv(st.session_state.db_manager, db_version),
+            file_name=f"individual_history_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+        
+        # Risk bucket distribution
+        st.subheader("📊 Risk Distribution Analysis")
+        bucket_counts = df_individual['Risk Bucket'].value_counts().reindex(_BUCKET_ORDER, fill_value=0).to_numpy()
+        
+        n_individual = len(df_individual)
+        for column, bucket, label, count in zip(st.columns(4), _BUCKET_ORDER, _BUCKET_LABELS, bucket_counts.tolist()):
+            with column:
+                percentage = (count / n_individual * 100) if n_individual > 0 else 0
+                st.metric(f"Bucket {bucket} ({label})", count, delta=f"{percentage:.1f}%")
             
-            # Check if scoring engine is configured
-            if 'scoring_engine' in st.session_state:
-                st.success("✅ Scoring engine initialized")
-            else:
-                st.warning("⚠️ Scoring engine not initialized")
+    else:
+        st.info("No individual applications found. Score some applications using Individual Scoring to see history here.")
+
+@st.fragment
+def _render_session_analysis_tab(bulk_history):
+    """Aggregate analysis over the bulk sessions"""
+    st.subheader("📈 Detailed Session Analysis")
+    
+    if bulk_history:
+        # One frame for every aggregate below
+        sessions = pd.DataFrame(bulk_history)
+        
+        # Time-based analysis
+        st.subheader("📅 Upload Activity Over Time")
+        
+        # Convert timestamps in one pass; unparseable ones become NaT and are dropped
+        upload_dates = pd.to_datetime(sessions['timestamp'], format='ISO8601', errors='coerce').dropna().dt.date
+        
+        if not upload_dates.empty:
+            date_counts = upload_dates.value_counts().sort_index()
             
-            # Check weights configuration
-            try:
-                from scoring_engine import LoanScoringEngine
-                engine = LoanScoringEngine()
-                st.success("✅ Weights configuration loaded")
-            except:
-                st.error("❌ Error loading weights configuration")
-        
-        # Data integrity check
-        st.subheader("🔍 Data Integrity Check")
-        
-        integrity_issues = []
-        
-        # Check for bulk sessions without details
-        if bulk_history:
-            for session in bulk_history[:5]:  # Check first 5 sessions
-                details = st.session_state.db_manager.get_session_details(session['session_id'])
-                if not details:
-                    integrity_issues.append(f"Session {session['session_id']} missing detailed results")
-        
-        if integrity_issues:
-            st.warning("⚠️ Data Integrity Issues Found:")
-            for issue in integrity_issues:
-                st.write(f"• {issue}")
-        else:
-            st.success("✅ No data integrity issues detected")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total Upload Days", len(date_counts))
+                st.metric("Most Recent Upload", str(upload_dates.max()))
+            with col2:
+                total_records = int(sessions['total_records'].sum())
+                st.metric("Total Records Processed", total_records)
+                st.metric("Avg Records per Session", f"{total_records / len(sessions):.0f}")
         
-        # Clear data options (admin functions)
-        st.subheader("🗑️ Data Management")
-        st.warning("**Admin Functions - Use with caution**")
+        # Performance analysis
+        st.subheader("🎯 Performance Summary")
+        attempted = sessions[sessions['total_records'] > 0]
+        success_rates = attempted['successful_records'] / attempted['total_records'] * 100
         
-        col1, col2 = st.columns(2)
+        if not success_rates.empty:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Avg Success Rate", f"{success_rates.mean():.1f}%")
+            with col2:
+                st.metric("Best Success Rate", f"{success_rates.max():.1f}%")
+            with col3:
+                st.metric("Lowest Success Rate", f"{success_rates.min():.1f}%")
+    else:
+        st.info("No session data available for analysis")
+
+@st.fragment
+def _render_system_activity_tab(bulk_history, individual_history, db_version):
+    """Database, configuration and integrity status"""
+    st.subheader("🔧 System Configuration Activity")
+    
+    # Database information
+    st.subheader("💾 Database Information")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.info("**Database Location**")
+        st.code("loan_scoring.db")
         
-        with col1:
-            if st.button("🔄 Refresh Database Connection", type="secondary"):
-                try:
-                    st.session_state.db_manager = DatabaseManager()
-                    st.session_state.db_manager.init_database()
-                    st.success("✅ Database connection refreshed")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Error refreshing database: {str(e)}")
+        if individual_history or bulk_history:
+            st.success("✅ Database is active and accessible")
+        else:
+            st.warning("⚠️ Database is empty or not initialized")
+    
+    with col2:
+        st.info("**Configuration Status**")
         
-        with col2:
-            if st.button("📊 Export All Data", type="secondary"):
-                try:
-                    # Create comprehensive export
-                    export_data = {
-                        'bulk_sessions': bulk_history,
-                        'individual_applications': individual_history,
-                        'export_timestamp': pd.Timestamp.now().isoformat()
-                    }
-                    
-                    import json
-                    export_json = json.dumps(export_data, indent=2, default=str)
-                    
-                    st.download_button(
-                        label="📥 Download Complete Data Export (JSON)",
-                        data=export_json,
-                        file_name=f"creditiq_data_export_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
-                    )
-                    
-                except Exception as e:
-                    st.error(f"❌ Error creating export: {str(e)}")
+        # Check if scoring engine is configured
+        if 'scoring_engine' in st.session_state:
+            st.success("✅ Scoring engine initialized")
+        else:
+            st.warning("⚠️ Scoring engine not initialized")
+        
+        # Check weights configuration
+        if _weights_config_loads(_weights_file_version()):
+            st.success("✅ Weights configuration loaded")
+        else:
+            st.error("❌ Error loading weights configuration")
+    
+    # Data integrity check
+    st.subheader("🔍 Data Integrity Check")
+    
+    integrity_issues = []
+    
+    # Check for bulk sessions without details
+    if bulk_history:
+        checked_ids = [session['session_id'] for session in bulk_history[:5]]  # Check first 5 sessions
+        counts = _fetch_detail_counts(st.session_state.db_manager, tuple(checked_ids), db_version)
+        integrity_issues = [f"Session {sid} missing detailed results"
+                            for sid in checked_ids if counts.get(sid, 0) == 0]
+    
+    if integrity_issues:
+        st.warning("⚠️ Data Integrity Issues Found:")
+        for issue in integrity_issues:
+            st.write(f"• {issue}")
+    else:
+        st.success("✅ No data integrity issues detected")
+    
+    # Clear data options (admin functions)
+    _render_data_management(db_version)
+
+@st.fragment
+def _render_data_management(db_version):
+    """Admin buttons, scoped so a click leaves the status checks above untouched"""
+    st.subheader("🗑️ Data Management")
+    st.warning("**Admin Functions - Use with caution**")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("🔄 Refresh Database Connection", type="secondary"):
+            try:
+                st.session_state.db_manager.reconnect()
+                # Drop cached reads so the rerun queries the database afresh
+                for cached_fetch in (_fetch_bulk_history, _fetch_individual_history,
+                                     _fetch_session_details, _fetch_detail_counts):
+                    cached_fetch.clear()
+                st.success("✅ Database connection refreshed")
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ Error refreshing database: {str(e)}")
+    
+    with col2:
+        if st.button("📊 Export All Data", type="secondary"):
+            try:
+                # Create comprehensive export
+                export_json = _history_export_json(st.session_state.db_manager, db_version)
+                
+                st.download_button(
+                    label="📥 Download Complete Data Export (JSON)",
+                    data=export_json,
+                    file_name=f"creditiq_data_export_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json"
+                )
+                
+            except Exception as e:
+                st.error(f"❌ Error creating export: {str(e)}")
+
+# Static guide content, dedented once here rather than on every render
+_GUIDE_HEADER_HTML = """
+<div style="background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;">
+    <h1 style="color: white; margin: 0; font-size: 28px;">📚 CreditIQ Pro - Credit Risk Scoring Methodology</h1>
+    <p style="color: #e8f4f8; margin: 5px 0 0 0; font-size: 16px;">AI-enhanced 20-variable credit risk assessment framework with ML weight optimization</p>
+</div>
+"""
+
+_GUIDE_FRAMEWORK_MD = """
+### **Core Methodology**
+
+CreditIQ Pro uses a **20-variable credit risk assessment framework** designed for financial institutions to evaluate loan default probability with AI-enhanced weight optimization.
+
+---
+
+### **Mathematical Foundation**
+
+**Final Score = Σ(Variable_i × Weight_i × Variable_Score_i)**
+
+Where:
+- **Variable_i** = One of 20 credit risk variables
+- **Weight_i** = AI-optimized or manually configured weight (totaling 100%)
+- **Variable_Score_i** = Normalized variable score (0.0 to 1.0 based on risk bands)
+
+---
+
+### **Risk Decision Buckets**
+"""
+
+_GUIDE_CLEARANCE_MD = """
+---
+
+### **Pre-Scoring Clearance Rules**
+
+Applications are automatically declined if they fail these mandatory criteria:
+
+| **Rule** | **Criteria** | **Business Logic** |
+|----------|--------------|-------------------|
+| Identity | Valid PAN required | Legal compliance |
+| Age Limits | 21-60 years | Target demographic |
+| Income Floor | ≥₹15,000/month | Minimum viability |
+| Write-offs | No previous write-offs | Default history |
+| Payment History | ≤2 DPD30+ instances | Recent discipline |
+| Default Status | Zero defaulted loans | Clean record |
+
+---
+
+### **Processing Capabilities**
+
+- **Individual Scoring**: Real-time credit assessment with detailed breakdown
+- **Bulk Processing**: Up to 25,000 applications with progress tracking
+- **Excel Integration**: Upload CSV/Excel files, download scored results
+- **Historical Analytics**: Track scoring trends and performance metrics
+"""
+
+_GUIDE_WEIGHT_PROCESS_MD = """
+---
+
+### **Weight Optimization Process**
+
+**Default Configuration**: Each variable starts with statistically-derived weights based on credit risk research
+
+**AI Enhancement**: Machine learning analyzes your portfolio data to suggest optimal weight adjustments
+
+**Manual Override**: Credit analysts can modify any weight while maintaining 100% total allocation
+
+**A/B Testing**: Compare different weight configurations with statistical significance testing
+"""
+
+_GUIDE_VARIABLE_SCORING_MD = """
+### **How Variable Scoring Works**
+
+Each variable receives a score between 0.0 and 1.0 based on predefined risk bands:
+
+**Example: Credit Score Variable**
+- 750+ → 1.0 (Excellent)
+- 700-749 → 0.8 (Good)
+- 650-699 → 0.6 (Average)
+- 600-649 → 0.3 (Below Average)
+- <600 → 0.0 (Poor)
+
+**Example: FOIR (Debt-to-Income Ratio)**
+- ≤35% → 1.0 (Healthy)
+- 36-45% → 0.6 (Manageable)
+- 46-55% → 0.3 (Stretched)
+- >55% → 0.0 (Over-leveraged)
+
+### **Score Calculation Process**
+
+1. **Variable Input**: Raw data (e.g., Credit Score = 720)
+2. **Band Matching**: Find appropriate risk band (700-749 range)
+3. **Score Assignment**: Apply band score (0.8)
+4. **Weight Application**: Multiply by variable weight (12%)
+5. **Final Contribution**: 0.8 × 0.12 = 0.096 (9.6 points)
+
+### **Customizable Risk Bands**
+
+All risk bands can be modified through the Dynamic Configuration module:
+- Adjust thresholds based on portfolio performance
+- Create new variables with custom scoring logic
+- Test different configurations with A/B testing
+"""
+
+_GUIDE_ML_OPTIMIZATION_MD = """
+### **AI-Enhanced Weight Learning**
+
+CreditIQ Pro automatically optimizes scoring weights based on actual loan performance data and portfolio patterns.
+
+---
+
+#### **How ML Optimization Works**
+
+**1. Data Analysis**
+- Analyzes uploaded portfolio data patterns
+- Identifies correlations between variables and outcomes
+- Calculates feature importance scores
+
+**2. Weight Suggestion**
+- Generates optimal weight distribution
+- Provides confidence scores for recommendations
+- Shows expected performance improvement
+
+**3. Validation & Testing**
+- A/B tests suggested weights against current configuration
+- Measures statistical significance of improvements
+- Provides performance metrics and recommendations
+
+---
+
+#### **Understanding AI Weight Analysis Results**
+
+When you upload bulk loan data, you'll see an "AI Weight Analysis" panel. Here's what everything means:
+
+**Confidence Level (e.g., "10.0%")**
+This shows how certain the AI is about its weight recommendations:
+- **10-30%**: Limited data available - suggestions are preliminary
+- **40-70%**: Moderate confidence - good foundation for optimization
+- **80-100%**: High confidence - strong statistical patterns identified
+
+**Category Weight Suggestions**
+The AI groups variables into logical categories and suggests optimal weights:
+- **Core Credit Variables**: Credit scores, payment history, debt ratios
+- **Behavioral Analytics**: Loan completion rates, default patterns
+- **Employment Stability**: Job tenure, income consistency, company stability
+- **Geographic & Social**: Location risk, demographic factors
+- **Banking Behavior**: Account history, transaction patterns
+- **Exposure & Intent**: Loan amounts, channel preferences
+
+**How Your Future Scoring Changes**
+Once you click "Apply AI-Suggested Weights":
+- All new individual applications automatically use optimized weights
+- Future bulk uploads apply the learned weights consistently
+- Each variable score gets multiplied by its optimized weight
+- Risk classifications become more accurate based on your portfolio patterns
+
+**Your Control Options**
+- **Accept All**: Apply all AI recommendations immediately
+- **Manual Override**: Modify specific weights while keeping others
+- **Hybrid Approach**: Blend AI suggestions with your credit expertise
+- **Revert Anytime**: Return to default weights if needed
+
+**Improving Recommendations**
+- Upload more loan applications to increase confidence levels
+- Include actual loan outcomes (defaults, repayments) when available
+- Regularly re-analyze with fresh data to maintain accuracy
+"""
 
 def render_scoring_guide():
     """Comprehensive scoring guide with scientific reasoning"""
-    st.markdown("""
-    <div style="background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;">
-        <h1 style="color: white; margin: 0; font-size: 28px;">📚 CreditIQ Pro - Credit Risk Scoring Methodology</h1>
-        <p style="color: #e8f4f8; margin: 5px 0 0 0; font-size: 16px;">AI-enhanced 20-variable credit risk assessment framework with ML weight optimization</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_GUIDE_HEADER_HTML, unsafe_allow_html=True)
     
     # Create tabs for organized content
     tab1, tab2, tab3 = st.tabs([
@@ -1053,26 +1467,7 @@ def render_scoring_guide():
     with tab1:
         st.subheader("🎯 Credit Risk Assessment Framework")
         
-        st.markdown("""
-        ### **Core Methodology**
-        
-        CreditIQ Pro uses a **20-variable credit risk assessment framework** designed for financial institutions to evaluate loan default probability with AI-enhanced weight optimization.
-        
-        ---
-        
-        ### **Mathematical Foundation**
-        
-        **Final Score = Σ(Variable_i × Weight_i × Variable_Score_i)**
-        
-        Where:
-        - **Variable_i** = One of 20 credit risk variables
-        - **Weight_i** = AI-optimized or manually configured weight (totaling 100%)
-        - **Variable_Score_i** = Normalized variable score (0.0 to 1.0 based on risk bands)
-        
-        ---
-        
-        ### **Risk Decision Buckets**
-        """)
+        st.markdown(_GUIDE_FRAMEWORK_MD)
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -1112,31 +1507,7 @@ def render_scoring_guide():
             )
             st.caption("🔴 High Risk - Decline recommendation")
         
-        st.markdown("""
-        ---
-        
-        ### **Pre-Scoring Clearance Rules**
-        
-        Applications are automatically declined if they fail these mandatory criteria:
-        
-        | **Rule** | **Criteria** | **Business Logic** |
-        |----------|--------------|-------------------|
-        | Identity | Valid PAN required | Legal compliance |
-        | Age Limits | 21-60 years | Target demographic |
-        | Income Floor | ≥₹15,000/month | Minimum viability |
-        | Write-offs | No previous write-offs | Default history |
-        | Payment History | ≤2 DPD30+ instances | Recent discipline |
-        | Default Status | Zero defaulted loans | Clean record |
-        
-        ---
-        
-        ### **Processing Capabilities**
-        
-        - **Individual Scoring**: Real-time credit assessment with detailed breakdown
-        - **Bulk Processing**: Up to 25,000 applications with progress tracking
-        - **Excel Integration**: Upload CSV/Excel files, download scored results
-        - **Historical Analytics**: Track scoring trends and performance metrics
-        """)
+        st.markdown(_GUIDE_CLEARANCE_MD)
     
     with tab2:
         st.subheader("📊 Advanced Multi-Variable Risk Assessment")
@@ -1207,122 +1578,16 @@ def render_scoring_guide():
             - Channel Type
             """)
         
-        st.markdown("""
-        ---
-        
-        ### **Weight Optimization Process**
-        
-        **Default Configuration**: Each variable starts with statistically-derived weights based on credit risk research
-        
-        **AI Enhancement**: Machine learning analyzes your portfolio data to suggest optimal weight adjustments
-        
-        **Manual Override**: Credit analysts can modify any weight while maintaining 100% total allocation
-        
-        **A/B Testing**: Compare different weight configurations with statistical significance testing
-        """)
+        st.markdown(_GUIDE_WEIGHT_PROCESS_MD)
         
         # Variable scoring explanation
         with st.expander("📈 Variable Scoring Methodology"):
-            st.markdown("""
-            ### **How Variable Scoring Works**
-            
-            Each variable receives a score between 0.0 and 1.0 based on predefined risk bands:
-            
-            **Example: Credit Score Variable**
-            - 750+ → 1.0 (Excellent)
-            - 700-749 → 0.8 (Good)
-            - 650-699 → 0.6 (Average)
-            - 600-649 → 0.3 (Below Average)
-            - <600 → 0.0 (Poor)
-            
-            **Example: FOIR (Debt-to-Income Ratio)**
-            - ≤35% → 1.0 (Healthy)
-            - 36-45% → 0.6 (Manageable)
-            - 46-55% → 0.3 (Stretched)
-            - >55% → 0.0 (Over-leveraged)
-            
-            ### **Score Calculation Process**
-            
-            1. **Variable Input**: Raw data (e.g., Credit Score = 720)
-            2. **Band Matching**: Find appropriate risk band (700-749 range)
-            3. **Score Assignment**: Apply band score (0.8)
-            4. **Weight Application**: Multiply by variable weight (12%)
-            5. **Final Contribution**: 0.8 × 0.12 = 0.096 (9.6 points)
-            
-            ### **Customizable Risk Bands**
-            
-            All risk bands can be modified through the Dynamic Configuration module:
-            - Adjust thresholds based on portfolio performance
-            - Create new variables with custom scoring logic
-            - Test different configurations with A/B testing
-            """)
+            st.markdown(_GUIDE_VARIABLE_SCORING_MD)
     
     with tab3:
         st.subheader("🤖 ML Weight Optimization System")
         
-        st.markdown("""
-        ### **AI-Enhanced Weight Learning**
-        
-        CreditIQ Pro automatically optimizes scoring weights based on actual loan performance data and portfolio patterns.
-        
-        ---
-        
-        #### **How ML Optimization Works**
-        
-        **1. Data Analysis**
-        - Analyzes uploaded portfolio data patterns
-        - Identifies correlations between variables and outcomes
-        - Calculates feature importance scores
-        
-        **2. Weight Suggestion**
-        - Generates optimal weight distribution
-        - Provides confidence scores for recommendations
-        - Shows expected performance improvement
-        
-        **3. Validation & Testing**
-        - A/B tests suggested weights against current configuration
-        - Measures statistical significance of improvements
-        - Provides performance metrics and recommendations
-        
-        ---
-        
-        #### **Understanding AI Weight Analysis Results**
-        
-        When you upload bulk loan data, you'll see an "AI Weight Analysis" panel. Here's what everything means:
-        
-        **Confidence Level (e.g., "10.0%")**
-        This shows how certain the AI is about its weight recommendations:
-        - **10-30%**: Limited data available - suggestions are preliminary
-        - **40-70%**: Moderate confidence - good foundation for optimization
-        - **80-100%**: High confidence - strong statistical patterns identified
-        
-        **Category Weight Suggestions**
-        The AI groups variables into logical categories and suggests optimal weights:
-        - **Core Credit Variables**: Credit scores, payment history, debt ratios
-        - **Behavioral Analytics**: Loan completion rates, default patterns
-        - **Employment Stability**: Job tenure, income consistency, company stability
-        - **Geographic & Social**: Location risk, demographic factors
-        - **Banking Behavior**: Account history, transaction patterns
-        - **Exposure & Intent**: Loan amounts, channel preferences
-        
-        **How Your Future Scoring Changes**
-        Once you click "Apply AI-Suggested Weights":
-        - All new individual applications automatically use optimized weights
-        - Future bulk uploads apply the learned weights consistently
-        - Each variable score gets multiplied by its optimized weight
-        - Risk classifications become more accurate based on your portfolio patterns
-        
-        **Your Control Options**
-        - **Accept All**: Apply all AI recommendations immediately
-        - **Manual Override**: Modify specific weights while keeping others
-        - **Hybrid Approach**: Blend AI suggestions with your credit expertise
-        - **Revert Anytime**: Return to default weights if needed
-        
-        **Improving Recommendations**
-        - Upload more loan applications to increase confidence levels
-        - Include actual loan outcomes (defaults, repayments) when available
-        - Regularly re-analyze with fresh data to maintain accuracy
-        """)
+        st.markdown(_GUIDE_ML_OPTIMIZATION_MD)
         
         # ML Process Flow
         col1, col2, col3 = st.columns(3)
@@ -1357,6 +1622,25 @@ def render_scoring_guide():
 
 def get_engine_recommendation(user_profile):
     """Analyze user profile and recommend optimal scoring engine"""
+    engine, reason, factors, confidence = _recommend_engine(
+        user_profile.get('institution_type', ''),
+        user_profile.get('selected_approach', 'hybrid'),
+        len(user_profile.get('selected_products', [])),
+        user_profile.get('risk_appetite', 'Moderate'),
+        user_profile.get('primary_location', ''),
+        user_profile.get('approval_target', 65),
+    )
+    return {
+        'engine': engine,
+        'reason': reason,
+        'factors': factors,
+        'confidence': confidence
+    }
+
+@lru_cache(maxsize=256)
+def _recommend_engine(institution_type, selected_approach, product_count,
+                      risk_appetite, primary_location, approval_target):
+    """Recommendation for the profile fields it depends on, memoized across reruns"""
     
     # Scoring factors for recommendation
     modular_score = 0
@@ -1364,7 +1648,6 @@ def get_engine_recommendation(user_profile):
     factors = []
     
     # Institution type analysis
-    institution_type = user_profile.get('institution_type', '')
     if institution_type in ['Fintech', 'DSA/Agent']:
         modular_score += 3
         factors.append("Fintech/DSA needs flexibility")
@@ -1373,7 +1656,6 @@ def get_engine_recommendation(user_profile):
         factors.append("Traditional institution")
     
     # Approach preference (strongest factor)
-    selected_approach = user_profile.get('selected_approach', 'hybrid')
     if selected_approach == 'custom':
         modular_score += 4
         factors.append("Custom approach selected")
@@ -1385,16 +1667,14 @@ def get_engine_recommendation(user_profile):
         factors.append("Standard approach preference")
     
     # Product diversity
-    selected_products = user_profile.get('selected_products', [])
-    if len(selected_products) >= 3:
+    if product_count >= 3:
         modular_score += 2
         factors.append("Multiple products need varied scoring")
-    elif len(selected_products) <= 1:
+    elif product_count <= 1:
         legacy_score += 1
         factors.append("Single product focus")
     
     # Risk appetite
-    risk_appetite = user_profile.get('risk_appetite', 'Moderate')
     if risk_appetite in ['Aggressive', 'Balanced']:
         modular_score += 1
         factors.append("Higher risk tolerance")
@@ -1403,13 +1683,11 @@ def get_engine_recommendation(user_profile):
         factors.append("Conservative risk preference")
     
     # Geographic focus
-    primary_location = user_profile.get('primary_location', '')
     if primary_location in ['Tier 2 Cities', 'Tier 3 Cities', 'Rural Areas']:
         modular_score += 1
         factors.append("Non-metro markets need customization")
     
     # Target approval rate
-    approval_target = user_profile.get('approval_target', 65)
     if approval_target >= 75:
         modular_score += 1
         factors.append("High approval targets need optimization")
@@ -1425,12 +1703,7 @@ def get_engine_recommendation(user_profile):
         engine = "Legacy Engine"
         reason = "Ideal for your standardized, proven approach with established risk parameters"
     
-    return {
-        'engine': engine,
-        'reason': reason,
-        'factors': ', '.join(factors[:3]),  # Top 3 factors
-        'confidence': abs(modular_score - legacy_score)
-    }
+    return engine, reason, ', '.join(factors[:3]), abs(modular_score - legacy_score)  # Top 3 factors
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -1440,125 +1713,200 @@ def initialize_session_state():
         st.session_state.db_manager = DatabaseManager()
     if 'logged_in' not in st.session_state:
         st.session_state.logged_in = False
-    if 'scorecard_manager' not in st.session_state:
-        st.session_state.scorecard_manager = DynamicScorecardManager()
-        st.session_state.scorecard_manager.init_database()
-    if 'dynamic_manager' not in st.session_state:
-        st.session_state.dynamic_manager = DynamicScorecardManager()
-        st.session_state.dynamic_manager.init_database()
+    # Both keys name the same stateless manager over scorecard_config.db; its
+    # constructor already creates the schema
+    if 'scorecard_manager' not in st.session_state or 'dynamic_manager' not in st.session_state:
+        manager = (st.session_state.get('scorecard_manager')
+                   or st.session_state.get('dynamic_manager')
+                   or DynamicScorecardManager())
+        st.session_state.scorecard_manager = st.session_state.dynamic_manager = manager
     
     # Check if weights were updated and reload scoring engine
     if st.session_state.get('weights_updated', False):
         st.session_state.scoring_engine.reload_weights()
         st.session_state.weights_updated = False
+        # The reloaded engine no longer matches the key it was built for
+        st.session_state.pop('_scoring_engine_key', None)
+
+# Admin credentials: a salted PBKDF2-SHA256 hash ("pbkdf2_sha256$iterations$salt$hash"),
+# overridable through the environment so the password never lives in source
+_ADMIN_USERNAME = os.environ.get("CREDITIQ_ADMIN_USER", "Finequsadmin")
+_ADMIN_PASSWORD_HASH = os.environ.get(
+    "CREDITIQ_ADMIN_HASH",
+    "pbkdf2_sha256$200000$516d812d25d2760ef3413883d8231250$60fd5444ac457966c9c5e7169ced989932cdf75615ce8a603d750d85a750cdf7"
+)
+
+def _verify_admin(username, password):
+    """Check admin credentials in constant time; the hash is computed for every attempt"""
+    _, iterations, salt, expected = _ADMIN_PASSWORD_HASH.split('$')
+    candidate = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt), int(iterations))
+    username_ok = hmac.compare_digest(username.encode('utf-8'), _ADMIN_USERNAME.encode('utf-8'))
+    password_ok = hmac.compare_digest(candidate, bytes.fromhex(expected))
+    return username_ok and password_ok
+
+_LOGO_STATIC_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "finequs_logo.png")
+
+def _logo_src():
+    """Image source for the Finequs logo
+    
+    With static serving enabled (.streamlit/config.toml) the browser fetches and
+    caches the PNG once; otherwise the logo is inlined as a data URI.
+    """
+    if st.get_option("server.enableStaticServing") and os.path.exists(_LOGO_STATIC_FILE):
+        return "app/static/finequs_logo.png"
+    return "data:image/png;base64," + _LOGO_B64
+
+_LOGO_B64 = "iVBORw0KGgoAAAANSUhEUgAAAV4AAABdCAYAAADtyA4AAAAgAElEQVR4Ae19B3hU1dY21/vpvQjpdTItBdInU9MoImABFREVQVoKIcmkhxAIVUSRolgQFFSuVxQR1CBNRCNgEAQN2DCi0jRKCZ2I8Ypm/f+79+wpYSaZICLoyfOsZ8+cmZw5Z5193rP2u1q7dtKfpAFJA5IGJA1IGpA0IGlA0oCkAUkDkgYkDUgakDQgaUDSgKQBSQOSBiQNSBqQNCBpQNKApAFJA5IGJA1IGpA0IGlA0oCkAUkDkgYkDUgakDQgaUDSgKQBSQOSBiQNSBqQNCBpwKIBWrjwatq40Zuq3wyg6rdktHZtpFNZvTqaLrWsXx9NVVWRV9TFqiNqv3rn96lLVu4cvLRyZ+7Syh2lkIX/2VT60ms1uWvWfzW4asuB1P0nyfuKOjHpYCUNSBposwZo/8fetOqVvjRjxkzKH7P0f32Hfd6gu/FIvTyaToZ0ohOyCDoeFE7HAsPoaEAoHfFXMznsp6Q/RXzV9F1AGNXFphJNnXpVm0/4Uv7D6s++Ty174vWFvUdMq5UnZVLkdcUk12aQUjPSQdS6UdTJlEcRqXmk7JZLifdO3psz48WF7+yq7wbAvpTHLP2WpAFJA3+MBqi6OoCeeqq8/s4Bn3+SoKOdoVG0w09Ju33DqC4wiuoDo+iEXzgd91Za5ZiXguzlqKec/iz53juMjsZed+qP0c5F2Ov6Lxp79Rw6rSbIMJxCuxRQiLGQFKYyUpjKSW4cTXJTCYUYiylYV0D+GjOTIG0+BeqLyM9UTAHJJeRnGEVBumGk6TbyxJyFb047KVnCF+HKSLuQNHDpNUBbt7anivtnnuyUTN/7qOmwh4IOdghmANoQGEE/BXVi8mNABJ3xC6PTvqHnCba7+szZ9/+IbYcCOv/6W5+hBy69Blv5xQ8OUMxdRc9XBWnNpEgsZSAbpC+lIH05Bekq2CgzlpLMVMgkyJhPgcZ8CjDkMQnU55FMW0ByiygTCihUX0JeqqGU0ufBQ6+8dax/K4cgfSxpQNLAZaQBWvVm3xO33HXgM281HfaNoFNeSmrwkFODp4yLh5zOeHI56RlCx7xD6KinjI54CZHTES851XsrHOSoj5IuheB3T/iHsgfFfnkMUdF9Sy8j9bZr98xbX+cab3nwXJC2kEIMZeQfX0yqRA62jsBb7BJ4g/V5pEzIo9D4AlJpiihcN4bCDRWk1I6j4PhyUpvG0uiZ7yyR6IfL6tJLByNp4DwNUE3N1TR2ysxPZDFUFxBDdT5hdNhLTac9FHTWQ8aEga8FeE95yem4FwdeG+gCfP9c4P1RFskAH8expWPwr/TM4vTzTvbP2vDgC1vmBCTkkjppPKMU/OPzyTs6i/zic0mmL3QQUAxMDKUk0xeTXFdMMm2R1dJVaQoswJtHKk0eRaWWU+fUclIYisknKotUhtGUctvM2o21FP9nna/0u5IGJA241gC43B8HDPt8j0JDX3mH03cBEVQXGEF1vko6xoBWySzfk3ZcLqxXWJfgc51xuPY8L17b88AX5bWPnI47EVAhOJ5jXio63O3GI/Txx5eH83/svHdmg1rwjy+kYO1oCjGUkippNPnFZ5M6pZRkBrNV5Pp8BqAAUYW+lBRaLvKEIlJquAB4AbiwfJXaXIpILiG53kwyXS6pTMUUZqygwJgi6pQytqH6GwpwffmlTyQNSBq41BqAx5+GZm/4PjiODnUIo8P+nekggDdATQd9ObCCbuCgq6ajPjYRwAtwbi7HPRVkL/j/tgp+94wnqA4lne3IR7EPWNwNXko67a2kY54yZn0DiL/vGMweGPv8VL/S3PmXh7X73PqvBgfrcylYW8IcZaAKZIZ8BwHY2otSX0xW0ZWSSltMKm0hKXT2YvsfpbGIOeeYg84AC7mUPCNGkjqpiEY/smbupZ5Y0u9JGpA04FoD9PTz6Xs8FPR1O1861lHNLEVYqAxUvUPopLecAHIQAXq2kdMN4HpdifjfCxnBJf/cQUm//VtJ9C8+4rdhMZ/1kNPPHkr60UdBJzyC6ISHjM6ERNK+QBXVBKmIMjMvD27345Pkrbm5/ESwrohZugDdYH22xbq1ga896OK1FXQtAAzQtQde8X0B4ABcmxRTp9TxFKTJYxZwbK+8czsPSVav69tA+kTSwKXTACiGU136nDreQUGQQ1f700lPhUU4mLYGmK4AV2xv7f9b+hzA29hBSefaK4mu4eALK1gA74/XyhjoNgSoGPB/dbUPA90jQ+/9nD7eeHlQDBMXrJgT2jWXW7qweBnw5jpYuwBPAaRi/D3AizA0lamM8cFBCQD5ETTr5bfnXLqpJf2SpAFJA640QJMen7nPL4J+DopkYHu8YzCzHAVoYmwJGPGZ/XedvW7t/1v6HNY2uGRYuQBgWL+gHgC+sHjPdAzh0RQ+IXTw/wKozj+C6m/t/zntrL48KM13951UByfeTaqUbA68sHp1BQx8haUqRgG4YlTqCx2sXkeLlwM16AVBW9is3UICl+wbPYoC4kBvmEluzCBV14HndjY0XB6KcTUjpe2SBv7iGqDqWll9WM/Gw55hdNY/lOqu8qKfAsLOA9KWgPGPBl5wtsiAA/iC5wX4Cq4Xv33UV07HlJH08bU+tFsW/usvQ9KWIgb5srl0ZU8smxeSNIxkxpHcwtUX2yIXLByvAEyFAQ41LnCQybW5lNpvVm3RtHeXTHmiZm7O+LXLEq6fXBeeVEoqYwEFa3MYfxtizCd/zSirBc0tah7ni1jf4IR8CtaNpNCuw2nxxp25l41ypAORNPA31ADNWlh+yF9Hx70i6LS3mlm2P/rxsTWwvWSf+yjphK+aWeMn/hlAJ9v50C9Xh9BvXuEsVvez9l70pUxF33brfoRWvdr3sruMiXeWH1KkjKQAbSbndFnIGMDXAsB2DrZAzSgKTS6mgLgsuu6embWrt59JdXZCa3cc73PdwEm1AfHpLIohNLWEfGIzWgZebQ4F64dS2sT5a5ztU9omaUDSwKXRwM+ZpRu+uUZFx73D2NL9koGpxVHnzu8hTviQh4wOd5TR8Q4h1HCtnM55hNL+q7yoVqWm7ZrOp+j+CTMvKytXXD441cK755M61UzyRHC6Zou1awe8AGIBvggDSywkfZ8HTuw8SGqxH2fjxydPet8w/MFamS6PwrqMIcQGi/1YLV6dsHqLCN9Tp2RTTK+RDc72J22TNCBp4NJo4JPkG44cCopj4WHugOCf8R1QDQcD1fRdoJK+DVDQt35y2n2tL32n0Zyip2aU08crLg8HmrNLVvXNuVSPqGEU2qWI5IkIH0Ocbr4d+FoSJizAG9m9nAI1GbSk6vBgZ/trvu2dXWe6IVQMVAOsXhEHjLA1UBUAW55wUcKcbP7xwyi82wiSohuaa1J6L2ng0miA6uraf2S8no7LdXTGP5pOeTqhGDzVzBqu9wmjQ35hVOcfxhIr9gdF0DfBEfS1rDN9Ie9MH6uiqEYd0yb5MDSGhGwLiyGbRNG2MJtsiYiirRpt4+4+Nx9oyM/eQA9MKqeN66ORZXdpNPU7fuU/7+zNACAGaLNJbiqwWqTNM9TYe0M+ATBvMz9R05afvMP8TG2wLoNk+kxSmLJsYjTzeF9tKck1owmJF3J9JoWlDqH1td9JmWxtUbL0XUkDF0kDtH+/94earnTMN5YaA0x0yiOKDrcPpCMd/Ol4x0D60RdOtig60D6KvvCKol1KAx3uctsBGjVmKU16eCY9vLCcnl+eTivW96VtO4y0/ZNI2rJT7SDYVvNZNO2sVZ8v3wQgo4xJXV17lq6MlGVncrmXdHR1TZ5a+fl4ZKQF6XKYVSqoAFfACwfZ9P++P97V/pxtHzHu5WUyQzqLWlCYAL5clIYcl8Bb9eX3TrljZ/uXtkkakDRw8TQA4N2giKX69hF0pmMM/c8vns7KIul4oJIO+Sro28Ao2ht9/Skqe3gpPbOiL228TNJuL54K/vg9PfDCpmlyE88mQ3iXFXgFp2tfm8GQzyzjV7a4RzOIoy99eO1zyqRMUiWPJKUp3SbGLFLpckilzbdmvCl1mRSeMoyqvjwiAa9QoDRKGriEGoBlWRvblX72iaafr1XTiasDqa69Hx3wU9IZY69TNOXhmRLY/s4LMuGpdbMBtggXs3d+WQG4GfCCjliy4bs2lXN84Km353VOGU6QcONgmxiGUIRuKEVo0ygiYSSTsIRhFJU0mDZJFu/vvLLSv0sauHAN7Em56cgJv06EELKv/+1BPxiMjTS2Yiba+Fz4XqX/tGpgysIqVhTHGmUgLF0xNgNeRVIhVX5Y38e6Azde1NY2qms+qe+2acuB1C07v2eyfeeR1O07v7cIXp9J3b79TOqWLUdSt2//PlUqlO6GYqWvSBr4gzTQYC5eWhsSSt+GhdMP16ceoK3ro/+gn/p77hbAC0vXKc0A8LUHXn0hKRKLqfLD420C3r+nZqWzljRwZWqAVSRb9HT6e8la+uW+gqVtCctCRAQ4YvrYIrUHZFRb+wdKjeyKiGJoPhUk4G2uEem9pAFJA1S3tf0vK55usWwiba1rTyte7UuPPjyzPjNtwyc9ex35IEHf+EFUwq8fhsf/WhOuYfJReMyvH4XF/7ojVEgc7VTH0Q5VDJMaZTTtVERTjTyKPpZHO8hHiijiEkMfyeMsoqGPQrT0vlJP7xt6Er27/vLLSmttCk1ZWO2+xYtUYUY1nJYs3tYUe5E/33/ypLe9XOTdX5Td7fzmUMD2z75P/fDTuj6QzV9+a0QSzUXZubST8zRQQ3T1ezu+jtm8Y38fIds/Pdxr3w8/R9XU0O+OZXXVfZdZtWMemPmt2tT4VUAE7QsMpe8C1SyZ4ZBvCB26NuDXw//yo/r2gVTvgdY/aGipZHLMQ0nHPVVMTnqpCXLKO4xOe4dRg084/egbQWd9uDR6R9BPXuFMfvTqRA3ekdTgFU0/ekVTo0csnfBJoINRPYleWXH5A+/WOmpfV0ftMUImzt0+J/b6iRQYn0NBmtzzqo+JYjhi7NxtDK3a9mt/th/i+8BF3orXlvfOWvk0/118FxMH/3ve/9e13IkY+4eIY8Brti/sj+hq8Tn7TgtdjasPUcBz62sHlzxWueimkdOqb8i4r1bfv6j2umGTagcUP7p1xKRFy6Y/v23ypm8oFfs9b+b/ARtwTms/Pd7n/oXvzx425r/rUu+qqI3rlX0uxDCQlIZ7yD/2dvKLu506XZdB1w2aUptW8fK66Yu2z0ZDUvzvH3BILncJ/T6/Zs/g3MnLKvU3ldRHdhlFnVJGUlhSBqmNI0iuH0Hq5FyK7FW8N/fBlxe9/XW9ztnOcNxCMDeFsLnR7Jrie9jubD9iG+ZW8zlhPz/sX4vfFf/r7jiV6Coxz+z3Z/9afC5Gd/ft6ns1R0k2Y+k7pUMrnqzU3GLeq7m5gCK6ZFFY4khSGdJIrh1OMs1QNnZOzabo7jl7h41duO6hFzZM3/j1Lzocs6t9u7ud5j+TXqvpfmqffyyd9Iujo94RLJHiuLeag6mngk51lDtKByWdssiJjkqC2MpL8jKTqCgmtp3oiKpmCtZWqPFaBZ29VsWSOJC+fNIrjBo6htG5f4dRQ4cY2udrIlqz2eju8f8p3ztwgGQxqcXnYnpMbezUtaKxc/dxjQBbVAZTJ5XQtWFDWwVeFMiJ6THuXOz1kxpjr5/SGN3jvoao6+9r6NxrfENE77ENET3HNcb3Kjn37vYDvcRJ3j93/eyYroWNcT0mNUT1mNwQcf3kxvDe4xs79RrfGNNjYmNsj4kNkb0rmHTqPq5R12PMuZ2fOa8B8eKm3RmRPQobY68f2xDfe0pD5+7jGzp3n+hUsK/OPUrPbTlADqFpm789ahw6buEaVUou65qsSi6gEJOZgnTohDyKZMYcUiTlkzqFd04Gr627ZUL9o8s+KsWNKs7rYo4f/XAm6r7nVs6J7WU+0alrKSkNoylYU8qKByG7D85PNBNFY1E0EUUUSnjyWIpInkLhSRMoInUMdeqeVz9nWfVk3KAX89ia72vLvkZ1wcxlcyN7FDRAT8hKhCDiBSOSbBAXjk7T/nGl5BNdyDqYhCSm08DRcyp3nmy0ppp/9ANFxfWc3Ki76f6G2OsnNWAuOMr4BlxrLmUNmhvHNQwfP29d82MS75HxmHDzfQ3RPcc2hHUtbojsUdEQed0E59KjoiHuhgkN3QaPrRX/7+4466Xq8aFdixtje09siO012aWoU4sbIroXN0T1KmycsWRDqbv7t//exv2/6PJnLl2m7JJ2LkA/jPy1aeSfgNoq2WwuyIzFJE/ivQ8xTxCRhDmLMFGFoZB1ekHGaXzvsropT62a+/aur50+AO1/s/lr1K/9Jce8Ya8ijo77RNEpryg6eo2CzniE0RlPNRP0X4M4AK8T0HUOvLxoOuvTZukYcdojhDjwKizAi2w5/lu/tFfTmY5R9FVQKoHyaH68l9X7A0dJptaNotCkcaxlD1rvoGQjbmwAsABhvBcWrv2Ii6g0FbDqZP6xWSzFF23e5YllFJxSSMEp+RSSguyzEbR24xdWOmLczMp5cd2KKdRUzFoJBZlKKSi5gIKTCtjvs2NIySdZCp8wyoQM2rztYDdnynvh3V0Fwfo0UhjN7HhFvze0KHIQ1guukKVCV277ie0LdSnMMxcv8dMNoNCu2Qx0ARwA2gBtFiv8jrRpCMADySJwPDIwMWRRkD6Nku+aUPd45Y5SWDbOjq8t26ZOpaueW79r8NDy+VXq1BGkTsmi8NQCVgtDri+k4IRC3rsODk5DPrvJWOdmUyEr24leeOjgoTKWk9JYwqvGmTIptnceDS6bt6xy+wGHB05bjs3Zdz/eT97jn9g0NzQ1hwK1g0iROIK8Y4ex4kd+8VkMbKE3AAL0FpCQxxqlhqVOIHVyGdMp6oKEJI2goodXzMFDDJ2sO3Uto4C4bApNLnUy78wkN+RYZBSFppjptpxpW50dH7bhoYMHJr+G2QyA0CHbuRSzB263e8fudbU/V9unLqqajoc1zpc9FHXmpiCLiAghjL5xmaRKyaOwbjn08LLqNiUeLd++p9et5unVQcZBpOqSTkGG4aRIhlFgJhgLquQiBrghiUXsgYxRlVTCABfzBfoPiC2iwNhSkmvLGADLdIPJMyaVNuz5zG0rkdavj96d2uPIx+ixFhBFpDLRUQ81NQR2ZkAoeqSho7DoKozOwo691jjVILZZe655h7C2PKitC9AVwIvavQDeHzsomIgC5wBe0BMNHmr6wTeKfrun6HNX1+iy2V574KwD8AJIYe1i0gNI8doV6NoA2EygG0BNoJYuKpgFGYrJP9FM/ok5DEwVhjTa+GGdFXjLpr86T6FJJ5WhyPr9gKR8CkpEeclCJsFJeQSBJafWjaSdXzq3eB9d/n6BV9Q9pErMZ8eKfnCqpDFOBNtHs/2tqqFu731NMfpbphySGW1WLawGYeECfIXgpsXNG961jE1uAElE9zHkG5/OJ31KHt2Q9tjW31NPAqCTO3V1ZUSXEg4qejOr4oaHoTpxNANSgC8EkSWwdiFXh97LABhF5NGAFJYxwDcovoiCNAVMAuPNpDKVUnhqHk14+s3JF2MCvrmjoVd8rwknIlIqmBWuShpFnpF3UkT30UxXqMHBABegawe8vFFqNgPgmJ5T2fVHrWdcG+OtM2srN1M3rKLCU0Yz4BUGgHVMyKaghCyrIO18QOEsl8CLa4JjASjievprIGYXksOuv+nO4jYD78yl70/H/OHWvn1XFcfXna8rZ3MmQIci/5vcBt75qz8rkCdlkb92OPlqhlB490IKMWVRiCmHnRvOD7+NFZAQWLnIQgX4AvShe5/ORRQQPZaC48eRQlvMjKKxjy99zt05gYiBb7v1PLArOIyOBHUmcLSgDRh3K1qy+/Lat/XeIQRx1lVYdBduK/Ce6aggJp684Dl6utX7cvkyJIroqRfL3T2XP+173xyiALVmJIUaykmuLSC5Fi138hjgAnQF8GKbEHHz24DXvgsFQMEReAMNuRSSMIyqtu63Au+kOavmdkrMJbUOFlwRBeqLKNBkZiL2G5RoJiZaM+G723ced2qtzV/5UQFSjmVoS6QDUHMr2sHatbN+g7RFv734zi8ZmhumnwjRlxMTQxm3jo0AfUt9YdSNMJpJacpzEGYBmwrYMhpLNwAesyQ0BdR7xJyaC6Eeao+SrE/G3K0AF4AmrBGFnotSV8oLyxtL2GoADyKIuLms1g3bbmkyqi9j+5BrcV0hFSRPmMC2BSZk/jZp/lvTfs+ke27N/sGduxcRuoTwB2WxVW9cJ9ALCudbKAZGM5gZ1QCrXZwjjk2WMIZkmrEk01Sw1z0HPVUDSxcPnGCtuUnMBzHyQkqWgkr6bFIYc2hg8SMtAi+OA6CL1lVcf7wTtgiNZEX+LYX+seLpMqiszcA77YUNzOJtDXihFzzcAaDuWryrPjnRDSCLhwbmGxfomOuZzUmszCzUDkZGKwB4k9DVBeeLVVER/UueRaGm+0mhmUAhmkKKu67gXGtVBe3nCj06vfzTTmG0+Z/X/Ppley8Gquhfhm4UrAOFt4xOeuK1Mzm/15qwasXo2LPNZvXic+wfBc6FMB44sBNrVnkgOIx2GZIbr4iEjjYDL8DZYnWJG8FxdA94pzyyam6k6dIDL68nPLpJnTS+MVg7hoI0ZSTTAXzHMQsMYM2BJJ+B7vnAKwCXj5w3K2HWk2fkKEZPTH9ha5ssyp0NFHBz2uO1KiwXEwFKxW0GXoCvABTW3dkZ8AJ8teWMUpIbRzZNWbB2tv0N5e7r59btGRzTYxxfYQD4xIOKrVTAI/KlLW589oAw8OU34sIBcOz8LA8XR+AdSwrdOFIaRzcBKIQBgNF+jl0a4G071TDt+U0XALyt1ziBxW7qN+kQHh7hXSaS3FDBxTiW5MYxFn1b5qUFfAXw4hqAtoNwIAYNNY6CNWUUkTSB0JygbPYqtxvKUk2N7KuUxMbaAB+q7diRjgSF0FGvADrhGUCnPLic9gwkRwmm05524sEpA9AGkObtf5qXkxSALIBXdBEG+DK6ISCCajsG0KeBIb/SjOkz3Z3Hf+r32gS82gLGLzorhu6YTty6xdsW4MUSKcKU0zaLl/G53KphFrDFCmbWeEIx+cSYm/Da0SrmVi9rTc9AhIMvOGyrWCYwn9gFLJQO/Bo6dcDBgeVjzE1FDRv3k1shU/Bu35z2+FZ1ch517l5AvnH3ktwwklENAH2AmuhhpzLA4i3hFr2RO05g9eKG4iDHzwfAq9SVUYi2pImBHHtQYlXCqYvQpDJWuN4nZsivy6q/b1Nnj/cOHIzpfF3eOQCjf1w6eUcPZRYnrE5xvLabnh8r5obgPR2AF+CrK+ZzyrKiAsDiwWctD+qw0uIrK74v8KiQbLbUHlD88EW2eC8f4J208O15IYmZFKQfyVYMcv0kkuunEhsBwsbRljngaBSIeSGAF6Og8UDjhCTkkFyf0dAWeoyKH5hZF6Ck+g4edNzDmxr8AumUN4DXj055cDnt6U82AQjbgS5e/w7gBfgCbAX4MuAN6kR7glR09sYbD1yWBc6dITyca0rtUObkAs3QItXAgJdzsq2Bb5ChkAKNkHwC1SDTDqGqD/dYqYbmwIslkCuqAcAbps+ibTUnnDrXHKkGOL6wFG8GuuK9AXzXGPKLy2P0gF+83fctdMT5Fq/N4ScsBzGp+RIvl8C94eYISc6iiF4l9OSqXW4t5fOmr1kGegHA7hs3iFTJGaxiG8BXgJnoYQfgBSeuNJgtZTTTSZ44/JwiKe2cIinzHPu+AGoLqPHViXBGjSK5YRRdG3YvAXzRXkmdUvDr8q0HrdfF2RwR2xB6NKDk/q1B2nT2v95RaRQQn2kDXmb54kFQwsHAONpK3+AaMoHFiwcBrHoI+GrUYNZns4cNRrSGgghqS4zC6nUE3lwGvHcUzL5owItrmnx3eduphuc3TQed4T7VkEYPL2vZ4l1f+7/48O5mCtJnsKYEUT0mMsAN0d5HIbqJbKVms3odaYcQk7lJYTQ3KU2YX1xUplwK0Y6k8GQ81NPomdWfu/3gRebZIbmJfvRR0c8ePtTQ0YtOdvCgU54+TE57+NDpjn50xiOQznjYgW0zoBWRDs0BWLxHp+AGDy54zS1iTlugLfspbxkTfAbH2h4vFZ28/uYDtHHjlZPCXHv2rCxEfzuFmjL5ExDgarEymnO8nAcD8JZaeVwArGdUBptsIPEBSOzG0BVQoHYME5+YUax9z1uf2oB3wuw35irihlNITBarucuA15DLQFrcYIGmHILAYoJzbVtNvVPgfXr1RwXKxCyrQ4oDr6NDw34bHD1wlKmTyymAOZ9ymRMHoVgAAt/YNApNyWfOm0DNSNYnjgEe41i51QnLk1uZ+B1b+BQeMt4JWaS5aXRDa7GlS6q/6Q/HHrewiy2lMdM5kFmW77BSlYZ8CjMWMz48RJNJYYahDbP+UzV+575GtYhvheW8cddJ3dR5784NS8pviOpSQX6RWRSSYCYG3IIOMAKER3Hrl3G/ZdS5e3EDojsEwLoa57/xQam/fqDFsgWny52g1lFfSgp9OckNE7gYxzL6BucX02M8aw2FFlE+0els6RsYm80eJBHJoykUlruW9+sT80+MYj5YV1WWmiHcuWimIGMO3ZbfMvDaO9eaP5gFz8tGFIcymS8QeDcw4OWF/fOtVf3s5x5eY94gtA4rpNaAd+Tk15bA0gWgI1EJBgXuP3vfhG90DnuQQk/qJDxM8xornnhv0ePLvyx48Z0fMp6urC3NvW/JkqR+Yw75RfenTolZBGPr5uGT2hQyR489nX5KoaHj3oHU4OVDp7286aS3N53y9KIznt70o4c3ne3oT2evVdCP14bSmQ6hdLojl5MeoSTkdEcVQaxOMouz7MeOIQRp7CijnztwweuzHjJq8AyiM15BzLI+1tGD6j286ISvnL5Ff765YdAAACAASURBVDVj7yNUXf2Hhku6uicueDuAV5V0K3VKyWCWFJa1uIBi0ts71xyBt5SCAMBGDrbsSW/KYWEyol1QkL6cILB0/DV308odu62W1UNPrp8bZcymCEOhW8CLcLKLA7yIxeUhZbDMfHHzm4qZ5QavfEDCIIroxh8UaDkECkChz+GW5nnAi6U0jzDguimgQH0B+enzCY6n3fsoqqULc1fpI1XwSHNOttRixWZyQGOONc43A5R8Ow2jUGMu9b5n2lY44lra7859pB5a8ny1ypRNYUl5/LparFGApA14LQ63/x8h8fTKXQUt7RPArO2b3wAqBQ8a68PCAAC2SDPgBThgZYSmpcwJx5yVcHClsQL4oYlm8uo0nHwjMygwNo9kcUWWwveI3LDNQXeA99a8GS1avG0BXszlpLtGX4DFu2E6qI+LBbxYYZj63XfIBro8ZBBGCl9x8lZcAN5OXcaxqKKYHmWH3t/tet5t/upEt2lzV8wx9h7RMH/pujbFEFNB2dIfvBR0zDuQjnv70kmLnPbypTOevvSjhy/9iKLoHVT047XhdKZDcxEgrKKTHiprQoSwgNF6nQOvnIGvDXRldMaLW7nHfYPosK8X1fn70P5gOR1Ove4UrX27zTHILc31S/IZgFdpuo3CkzNJocsneNBxI7mc+Ahj0gN0y5gE6kpYKFNIUjbJkkaQv2EwBRuHkTwJ3Suw9Clh3JTMdA+t3WGzeO+f8+ZclH1UJ+S3CrwAN4SeuQ+8NgvU3hrFa/CPLNYR3l8Tj32M7F5+bvyT786t3LGnz5bvT+o27mmIX7mjvk/utJeWAYTRAUNlzLM4KCwWL0K2TBYOE/G18IjDytcXUHBiCQOWtRttURzNL2btWZKFJA9mDwEr8AqeVIcwn8nM0YTPfDoPo7DkbBpgfqIGcbPN9+XsPSzg/uaHavwT7iCFCVY0lpYcIDnXm88jHbQVLFTt1izXHCn2P2fxhvERXdOZJ57r1InF6+BcEw62AgpPLSL/uBGMu+5y5317B42eVzVs7MKqHoPur43uXkyMu9aOI2XCZAqJG8fmA+aikObAK8LoMIKegsXbJ/ehKwh4RVRDyxYv5kiwIYsl7kDngqoB8NqDb6fU8Yy2QcghrFxn86H5NqSa19W1LcngcP9BB/ZeE0hHfBCbG0gnvUApBNKPHYOZgMtFJMNxT555BkCFVYsss//9W0W//FvBkh9AHYgwMxHny0YvBftfweGCx2UcrjfatfNwsR/8lfRNQCDti+xMP/W/fQNVv9WiEdL8vC+b91vr6tpPWfDC7AeeXT17ylPrZ0+Zt2m28db7a5hlpM93SBlmSz074A1kFm0pBRnNNHDMosopz6+fXbHwtdlTnl05e8qzq2dPfqZqDmTcvJVzxs1bMufTo0etFuD9j705N1yXRWE6O4tXn2ehGrjFI6iGiwm8mMBIgvCNH0HK5Jwm3W0Ve99vwTJ989NTvdTJaY0Kw0jmxcfkB83AYmVdAG9IymjyiRlCzy/9wCV/NmPp29MUKWkU3g3Lc/6w4+BYyEE34X5SaCeykLJQUz6FJmXQxtr/tan10fs/nImK7DWcFInDLPQFDzXjQIalPQ81844cRRFdzdSSJd1v1MxaZdII6tRNOOn4NcK+rFSDhXpgHC+LbChgD+Co6/OocOayZe//cL4ltmUfqctmr5ub1HfaufDEcRQQncc7kLgBvPAfcBC+0oAXVAPCyVoG3vW7G3qFduEGAue18ywPeBvwgicH8KoTx5BcV9L03Oo6t4C3rQCEGg2bIw30naeajviH0WGLkwzJDKAWALBIgDjio2AdKdCVAq/rvS01GDw4vQBQ/t5PQfsDQ+wE7xW8OWWAivVpOxAYQfsDO1v6tEXRJ8oo2qGOovciIn/9dtiAz2nVC31d1Y1o67ldNt+fsmDDbAG8SIpw4NbgDDGWksyAZeR4NmIStbUs5NQ56+aGaUeROgFAA84YAM5vJO4QKrQ628BrtWTxzl+5wyGO1+F4LQXdAd5c8qlzj2JSJI+i64bMqHHHo7tlz7legZpBjPdFK3thOQoHnj1HCM5bkQLdZNHCF6pdhpUlDiivgzMONxQDcoA54oUx6qaQUjuNlPpJpDTghsr5rWjGikUXMkGyJy1cojQNI9ZSCTSDcGqxcC4OvD5RPCTs4cUfOw3mf/OLU73UXZBYMoQYl86iI3gih7hW1lFXTL7RpeQXW8J49K4Dp9TsOEitZkRtOdioHlb+ZGXn7qMoSJvpED7GVl+iFrQhn6BjqyBhwGCmW3PcT6Dg88CF8xXz5II5Xu5cEwaKmBdinojRyvEmZNDDy7Y61Tmu9ZIt+wcHaDMt8ceWbtz2jknLtUQsLlupaosp9bbZ9a9sONP/YmRR2s83lHXcHGmi770606HASDroqaJjV4dQY/tQ+rl9BB3/t5q+9w6jfWhyGRxJxzvp6Yy2y6lfu9xwgG4c8DmTm+/4/Leb+33+c99bDpzte8vnZ/vezIQGDPic7hywAdJ056ANNKpsKeVPWkrmsUtp7H1Lac6jM+nZheW0fEk6bV8baX9cf6nXUxa8YwVeZLA1BzLkgcuMZVbgBa9V+aF7nnGhKKfAixsKdIDF2y2iHBjwxme2ENUA4M2yhSA1qxksJjwf88kn/l4K7ZZJG/e4b0FmTli0BuFe8LpzC89244obDCMAISR5TIvAu3zbQRYMD2s3rAsy0iyxlghbA/DqJ3Dw1Vcwy7pTl5JfH1i4bfLyjQf7VG4+2Gft5j193tq8p8/azXV93mLvD/ZZuXF/n5Wbd/dZ++GePmu37u6zfPPuPpt3/9xn5qLqOQpjWhOAl1m67GblCRpI0oD4RCLqpIh6DpnntGHpfYs2zQkwZlGwcQTjZ7kTzBJa6BDXDWAvZY41v9gi6j3i8RpQHuKauzPe90zlIvTig4+BW+Y2J5WYh1bQtcyXPwJ4L4zjbSvwjmwReNd+dpI5X8HxWnnjZsDLunHHF7BECAG+CCVU6osa08qWVE2Z/9a0V7d8098d52lL1wfA+16kieo8Ixn4HvOLptOeUXT4Xyo6FBBL2zzl9NOQ4RvomfnpcHT9nnq4zS1ZvG++raVjvWI/m7qwaraI+YPFa7MWudV4HvAasqjSLh3YnROfOueteWEJOaROKCaFFkkMZVYrRlhlLBQNEQNIamgReD8pQCiVNfaTpdRyx8N5sbpoZ6RLp1uyH3AKMq6Ofd7rH45Hfzg45loDXllSGXNgubJ4579RW4piMUgoCE0dfd5SHTQGLF02GktIpsmmjmGDCKFAcm0aKbT3kDLhHlLGp5NSk0OKuGwKjhtBsoSBpDIOYlXAVPoMtk2hH8Wca1ZeVwAvCzcTGXLlFBRfQoYbHznnzFLqMXxWLR6CqpRsCtYM53oWMd3NgVdfSJE9Kljo045jFONKn662g/pKuqOijmXw6XncrgBcMf5dgPeDgxSDmg7NgdfqE4BzW1tEIZp8ksXnsRG8OOJz/WPSWNhYRGouCxtLuKG4MWfSy8sef2F7wX43/QT210gA7w8e0XTaV0NHO0ZRvXcMfRdqIJowaSZt/gtbovaK+CNfuwe8oBvGccrBmHMFAW8xc1ZMf3GTSxrAmW6fW7NzcLB+KAOUloAXVi8KBAHwXAFvyayVC3lIHn+QOWZ+FVosYFvYWkz3CZawqxK2X4Uhg1T6kaTSYolZxqga3HxwAoYm5lBYYhFzTPl0SqfgOIuly0DMQg8w8LXE0VqAGFXPkLb7zueOYIlwNZkpg4JQLyI1nwLiuTWKGGAhVpoB567PJ5/YNEqb+KLLamHO9Gu/bcqCqtkiqqY5zQDwvRTAm3hn6QVENbhr8VqcawktW7wIR1R3zT2BkENYvCzzT5/nkCkIPSFkUKbJZYI4fIQfhmhHMfD1CBvCYvMxhzonjSV1nJk0ycXnJk9/c1HNgZajY+yvCSzYTVFJ9J1nLB0NMNF+WSLRvYUbqFICXHs9/a7X6EAhYlSRG261NCwcLF9aF1siGxBSlkPL22jxTnls3TxwvAAPLE8BRCLhou1UAyxes6VWA4LxedqyCLlxzE4rZdk/qz4+2abmnLu+/albiP5egpeZ6YP9Bg8l479new3gxdJ+4QvOwX1Y+fNVQQmcqhCVznikAI/TZBwyC83itRq4PvJ5GBjLahtFCr2ZgasN9ITTixc1EsBlv2QXS3fb/3Aghjc8SJPHrKcl1Y7donfuO6hWJWZa0lJ5TQoBuGJsvj+f6Ex6auVul47F1ibnus9+SvWNGcmqmfnFZ3NvPhyvFnHQN+N+Lz7Ha7qz5MKBt6X5h3KNolZDK8ALPRXOWLEIdUgQAsj8C4hOMWWySBWlEaGHI1n8M8AXAuDlhoFYmRWyqBGVYTSF6iElFKYzk6f6Tkq9ZcKJV9b/MLi16yE+33XDnUf2+BloV2AKUdGspX+L5b84+UsxthV4ARoXArwoRymAFyFqgloQN7IDx9tCONn8lW0F3kJataPBWhvYHZ3W7mmIV5jupUCj+8D7tAvgvSl91t7zgZeDLuOzEfZliYllCQmgBfSFFKLLbYLYAJQvxZu/twdd58Dr+H+glUSyzMJ1XznEdn763eH4iMQMBsoB2mJC+CALZXJp8RaSV+dM2rKfLji2EkWG4q6fdA4Wnnc0HJA86+2SAu+AywN4UdLScFtpfYBmBIswQhVA+DMQIsiAVz/KCry28Dv+QBVOYICuTUpYsgpi02EZR3cvpdzJLy9zh4v/cpR5w6ZOqURT5s1sDXS3Ul37DWc+jdr8yx7jB3Qg5s2GnQHu3Gd/6+9MebZqtiiaDIusNYuXAe9WW8lHd5Q35bG185CNptJyZxrKSDLgNaGeAF+yuhtOZgPeLG71tmRxGEoZcKyqOeM0C87VsX+670yUwjiUAg0WZ2MLFm+IaTTjY10Br+GWMYeCtbzCFNev2c6KFqBrq05mX8krJGGMpf6CI3jag29bgVeAMxyps5Zuc0h1/nh/vS5UO4w5bwC6AfrWgdc/Npt+rzPH2OeBOvgWsPL6ywFvYh6LbUcJyZaiGsRcrPryTGpUj5JzSJJAxTrB/bP4ZzSb1SEmG4k+jqsgwQXbQBcAjFBIMyFEERmN4IKVuhGUNWFBpfg9V+O+l58tP7roKVZykWjqeZ0rptLUq0pOvz685+Zxu2OWD6OQZ/oxCX9xICkW9Sf96qymspNL5s2jndai965+62+5vUXgRQETPU9bRBIFKALcHMsvBvA2KwvZduDN/osArw10caPZgJdXF+MPJl7wRhS+sR8dqnfp0LrJ9XfxGbLKUCvCPzaTpjxbdR7wqhOGsrqtsHjdAV5EZlR/Q7/Lwkm4cUq9b1wWqyV7qYEX1JnxjrbX40V1MhZ90NKDH1RDG4EXIIR4cqXJ3Ijax9z5agFRK/DmOgVe0FSsrCgSoyzx4jJNFvlGDiekbKMRQSd0VjENo3e/ONbiKpDIdcJFNR2QdXl/6u5/LB9AnuvvoXav3kCe6++kf626lf7x+o3UYd2d9M8Vfema1/pRwOtpNIXeHv63BNeWTtoV8Nq4TQ68iEQA8GKp2mbgfYJbvHhaA8hF4XTQC8J6axPwshAy1ONtnePF7636hHegaEkP9p9xi3c4L/jTLFzNgXNExTPTGJbp5sri7XLnZEY14P9Q38Ke32URHHb8LoA3ImUCu9l8onjIHEu0EFluLA2X1w3m20VBHNGhwVI1zPI90bmB1S5Geqs+m1CPApXGUFx8+ovVDsC748CxmMiULAa8oINCu0ygIC06YeRbRXC9YuwQNoLW1bRNv/a6hrUMmgGrAeinNeDFw+O27Isbx3vd0Ilt5ngffH7TdHVSkaXiHSrdOZELBF7op3LLkVTTLRP3BmvSKCwJ0QojKViTQUExIygoJp2C40cxB5tCV0jRXSdSZLeJjCISli9GPLQBvHC+yeGQjS+kTomlJItPo4GFj1+QQ/QJ2mBUvTmiqd3KQdTutX7Ubm1/arfmVkdZ3Y/aQVb2p2tev4s6vHgHDT/w1DxYyfbX/m/9+lIBLzzzAngDjbxjxQUB74rPChAZwMDkDwPen6NQzSnAkMe86o5ga3OsAdRtwOs8gWJQ6bNVoBqQYgxKxwa8wrkGxwgoh3Imybc9UgfOdOPXpHt710kdmhT+Htny9S86RyHdh9+TbsvXpENtYPvJX3PgqCw49h4KjkM36bHkn1DUKvBGpI6lR5bucOCK7ffZ2uvKHad6YRXlEzuSYPVeauBFIfTu91Ycau04m38+66X3ZwfEZbUReLe5TKBovn+8R6TD8+s/HZwx8cnKlAFFDcHauyg8ZRSjtuBcC4jJJv+oHCboPiJAV4RoMlpJZwHe+EKSxxeTKqGUfDulU1zPEnKH67U/rlfo8xjZ+iFN/9hwF7XbOITavT2I2r3Zn9qtvdVOLGAMQF49gNqtuIOuXTGQgtcMp7QD8+bZ7+9v/fpyBF5eJMdFWcjmwNvMInVMoOA1a9tu8f4cJTe2DXjnu8hcm/bcljlYKSCWt3mMNEBYlHdU6MYTRNN7yrk/c0Im9i0/4R+TS8rkceQRlXOec01YumIMjMun6+99oLaGai6oB13GlBcroRcAb0vONYSVcf+DO1ENvH4HqACuc1sCjOP8KGRJLWHXDXMa09zSdcidtngJqq+x/dl1PHGIqrGzeNHT7+FlbQNe+99HEZ2NX9fr/vvW1xlTF3ww5+68l7Ya+84+oTJxHhirkoC4XNanj3cz4f3rEOoo12WTPKGE5JoxFKqroDBDOal0ObT5y7OtZhmKY1hBH3tHrktr+sfK/tTu3cHU7uXrLdYugNYOeNf0o3ZrLKC7agD9a80gare0HwNfz8V30OSf3igS+/xbj5cGeN+c667FC4vHLeCFtQu5DIAXnOn8F51bvM+v3zMYN6e941I4MAEM1poNKJajG8cseRTu+bMmZcG0pUsYqBrLyCsmny1fBciePxaxRpsBmqF0/wvLHGgLd46/cscXfVh6spbHrQIkXVm8LJ7X3ZRhrESQcclSyF2BLrYDzM3koxlAS7ZsczvkEIknXe6uOIHr3jLwFrJ+ayj1iPKkvwd4XenznU/Odbu74Jlq31gku+SxTFDO78JpbWax4Ax4NaNJrhlLnU33kzJ+DPlHZtGSqj1uh5cN+fKBeV6rb6d2y2+kduvuoHarb6V2b/R1pBhAOQiaYXV/RjW0e/lmar96IF1VeQf9+7W7SPl6Gi2nrW3KcHR17lf09taAly9bLGmn6Ad2QRyv+8ALvk+lzaRtn7Rk8YquBbYoDAFm3MLhyQripmi7xXsmSm7MoABDQetUg3Esc1bNf/F9p0ka6G8V2gXNM3FM9imxPLrBql8kN+jRlPEemvXShjYtSS/mBFywcmcuCpP7xhdQgKaEAS/68wnQ5c4+HsKEY1ebKgixvIrkob++suUrt2/kDXvOGuNvymtAqUyArbhu4jqKsXkCBYo09cl1zfGCM0a7HHXSOEtVL3tqyBbGx+aGsZAVUfJLGErDJsxd464eX968p0+QdgSLtXXQB8IARRF+Nhay0qlw4CF2etbi1i3eC+nhh+O+s2juOlYLxIDsyGK2ksIcFrG/soTRJI+voODocRSqn8ws4MXr97t9veLWZjR5bxpC7VbezGVVX2q3sg+1w7jaXgC+kL7ss6veuJmuWoHv3srA1+P1QXT/r29JzrY/A3hbcq4xJ4tupOvWPyt2FSBo3OrNh8VrJ+IGto0X5lxrC/AiSP5JF8CLm+LG9Bk1HtGDWUtua+UpS1twUUOB3cCGURRsuJd0t+TWt/UG/PjkSe/Fb72fu2jl9txFKz/Pfb5yd+7zlV/nLq7cm7sY48rduYtXf577/Gs1uUvXfpL78lufZDgDGsSSIl048roJDLyQpuoKePEZuOnQpHJmuYd3zaL7F701eWsLNRuwZH5q9RcZ/nGDG+Hgc+S8BZ1gu6ZtBV7oLaLrFELsNC+n2BLw8q68yBYLSU77ddWnh1v09ENfsHZ7D39oa6Amg3XO4M5hy4PICfAiqgGFeJAW/cza1hNNRk56eknh9GVrvmnGvzu7VvbbXtnyw2BlUn4ToiAY8CIRw5hmAd48AvDKNBUUEjeelNrxjA+u3HbULeCtplpZ6GvDqf27A+mqlb2ZtFvJgdURdO0AeM3N1G71zfz7b9zIAfqNftRh1SAqOf3Kg/bH/rd8famBF1YSi+NtFk6GOqtMNLmEEpLbP3PRZfg84IXlaBN+I4savdwCuWCLV1/klsUL4H2iBeCdvri6VJWaSepU3giSL6fRQwxLQ8tqAvHMKG5jTKMg/T103zPr5rRlQmZMfLxS0zuTVLohpNKmkyohi0I1uaSOy7eImdSxWU2oixyWMIwG5T5a7Wr/g8csWOefkEGhKWOYZxye8+aWHbfUiymy62RmFaO7Le+IkE03pc/Y++za3Rn28b1w5Dz71v7+t2XNrUFFsmBtThPAyGYh4lq5Bl6R6diaxYtziu45sR7OTLQ3b+4Ytf0epyDwoEfFPT/NCOo68L5D61ystLBfPJSGlj23plNXdERG5brz46ttD3x+PuB20SwALZTWfnysRTrj/X1HoxSJdxEqzKUMGHPo2dW7M6ZOJbciAWYv/aA0utcYW/W7xGyW9cYq1bHYXxRJqiCVDt2G0Y24gN7b09jqgwbnvXjP+l5ez/Wjdst72oB05a3MirVatw5WLyiI5sALS/lW8lw7lIbtm/+iq7n3t9l+5QIvWtCDarCBLl5fHOD9OQp90ALcBt6iFoEXVljszeYTvOIX0mL5cTsAr4VqYP3XTOkU1TOXRj+ybNHOgydbDED/4MD/YgYWPbpOlTSMlKZ01rki1FBAYYZSCjOUUSfDWOpsHE+RpgkUmTiWeLGi4bRys+skmKpvzqSGJI1gIWc8Q8o18MLaDYjNIzh5AuN5CjMy43xjMljoWmSPMY3qlIIGABU4Ub5ayaNOXcpZF4XmQGW/esFrYfECeHkp0ZapBty4RTPXLEIBfHUyQiBdW7yKRPTkK2ErJkSchHYpIoVpVFPqnZNqMyf9d9nUhW/PK3tsxdzyx1YvShv3QpUyMZvVaUYxKXQyAe0mwiHF2Px8/OKzWJ3iQO0gqv6mwSGKpDnI9M99oDowYQBFpGazgvjBcflNmp7T6wcXvb7kkZd256KQTvPVBFY6T67ekhF7Y0EDAF5ksKHvGrLeWM8+PDhZdbpyVu8DhZjCu2QTHiTNj8HZ+wWfvdo/7PUR1G75DXTVGzcyAYi2W4mwMQut4Cbwer81nO74bKYEvCiSIyaRfZUo6xLKUliFXbgL5HgnPGHjeO0tXlgv4kZrm8XL24GzrK0/DHhHsQQCWOfNb17be1hNFewGfOLFltu8z1qyYXJot3RmWYV3LWMPDNzs3AONUDJLgXRYUbB8UYw9eSQpkoZQ9tQXlry4aW/Gyg/r+8Aie+uzk/0ffnnr+DvMj9TITcMtDTPR3DLHWk1NeLZFDzbWvdiQT52SR9Edua1Xayuc+fKiAM29LEXVqcXLMg5tNX9RYU2mLWFLWlaEB0tbZOyxBwpC5lBEnXdyFjHIGLEMb0432IMXr46H0qS80zK+e1uu655rAI7Kj37oj4aRnDt2vH7C4nW4hgZeP4QlCFkyKa3Hqke7Jl4XAZQL6klDkCEmWmcJ0MVof+x4DZ8F6kEPHz+vxbjZJRu/GuwXcw97eMJKVerKSamdyAvYo74J6DTjKIq9qZh0txXVJ99TUtt9aNne4MQ7Kdg0mFDcCFyytXaDJZYbqcI4Tj4fYPWiDnQmGfsXuN2DbRvtMQa/NJDztAJ430CcrsXJ1hx08d5i8f5z1Y30T/DC2LaqH3VcfS+L6XUG8H+rbZcCeCc96Qi8LInCiDYu5wMvrKWWqYYvC/BUZ6CLRp1/EPAizIv1mWOZe45Wk8NNa6xgk7014K05SzJ196HngvRpDGxg9eLGFDeEAEobANs68rIymPosgucaVg06FaB6GG40YT2zG9PCMcr0JU1MDEVNADZr5IQhn0JTR9LTb25vtXMBYnyNt41pRAA+AOc8qqEZ8OL4XQKvTvRqswNgCxDbVih8ad4cuC4EeMEjJ9w6ei9vGOl47RyB15YcFKwdQxB2Dtoi6/wCUDFJQI+4ElIklHPR8kpxXC82yqH58SNGWZWaRUuqP2uRZki9o2JvWCJP8VXoCpoUCRVNaI+ESBfw6AhTw4ME1AWiJEJMsKSzSGYcScEGXkAd94J4CIgHHXvwWoG3lEITzRSsHUiPV25yO/YaoYIRKzKp3Yq+Nov3AoH3n8v7U+HJpVJI2YUAb6WbLcLFE0wAL5vAOkz2Yga6zYEXQILvhGlbcq61DXgBkm3neH+Ochd44UHHZH+sFYsXuliw9pNc9KgL7wZLOZ/Cu+KmQnqnSBvmSRQ8mYKnDyM+0z82i1A5TtzUjJfUmln6dgj63Fm6NATqC5qCDUVNwcbC37jk/xZszG1i4IbMKmMxJQ6YuNfdwPmHl7w/jdcFdgK8bCVkX25StG+3UECWcD8OBHjAWNJY2bny85TrRjdxILSBrlgBWUdWiL9tFi90/d9392b4xqdz3tiObrABrwDdcpLpyik4YSwFa2GlA3SREZlJKNIu10MyeVfkhCJWT1qRUEFcyi0WvWvgVSWNpv7m+S3Wg0Z966huJeQXmWsp/Vn2m0Jb/ptCO6bJBrxlrGpcaGoJp0SSeIdk7qwVlJvtOLjlW8ysXVY0HXqHwaIdQbG9MtzqNC3uX4y9P55Wc83bg+yA944Lsnj/79U7aBZ90ObazfbH8pd4zYA3sZDxb8jjR0iTo+Bi2i0pjUVUubXe2kHYHSVMYRZvBim1uazHFvbHLFUArbUAtpkvlfQ5FKYbTts/O5LqbN/zVwjgFXG8LXG83Du+6pM2Fsn54UwU2t4wa8vuphWWrrD+8F5uUvbShwAADQVJREFURAeKbHrMRRxv83MoefT1hUGG4cxqAf/HODkHUAIIC2Dixa/BnwIw/OJzySdmFKM+0OssIAGZddxZyRyWDHiL7UA3r0lmMpPMZFkCm3JomxutecQxg5vuPWTGXnCCACNxrfh8KOWOQVZk3QLA0BUDLVFHQ8ynfLsHjOPDxWqZW9o1WQFXRKpcIPDiHAaWzl8Hi19cN4znAy8K85czaxcZhixsjnUPTieZYQTJ9ZB0kutg+eexdGoU8xeWr6BSxJwQ++djPqm7Zp/7yEn/OaFjjNmTl64JRNZeLFpjjW5SaAG8kNFNct2YJjyYYfHimiOtGs5czB2f2AwWHw5LWOhN3LtW4EWHCh10DuAtpEDtvfTM2po2l/Ec07C81z9evoWuruzL6jAgLhdZaf8Az4uQMifyj1V96Z9v3Er/98atbOzwWj9K3VTe4kPIXi9/6ddTn10/W5VkJpDx8DajfxhrCW4AZyiEAyRAAlbX8jYC79Sn1s5TG0eQUptlqSvL+SpwVnyiWMKH9NmEbgoR+oG0/bPvWwBeLB9xc2dZ/1+AgpXjYs0YeV3bljzVzi7upz8cjVImDyFZomUpD0rDIvgd7nDCA4nzk7hBH1tS5TSOt/n+4aUeP2/V9E7dzeQTM4y1lEdYFdJP+TnYYmSb39T4XByH6HSM1QO4SUiwrqgpMCH/t8ge43+TJxb+hqB93KSgJTR9Suoraw62qUobjh0OmAFmBOgPZYXRVYmFhDRh785mCoyFFWu5qfWw0DkAA7wEELEHi6XjMQrqYOkN3hMPXoy+cdm/YcR2pAwLABE9+QRoMqvejQQKe30jqiKt4uV13IrNI9baSmepYWt52LGoEvHwsPC7bE4ynl3MfzHiPhDLeWGMCH6Yr+QAkL6xuYR2SNE9yxpW7drbos6RDt65ewmr9+EbmUYhCflNCm3pbwptSRMDYRwn0x8vms9/32Yc8Qei7b2gGPiIrs7jqVPK/WwMTS6lCfPWz7bXUVteD9g7Z573q4OoY+Ug8lh1L1396u10TWU/Bqz/WHkr2QvA9v9W9KerXr2b2r1wG3ks60dd1uU2LT/zvrUJblt++y/33anPvjNblZjPmi8CAABooriKw4gsGPQYY/V422bxcuBNJ6U22wZa/794uA14AaSct1UbMi3A25LFK4AXFpXFIrdwjvY3OiYf4nHX7apvcfI3v6gAXlXqvRSShFCjnKbghPwmkUAAR5NNuMMoWD/cbeAVv/XKlv39w7unNfrHD2bB7gjvQfFrh/MRy3nLuQHMxHFw4C3ioKsrwzK5KVhX0qRMLGuCJYwHJMKkwAf3TptRs2VfY4vREeK4nI2IXc2euniJOiWT8JAG+Adr0PF2soUm4TSCDXiLrCBsz1njeqBnX+cepSy0Dnz17TnPr2PRHaYiRqdcTOAV55JWsWwd4m5x7IiuAFgJi1Acs3hQ8FEs2S2AxkDYVoiI3RcWAOYPPg667CGBSAytmVmkq3acajVcq+LJlQth9IQlFVDsdeN4FxFt4W8KXTETub6oSa4vaILuEBXSHHibv+eAa3FkGoopPGkSBWvKGF31yNJP3OZ1he6ajzmH/jsv8OUh1PHlO+mal2+n9q/1Z+D7zzf6MesXFjBeA5DbvzaAPF8fRl6LB5HutaymStohUQxCoVMXbpitMiEjrcTSmcBmrbBJaPFKAxC4F/oCWv88VTVPjcmryWdFOuAV5gBjsR4YwJSSPKGIwg15LM50y86W4njBVSGbCje4YzNHsUxnIzgtQ/oFAO+ZKFVyBoUkWlprw0NvEbbMZI4VOFc4LYCl+Bw3qQahd4xVX36fev2QqfUABDz8+E0kLClYj2I5b+NSmfUGHpJJiTVMCO3bEU3AiqWAftDkMkBPm/DcGnc5Xftjc/b66VWflIamjmIxoD7RIyjC2kNOOM84z2sPYhzgRDRDDgutCu+eT/7a4VQ2Z8PcjXsoXp1SzEAXy+g/AnhBmaC2AosSgUMS4MtWdrBg7fVto0ycAvB5NJyguSzxwoZ88tOkU9dBk/e6WxwejsBZi2vGx/ccew5lG9FFmEVP6HObFPrsJrk+j4GuANTmQNv8vfgeH/GgLmGJHo8s+eB3g66YEw/+tLbI76V76NrldzJwvaayP7EaDqjjsJK/xraOywdQ8LJ7qO/GKbtX/vypZOkKBWJs7lyDNcNBUTz1LYBgGEmKxBEUkjSEKj/c0yaO9/4Fb82DJSvX5LAuFOhEgar4zakMcGgRRjOFaYeQS+BlHSgszS7tlrTiZneweBE1YRxC63a1bYn96Q8/R6lT00meDAuNt8kRgKfQomGnnejLWYm+CwFe6B/LYSz/YnrlNwbr0/hqwwoGAF5HMBAW73nAC5DWFzJQCU/No4hu5hOPLm89esF+Lrjz+s1Pj/Uy9RtzCCAWrBtpCROztZ5xnDtYJVlA19JJwTv+DtLeln/o1Y9+YF7+976mGFAiiKdF65+WgJd/1nKRnJbOYf0Xx3rdlDatRpE4jGUIcucZHv5O4pTZNnEPuLZ8EVXAQrlMGRRsHNYw48XqyQD6lo7D2WfoiTb+iXfmhiebG1D+Eam+LPmhWSlQh1WoE0vcPlQPDuIbh8+qrdz+fauWt7Njamnb1FOVvbpvKtunWHwXBb90F3m/chd1eJULXmNb6H/voor6/z648AILKLX0+1f8Z8+u3ZGB4PCBRQuqBhUv5FL6bBXKGUIGj36uavDoBVWDy+dUDR07u+qusgerNn/7rdtVjaCgJyurcwcVzqm6K2du1aC856oGFz5XNajo6apBpfOqBo1+vGpQ2dyqQaMXVA0pfbYqs/y5qvTiJ6o++Pyg02XJq9t29x9a/nTVgPx5VUPLXqy6K3+Bg9xduLDKKkVzqzKnPF21cc/hNhWdqT16VjZ07CNVA4oer7q7aEHV3YXPWWUQjt0qz1eljV5edVfe01VLNu5yK/3S1YQBAD/88qbxyXeMrYU1hgdIcAIAgS8xUfs1PKWEUBELPCsAjQGGFtWpxrKAfnVKNg0bt6Dqicrq3Itl5To7XgTxP71qV+nNaY/XAghwLFgG47hwfPYC7hpgENkDPHNu/YyX1423B6b3DlAM2vz4JeSwFYYAXjE6Oqv4effLaTmO19kx22+rrPmqW95D/1mmTEK9hQyWyIGkCAhWCghpZE5CB0chaDju/wCggR5QJeUQMhJ1/Qvr5ry6YfLF0Dn28czaL3L7Zy/YyqgnUHJ6/tt40EHgi4GwY9dkMO5dvPeKHEKhKfk0avIba17ZcrjFEDZ7nVzo6yVH1xgfO7j8QfNXT71456ez1vb94L61+XsXzFvcuGn4VqkYzoWqVfq/P0MD7x34X8wr1d/1f/ilbeMLHlr6XNqEBVV35M/a2jttcs0tWdNq+ptn1NxdMqd68Jj5leOfqJr3+Gu7Std+erqPu5lIF/Octuwj9ZKN+wdPfGrdnBEVC9f0z5u9tb95dg2TvFlVudNeWvTI0vdL3919qpczYALwwpEG4JUn8YpiAnQx/hHAK84fD4DN3/5ifHXL4cGzFr8/vmTWawtvNz+8pn/uw9W285jB9N0/76Gt/c3Tq4eNe3LNuCdem7fwzU8KVu442Ke2kS6YOxfH4WqsPUuyVTuO9Xpm7ee54+aumDOi4qk1t+dOr+5nfqhGSH/zjOrMyQvXTHhq9TzoGU0Kdh5yrLPsav/SdkkDkgb+phpgVENCrjWiQcQq20ZeU4ED8MWxeP+mqpZOW9KApAFJA1wDsHhh2SIphHfosCVTcPCVgFeaK5IGJA1IGrioGgDwAmABvHCw2SxdDsAOzlJLbPbv5Xgv6glIO5M0IGlA0sCVpgEJeK+0KyYdr6QBSQNXvAYk4L3iL6F0ApIGJA1caRqQgPdKu2LS8UoakDRwxWvggwMUI+o3IHMNxcUd623YkjPYdqOZ+uXM2HrFn7h0ApIGJA1IGvizNNA24OVZcBLw/llXS/pdSQOSBv4SGpCA9y9xGaWTkDQgaeBK0oAEvFfS1ZKOVdKApIG/hAaaAy/4XsdYXtExmo8oJXlb3kMSx/uXuPrSSUgakDTwp2igTcBrMrOecxLw/imXSvpRSQOSBv4qGpCA969yJaXzkDQgaeCK0YAEvFfMpZIOVNKApIG/igZ2HKQYFMdBwXkhaJ1jFV0Oa2GENkYQVUou9c6cJHG8f5UJIJ2HpAFJA5deA+98/b8YtK4H0Aqnmn09XtGNWma09OhLyqabRk6RgPfSXyrpFyUNSBr4q2jg/X0Upe37wImEPtNO6Po8UC9e4z2XqScS+k6yyIQTMTeMOZE2ecGav8r5S+chaUDSgKSBP0UDNTV0NToZo/FjqzKVf+dPOVDpRyUNSBqQNCBpQNKApAFJA5IGJA1IGpA0IGlA0oCkAUkDkgYkDUgakDQgaUDSgKQBSQOSBiQNSBqQNCBpoG0a+H/6UyAIW5ha6AAAAABJRU5ErkJggg=="
+
+# Static login page markup
+_LOGIN_CSS = """
+<style>
+.main-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 60px 20px;
+    border-radius: 20px;
+    text-align: center;
+    margin-bottom: 40px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+}
+.main-title {
+    color: white;
+    font-size: 3.5rem;
+    font-weight: 700;
+    margin-bottom: 10px;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+.main-subtitle {
+    color: rgba(255,255,255,0.9);
+    font-size: 1.3rem;
+    font-weight: 300;
+    margin-bottom: 30px;
+}
+.login-container {
+    background: white;
+    padding: 40px;
+    border-radius: 20px;
+    box-shadow: 0 15px 35px rgba(0,0,0,0.1);
+    border: 1px solid #f0f0f0;
+}
+.feature-card {
+    background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+    padding: 30px 20px;
+    border-radius: 15px;
+    text-align: center;
+    margin: 10px;
+    color: white;
+    box-shadow: 0 8px 25px rgba(240, 147, 251, 0.3);
+}
+.feature-card h3 {
+    color: white;
+    margin-bottom: 10px;
+}
+.stats-card {
+    background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+    padding: 25px;
+    border-radius: 15px;
+    text-align: center;
+    color: white;
+    box-shadow: 0 8px 25px rgba(79, 172, 254, 0.3);
+}
+</style>
+"""
+
+_LOGIN_HERO_HTML = """
+<div class="main-header">
+    <div style="display: flex; align-items: center; justify-content: center; margin-bottom: 20px;">
+        <img src="{logo_src}" alt="Finequs Logo" style="height: 50px; margin-right: 15px;">
+        <div style="color: white; font-size: 3rem; margin-right: 15px;">🧠</div>
+        <div style="color: white; font-size: 2.5rem; font-weight: 700;">CreditIQ Pro</div>
+    </div>
+    <div class="main-subtitle">Multi-Tenant Credit Risk Platform with AI-Designed Institution-Specific Scorecards</div>
+    <div style="margin-top: 20px;">
+        <span style="background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 20px; margin: 0 5px;">
+            🤖 AI Weight Optimization
+        </span>
+        <span style="background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 20px; margin: 0 5px;">
+            📊 Dynamic Scoring
+        </span>
+        <span style="background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 20px; margin: 0 5px;">
+            ⚡ Real-time Intelligence
+        </span>
+    </div>
+</div>
+"""
+
+_RISK_FEATURE_CARD_HTML = """
+<div class="feature-card" style="background: linear-gradient(135deg, #2C5530 0%, #416B47 100%);">
+    <div style="font-size: 2.5rem; margin-bottom: 15px;">📊</div>
+    <h3 style="color: white;">Risk Assessment</h3>
+    <p style="color: white;">Advanced credit scoring with 20 behavioral and financial variables for precise risk evaluation</p>
+</div>
+"""
+
+_ML_STATS_CARD_HTML = """
+<div class="stats-card" style="background: linear-gradient(135deg, #1a365d 0%, #2d5aa0 100%);">
+    <h2 style="color: white; font-size: 3rem; margin-bottom: 10px;">AI</h2>
+    <h3 style="color: white;">ML Optimization</h3>
+    <p style="color: white;">Machine learning engine automatically calibrates weights based on loan performance data</p>
+</div>
+"""
+
+_LOGIN_CONTAINER_OPEN_HTML = """
+<div class="login-container">
+    <h2 style="text-align: center; color: #667eea; margin-bottom: 30px;">
+        🔐 Secure Access Portal
+    </h2>
+"""
+
+_VOLUME_FEATURE_CARD_HTML = """
+<div class="feature-card" style="background: linear-gradient(135deg, #744210 0%, #B7791F 100%);">
+    <div style="font-size: 2.5rem; margin-bottom: 15px;">⚡</div>
+    <h3 style="color: white;">High-Volume Processing</h3>
+    <p style="color: white;">Process up to 25,000 applications with RESTful API integration for loan origination systems</p>
+</div>
+"""
+
+_AB_STATS_CARD_HTML = """
+<div class="stats-card" style="background: linear-gradient(135deg, #8B2635 0%, #C73E1D 100%);">
+    <h2 style="color: white; font-size: 3rem; margin-bottom: 10px;">A/B</h2>
+    <h3 style="color: white;">Testing Framework</h3>
+    <p style="color: white;">Statistical validation of weight configurations with performance tracking</p>
+</div>
+"""
+
+# Each side column's cards go out as a single markdown element
+_LEFT_COLUMN_HTML = _RISK_FEATURE_CARD_HTML + _ML_STATS_CARD_HTML
+_RIGHT_COLUMN_HTML = _VOLUME_FEATURE_CARD_HTML + _AB_STATS_CARD_HTML
+
+_LOGIN_FOOTER_HTML = """
+<div style="text-align: center; padding: 20px; color: #666;">
+    <p>🏆 <strong>CreditIQ Pro</strong> - Professional Credit Risk Assessment Platform</p>
+    <p>Powered by <strong>Finequs</strong></p>
+</div>
+"""
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _registered_company_names(auth_db_version):
+    """Active company names for the login picker, re-queried only when the user database changes
+    
+    The ttl ages out entries for superseded versions; registration also clears it outright.
+    """
+    return [company['company_name'] for company in backend_auth.get_companies()]
 
 def render_login():
     """Professional, clean login screen for credit risk professionals"""
-    # Clean, professional CSS for financial services
-    st.markdown("""
-    <style>
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 60px 20px;
-        border-radius: 20px;
-        text-align: center;
-        margin-bottom: 40px;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-    }
-    .main-title {
-        color: white;
-        font-size: 3.5rem;
-        font-weight: 700;
-        margin-bottom: 10px;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    .main-subtitle {
-        color: rgba(255,255,255,0.9);
-        font-size: 1.3rem;
-        font-weight: 300;
-        margin-bottom: 30px;
-    }
-    .login-container {
-        background: white;
-        padding: 40px;
-        border-radius: 20px;
-        box-shadow: 0 15px 35px rgba(0,0,0,0.1);
-        border: 1px solid #f0f0f0;
-    }
-    .feature-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 30px 20px;
-        border-radius: 15px;
-        text-align: center;
-        margin: 10px;
-        color: white;
-        box-shadow: 0 8px 25px rgba(240, 147, 251, 0.3);
-    }
-    .feature-card h3 {
-        color: white;
-        margin-bottom: 10px;
-    }
-    .stats-card {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        padding: 25px;
-        border-radius: 15px;
-        text-align: center;
-        color: white;
-        box-shadow: 0 8px 25px rgba(79, 172, 254, 0.3);
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Main header with gradient background and Finequs logo
-    st.markdown("""
-    <div class="main-header">
-        <div style="display: flex; align-items: center; justify-content: center; margin-bottom: 20px;">
-            <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAV4AAABdCAYAAADtyA4AAAAgAElEQVR4Ae19B3hU1dY21/vpvQjpdTItBdInU9MoImABFREVQVoKIcmkhxAIVUSRolgQFFSuVxQR1CBNRCNgEAQN2DCi0jRKCZ2I8Ypm/f+79+wpYSaZICLoyfOsZ8+cmZw5Z5193rP2u1q7dtKfpAFJA5IGJA1IGpA0IGlA0oCkAUkDkgYkDUgakDQgaUDSgKQBSQOSBiQNSBqQNCBpQNKApAFJA5IGJA1IGpA0IGlA0oCkAUkDkgYkDUgakDQgaUDSgKQBSQOSBiQNSBqQNCBpwKIBWrjwatq40Zuq3wyg6rdktHZtpFNZvTqaLrWsXx9NVVWRV9TFqiNqv3rn96lLVu4cvLRyZ+7Syh2lkIX/2VT60ms1uWvWfzW4asuB1P0nyfuKOjHpYCUNSBposwZo/8fetOqVvjRjxkzKH7P0f32Hfd6gu/FIvTyaToZ0ohOyCDoeFE7HAsPoaEAoHfFXMznsp6Q/RXzV9F1AGNXFphJNnXpVm0/4Uv7D6s++Ty174vWFvUdMq5UnZVLkdcUk12aQUjPSQdS6UdTJlEcRqXmk7JZLifdO3psz48WF7+yq7wbAvpTHLP2WpAFJA3+MBqi6OoCeeqq8/s4Bn3+SoKOdoVG0w09Ju33DqC4wiuoDo+iEXzgd91Za5ZiXguzlqKec/iz53juMjsZed+qP0c5F2Ov6Lxp79Rw6rSbIMJxCuxRQiLGQFKYyUpjKSW4cTXJTCYUYiylYV0D+GjOTIG0+BeqLyM9UTAHJJeRnGEVBumGk6TbyxJyFb047KVnCF+HKSLuQNHDpNUBbt7anivtnnuyUTN/7qOmwh4IOdghmANoQGEE/BXVi8mNABJ3xC6PTvqHnCba7+szZ9/+IbYcCOv/6W5+hBy69Blv5xQ8OUMxdRc9XBWnNpEgsZSAbpC+lIH05Bekq2CgzlpLMVMgkyJhPgcZ8CjDkMQnU55FMW0ByiygTCihUX0JeqqGU0ufBQ6+8dax/K4cgfSxpQNLAZaQBWvVm3xO33HXgM281HfaNoFNeSmrwkFODp4yLh5zOeHI56RlCx7xD6KinjI54CZHTES851XsrHOSoj5IuheB3T/iHsgfFfnkMUdF9Sy8j9bZr98xbX+cab3nwXJC2kEIMZeQfX0yqRA62jsBb7BJ4g/V5pEzIo9D4AlJpiihcN4bCDRWk1I6j4PhyUpvG0uiZ7yyR6IfL6tJLByNp4DwNUE3N1TR2ysxPZDFUFxBDdT5hdNhLTac9FHTWQ8aEga8FeE95yem4FwdeG+gCfP9c4P1RFskAH8expWPwr/TM4vTzTvbP2vDgC1vmBCTkkjppPKMU/OPzyTs6i/zic0mmL3QQUAxMDKUk0xeTXFdMMm2R1dJVaQoswJtHKk0eRaWWU+fUclIYisknKotUhtGUctvM2o21FP9nna/0u5IGJA241gC43B8HDPt8j0JDX3mH03cBEVQXGEF1vko6xoBWySzfk3ZcLqxXWJfgc51xuPY8L17b88AX5bWPnI47EVAhOJ5jXio63O3GI/Txx5eH83/svHdmg1rwjy+kYO1oCjGUkippNPnFZ5M6pZRkBrNV5Pp8BqAAUYW+lBRaLvKEIlJquAB4AbiwfJXaXIpILiG53kwyXS6pTMUUZqygwJgi6pQytqH6GwpwffmlTyQNSBq41BqAx5+GZm/4PjiODnUIo8P+nekggDdATQd9ObCCbuCgq6ajPjYRwAtwbi7HPRVkL/j/tgp+94wnqA4lne3IR7EPWNwNXko67a2kY54yZn0DiL/vGMweGPv8VL/S3PmXh7X73PqvBgfrcylYW8IcZaAKZIZ8BwHY2otSX0xW0ZWSSltMKm0hKXT2YvsfpbGIOeeYg84AC7mUPCNGkjqpiEY/smbupZ5Y0u9JGpA04FoD9PTz6Xs8FPR1O1861lHNLEVYqAxUvUPopLecAHIQAXq2kdMN4HpdifjfCxnBJf/cQUm//VtJ9C8+4rdhMZ/1kNPPHkr60UdBJzyC6ISHjM6ERNK+QBXVBKmIMjMvD27345Pkrbm5/ESwrohZugDdYH22xbq1ga896OK1FXQtAAzQtQde8X0B4ABcmxRTp9TxFKTJYxZwbK+8czsPSVav69tA+kTSwKXTACiGU136nDreQUGQQ1f700lPhUU4mLYGmK4AV2xv7f9b+hzA29hBSefaK4mu4eALK1gA74/XyhjoNgSoGPB/dbUPA90jQ+/9nD7eeHlQDBMXrJgT2jWXW7qweBnw5jpYuwBPAaRi/D3AizA0lamM8cFBCQD5ETTr5bfnXLqpJf2SpAFJA640QJMen7nPL4J+DopkYHu8YzCzHAVoYmwJGPGZ/XedvW7t/1v6HNY2uGRYuQBgWL+gHgC+sHjPdAzh0RQ+IXTw/wKozj+C6m/t/zntrL48KM13951UByfeTaqUbA68sHp1BQx8haUqRgG4YlTqCx2sXkeLlwM16AVBW9is3UICl+wbPYoC4kBvmEluzCBV14HndjY0XB6KcTUjpe2SBv7iGqDqWll9WM/Gw55hdNY/lOqu8qKfAsLOA9KWgPGPBl5wtsiAA/iC5wX4Cq4Xv33UV07HlJH08bU+tFsW/usvQ9KWIgb5srl0ZU8smxeSNIxkxpHcwtUX2yIXLByvAEyFAQ41LnCQybW5lNpvVm3RtHeXTHmiZm7O+LXLEq6fXBeeVEoqYwEFa3MYfxtizCd/zSirBc0tah7ni1jf4IR8CtaNpNCuw2nxxp25l41ypAORNPA31ADNWlh+yF9Hx70i6LS3mlm2P/rxsTWwvWSf+yjphK+aWeMn/hlAJ9v50C9Xh9BvXuEsVvez9l70pUxF33brfoRWvdr3sruMiXeWH1KkjKQAbSbndFnIGMDXAsB2DrZAzSgKTS6mgLgsuu6embWrt59JdXZCa3cc73PdwEm1AfHpLIohNLWEfGIzWgZebQ4F64dS2sT5a5ztU9omaUDSwKXRwM+ZpRu+uUZFx73D2NL9koGpxVHnzu8hTviQh4wOd5TR8Q4h1HCtnM55hNL+q7yoVqWm7ZrOp+j+CTMvKytXXD441cK755M61UzyRHC6Zou1awe8AGIBvggDSywkfZ8HTuw8SGqxH2fjxydPet8w/MFamS6PwrqMIcQGi/1YLV6dsHqLCN9Tp2RTTK+RDc72J22TNCBp4NJo4JPkG44cCopj4WHugOCf8R1QDQcD1fRdoJK+DVDQt35y2n2tL32n0Zyip2aU08crLg8HmrNLVvXNuVSPqGEU2qWI5IkIH0Ocbr4d+FoSJizAG9m9nAI1GbSk6vBgZ/trvu2dXWe6IVQMVAOsXhEHjLA1UBUAW55wUcKcbP7xwyi82wiSohuaa1J6L2ng0miA6uraf2S8no7LdXTGP5pOeTqhGDzVzBqu9wmjQ35hVOcfxhIr9gdF0DfBEfS1rDN9Ie9MH6uiqEYd0yb5MDSGhGwLiyGbRNG2MJtsiYiirRpt4+4+Nx9oyM/eQA9MKqeN66ORZXdpNPU7fuU/7+zNACAGaLNJbiqwWqTNM9TYe0M+ATBvMz9R05afvMP8TG2wLoNk+kxSmLJsYjTzeF9tKck1owmJF3J9JoWlDqH1td9JmWxtUbL0XUkDF0kDtH+/94earnTMN5YaA0x0yiOKDrcPpCMd/Ol4x0D60RdOtig60D6KvvCKol1KAx3uctsBGjVmKU16eCY9vLCcnl+eTivW96VtO4y0/ZNI2rJT7SDYVvNZNO2sVZ8v3wQgo4xJXV17lq6MlGVncrmXdHR1TZ5a+fl4ZKQF6XKYVSqoAFfACwfZ9P++P97V/pxtHzHu5WUyQzqLWlCYAL5clIYcl8Bb9eX3TrljZ/uXtkkakDRw8TQA4N2giKX69hF0pmMM/c8vns7KIul4oJIO+Sro28Ao2ht9/Skqe3gpPbOiL228TNJuL54K/vg9PfDCpmlyE88mQ3iXFXgFp2tfm8GQzyzjV7a4RzOIoy99eO1zyqRMUiWPJKUp3SbGLFLpckilzbdmvCl1mRSeMoyqvjwiAa9QoDRKGriEGoBlWRvblX72iaafr1XTiasDqa69Hx3wU9IZY69TNOXhmRLY/s4LMuGpdbMBtggXs3d+WQG4GfCCjliy4bs2lXN84Km353VOGU6QcONgmxiGUIRuKEVo0ygiYSSTsIRhFJU0mDZJFu/vvLLSv0sauHAN7Em56cgJv06EELKv/+1BPxiMjTS2Yiba+Fz4XqX/tGpgysIqVhTHGmUgLF0xNgNeRVIhVX5Y38e6Azde1NY2qms+qe+2acuB1C07v2eyfeeR1O07v7cIXp9J3b79TOqWLUdSt2//PlUqlO6GYqWvSBr4gzTQYC5eWhsSSt+GhdMP16ceoK3ro/+gn/p77hbAC0vXKc0A8LUHXn0hKRKLqfLD420C3r+nZqWzljRwZWqAVSRb9HT6e8la+uW+gqVtCctCRAQ4YvrYIrUHZFRb+wdKjeyKiGJoPhUk4G2uEem9pAFJA1S3tf0vK55usWwiba1rTyte7UuPPjyzPjNtwyc9ex35IEHf+EFUwq8fhsf/WhOuYfJReMyvH4XF/7ojVEgc7VTH0Q5VDJMaZTTtVERTjTyKPpZHO8hHiijiEkMfyeMsoqGPQrT0vlJP7xt6Er27/vLLSmttCk1ZWO2+xYtUYUY1nJYs3tYUe5E/33/ypLe9XOTdX5Td7fzmUMD2z75P/fDTuj6QzV9+a0QSzUXZubST8zRQQ3T1ezu+jtm8Y38fIds/Pdxr3w8/R9XU0O+OZXXVfZdZtWMemPmt2tT4VUAE7QsMpe8C1SyZ4ZBvCB26NuDXw//yo/r2gVTvgdY/aGipZHLMQ0nHPVVMTnqpCXLKO4xOe4dRg084/egbQWd9uDR6R9BPXuFMfvTqRA3ekdTgFU0/ekVTo0csnfBJoINRPYleWXH5A+/WOmpfV0ftMUImzt0+J/b6iRQYn0NBmtzzqo+JYjhi7NxtDK3a9mt/th/i+8BF3orXlvfOWvk0/118FxMH/3ve/9e13IkY+4eIY8Brti/sj+hq8Tn7TgtdjasPUcBz62sHlzxWueimkdOqb8i4r1bfv6j2umGTagcUP7p1xKRFy6Y/v23ypm8oFfs9b+b/ARtwTms/Pd7n/oXvzx425r/rUu+qqI3rlX0uxDCQlIZ7yD/2dvKLu506XZdB1w2aUptW8fK66Yu2z0ZDUvzvH3BILncJ/T6/Zs/g3MnLKvU3ldRHdhlFnVJGUlhSBqmNI0iuH0Hq5FyK7FW8N/fBlxe9/XW9ztnOcNxCMDeFsLnR7Jrie9jubD9iG+ZW8zlhPz/sX4vfFf/r7jiV6Coxz+z3Z/9afC5Gd/ft6ns1R0k2Y+k7pUMrnqzU3GLeq7m5gCK6ZFFY4khSGdJIrh1OMs1QNnZOzabo7jl7h41duO6hFzZM3/j1Lzocs6t9u7ud5j+TXqvpfmqffyyd9Iujo94RLJHiuLeag6mngk51lDtKByWdssiJjkqC2MpL8jKTqCgmtp3oiKpmCtZWqPFaBZ29VsWSOJC+fNIrjBo6htG5f4dRQ4cY2udrIlqz2eju8f8p3ztwgGQxqcXnYnpMbezUtaKxc/dxjQBbVAZTJ5XQtWFDWwVeFMiJ6THuXOz1kxpjr5/SGN3jvoao6+9r6NxrfENE77ENET3HNcb3Kjn37vYDvcRJ3j93/eyYroWNcT0mNUT1mNwQcf3kxvDe4xs79RrfGNNjYmNsj4kNkb0rmHTqPq5R12PMuZ2fOa8B8eKm3RmRPQobY68f2xDfe0pD5+7jGzp3n+hUsK/OPUrPbTlADqFpm789ahw6buEaVUou65qsSi6gEJOZgnTohDyKZMYcUiTlkzqFd04Gr627ZUL9o8s+KsWNKs7rYo4f/XAm6r7nVs6J7WU+0alrKSkNoylYU8qKByG7D85PNBNFY1E0EUUUSnjyWIpInkLhSRMoInUMdeqeVz9nWfVk3KAX89ia72vLvkZ1wcxlcyN7FDRAT8hKhCDiBSOSbBAXjk7T/nGl5BNdyDqYhCSm08DRcyp3nmy0ppp/9ANFxfWc3Ki76f6G2OsnNWAuOMr4BlxrLmUNmhvHNQwfP29d82MS75HxmHDzfQ3RPcc2hHUtbojsUdEQed0E59KjoiHuhgkN3QaPrRX/7+4466Xq8aFdixtje09siO012aWoU4sbIroXN0T1KmycsWRDqbv7t//exv2/6PJnLl2m7JJ2LkA/jPy1aeSfgNoq2WwuyIzFJE/ivQ8xTxCRhDmLMFGFoZB1ekHGaXzvsropT62a+/aur50+AO1/s/lr1K/9Jce8Ya8ijo77RNEpryg6eo2CzniE0RlPNRP0X4M4AK8T0HUOvLxoOuvTZukYcdojhDjwKizAi2w5/lu/tFfTmY5R9FVQKoHyaH68l9X7A0dJptaNotCkcaxlD1rvoGQjbmwAsABhvBcWrv2Ii6g0FbDqZP6xWSzFF23e5YllFJxSSMEp+RSSguyzEbR24xdWOmLczMp5cd2KKdRUzFoJBZlKKSi5gIKTCtjvs2NIySdZCp8wyoQM2rztYDdnynvh3V0Fwfo0UhjN7HhFvze0KHIQ1guukKVCV277ie0LdSnMMxcv8dMNoNCu2Qx0ARwA2gBtFiv8jrRpCMADySJwPDIwMWRRkD6Nku+aUPd45Y5SWDbOjq8t26ZOpaueW79r8NDy+VXq1BGkTsmi8NQCVgtDri+k4IRC3rsODk5DPrvJWOdmUyEr24leeOjgoTKWk9JYwqvGmTIptnceDS6bt6xy+wGHB05bjs3Zdz/eT97jn9g0NzQ1hwK1g0iROIK8Y4ex4kd+8VkMbKE3AAL0FpCQxxqlhqVOIHVyGdMp6oKEJI2goodXzMFDDJ2sO3Uto4C4bApNLnUy78wkN+RYZBSFppjptpxpW50dH7bhoYMHJr+G2QyA0CHbuRSzB263e8fudbU/V9unLqqajoc1zpc9FHXmpiCLiAghjL5xmaRKyaOwbjn08LLqNiUeLd++p9et5unVQcZBpOqSTkGG4aRIhlFgJhgLquQiBrghiUXsgYxRlVTCABfzBfoPiC2iwNhSkmvLGADLdIPJMyaVNuz5zG0rkdavj96d2uPIx+ixFhBFpDLRUQ81NQR2ZkAoeqSho7DoKozOwo691jjVILZZe655h7C2PKitC9AVwIvavQDeHzsomIgC5wBe0BMNHmr6wTeKfrun6HNX1+iy2V574KwD8AJIYe1i0gNI8doV6NoA2EygG0BNoJYuKpgFGYrJP9FM/ok5DEwVhjTa+GGdFXjLpr86T6FJJ5WhyPr9gKR8CkpEeclCJsFJeQSBJafWjaSdXzq3eB9d/n6BV9Q9pErMZ8eKfnCqpDFOBNtHs/2tqqFu731NMfpbphySGW1WLawGYeECfIXgpsXNG961jE1uAElE9zHkG5/OJ31KHt2Q9tjW31NPAqCTO3V1ZUSXEg4qejOr4oaHoTpxNANSgC8EkSWwdiFXh97LABhF5NGAFJYxwDcovoiCNAVMAuPNpDKVUnhqHk14+s3JF2MCvrmjoVd8rwknIlIqmBWuShpFnpF3UkT30UxXqMHBABegawe8vFFqNgPgmJ5T2fVHrWdcG+OtM2srN1M3rKLCU0Yz4BUGgHVMyKaghCyrIO18QOEsl8CLa4JjASjievprIGYXksOuv+nO4jYD78yl70/H/OHWvn1XFcfXna8rZ3MmQIci/5vcBt75qz8rkCdlkb92OPlqhlB490IKMWVRiCmHnRvOD7+NFZAQWLnIQgX4AvShe5/ORRQQPZaC48eRQlvMjKKxjy99zt05gYiBb7v1PLArOIyOBHUmcLSgDRh3K1qy+/Lat/XeIQRx1lVYdBduK/Ce6aggJp684Dl6utX7cvkyJIroqRfL3T2XP+173xyiALVmJIUaykmuLSC5Fi138hjgAnQF8GKbEHHz24DXvgsFQMEReAMNuRSSMIyqtu63Au+kOavmdkrMJbUOFlwRBeqLKNBkZiL2G5RoJiZaM+G723ced2qtzV/5UQFSjmVoS6QDUHMr2sHatbN+g7RFv734zi8ZmhumnwjRlxMTQxm3jo0AfUt9YdSNMJpJacpzEGYBmwrYMhpLNwAesyQ0BdR7xJyaC6Eeao+SrE/G3K0AF4AmrBGFnotSV8oLyxtL2GoADyKIuLms1g3bbmkyqi9j+5BrcV0hFSRPmMC2BSZk/jZp/lvTfs+ke27N/sGduxcRuoTwB2WxVW9cJ9ALCudbKAZGM5gZ1QCrXZwjjk2WMIZkmrEk01Sw1z0HPVUDSxcPnGCtuUnMBzHyQkqWgkr6bFIYc2hg8SMtAi+OA6CL1lVcf7wTtgiNZEX+LYX+seLpMqiszcA77YUNzOJtDXihFzzcAaDuWryrPjnRDSCLhwbmGxfomOuZzUmszCzUDkZGKwB4k9DVBeeLVVER/UueRaGm+0mhmUAhmkKKu67gXGtVBe3nCj06vfzTTmG0+Z/X/Ppley8Gquhfhm4UrAOFt4xOeuK1Mzm/15qwasXo2LPNZvXic+wfBc6FMB44sBNrVnkgOIx2GZIbr4iEjjYDL8DZYnWJG8FxdA94pzyyam6k6dIDL68nPLpJnTS+MVg7hoI0ZSTTAXzHMQsMYM2BJJ+B7vnAKwCXj5w3K2HWk2fkKEZPTH9ha5ssyp0NFHBz2uO1KiwXEwFKxW0GXoCvABTW3dkZ8AJ8teWMUpIbRzZNWbB2tv0N5e7r59btGRzTYxxfYQD4xIOKrVTAI/KlLW589oAw8OU34sIBcOz8LA8XR+AdSwrdOFIaRzcBKIQBgNF+jl0a4G071TDt+U0XALyt1ziBxW7qN+kQHh7hXSaS3FDBxTiW5MYxFn1b5qUFfAXw4hqAtoNwIAYNNY6CNWUUkTSB0JygbPYqtxvKUk2N7KuUxMbaAB+q7diRjgSF0FGvADrhGUCnPLic9gwkRwmm05524sEpA9AGkObtf5qXkxSALIBXdBEG+DK6ISCCajsG0KeBIb/SjOkz3Z3Hf+r32gS82gLGLzorhu6YTty6xdsW4MUSKcKU0zaLl/G53KphFrDFCmbWeEIx+cSYm/Da0SrmVi9rTc9AhIMvOGyrWCYwn9gFLJQO/Bo6dcDBgeVjzE1FDRv3k1shU/Bu35z2+FZ1ch517l5AvnH3ktwwklENAH2AmuhhpzLA4i3hFr2RO05g9eKG4iDHzwfAq9SVUYi2pImBHHtQYlXCqYvQpDJWuN4nZsivy6q/b1Nnj/cOHIzpfF3eOQCjf1w6eUcPZRYnrE5xvLabnh8r5obgPR2AF+CrK+ZzyrKiAsDiwWctD+qw0uIrK74v8KiQbLbUHlD88EW2eC8f4J208O15IYmZFKQfyVYMcv0kkuunEhsBwsbRljngaBSIeSGAF6Og8UDjhCTkkFyf0dAWeoyKH5hZF6Ck+g4edNzDmxr8AumUN4DXj055cDnt6U82AQjbgS5e/w7gBfgCbAX4MuAN6kR7glR09sYbD1yWBc6dITyca0rtUObkAs3QItXAgJdzsq2Bb5ChkAKNkHwC1SDTDqGqD/dYqYbmwIslkCuqAcAbps+ibTUnnDrXHKkGOL6wFG8GuuK9AXzXGPKLy2P0gF+83fctdMT5Fq/N4ScsBzGp+RIvl8C94eYISc6iiF4l9OSqXW4t5fOmr1kGegHA7hs3iFTJGaxiG8BXgJnoYQfgBSeuNJgtZTTTSZ44/JwiKe2cIinzHPu+AGoLqPHViXBGjSK5YRRdG3YvAXzRXkmdUvDr8q0HrdfF2RwR2xB6NKDk/q1B2nT2v95RaRQQn2kDXmb54kFQwsHAONpK3+AaMoHFiwcBrHoI+GrUYNZns4cNRrSGgghqS4zC6nUE3lwGvHcUzL5owItrmnx3eduphuc3TQed4T7VkEYPL2vZ4l1f+7/48O5mCtJnsKYEUT0mMsAN0d5HIbqJbKVms3odaYcQk7lJYTQ3KU2YX1xUplwK0Y6k8GQ81NPomdWfu/3gRebZIbmJfvRR0c8ePtTQ0YtOdvCgU54+TE57+NDpjn50xiOQznjYgW0zoBWRDs0BWLxHp+AGDy54zS1iTlugLfspbxkTfAbH2h4vFZ28/uYDtHHjlZPCXHv2rCxEfzuFmjL5ExDgarEymnO8nAcD8JZaeVwArGdUBptsIPEBSOzG0BVQoHYME5+YUax9z1uf2oB3wuw35irihlNITBarucuA15DLQFrcYIGmHILAYoJzbVtNvVPgfXr1RwXKxCyrQ4oDr6NDw34bHD1wlKmTyymAOZ9ymRMHoVgAAt/YNApNyWfOm0DNSNYnjgEe41i51QnLk1uZ+B1b+BQeMt4JWaS5aXRDa7GlS6q/6Q/HHrewiy2lMdM5kFmW77BSlYZ8CjMWMz48RJNJYYahDbP+UzV+575GtYhvheW8cddJ3dR5784NS8pviOpSQX6RWRSSYCYG3IIOMAKER3Hrl3G/ZdS5e3EDojsEwLoa57/xQam/fqDFsgWny52g1lFfSgp9OckNE7gYxzL6BucX02M8aw2FFlE+0els6RsYm80eJBHJoykUlruW9+sT80+MYj5YV1WWmiHcuWimIGMO3ZbfMvDaO9eaP5gFz8tGFIcymS8QeDcw4OWF/fOtVf3s5x5eY94gtA4rpNaAd+Tk15bA0gWgI1EJBgXuP3vfhG90DnuQQk/qJDxM8xornnhv0ePLvyx48Z0fMp6urC3NvW/JkqR+Yw75RfenTolZBGPr5uGT2hQyR489nX5KoaHj3oHU4OVDp7286aS3N53y9KIznt70o4c3ne3oT2evVdCP14bSmQ6hdLojl5MeoSTkdEcVQaxOMouz7MeOIQRp7CijnztwweuzHjJq8AyiM15BzLI+1tGD6j286ISvnL5Ff765YdAAACAASURBVDVj7yNUXf2Hhku6uicueDuAV5V0K3VKyWCWFJa1uIBi0ts71xyBt5SCAMBGDrbsSW/KYWEyol1QkL6cILB0/DV308odu62W1UNPrp8bZcymCEOhW8CLcLKLA7yIxeUhZbDMfHHzm4qZ5QavfEDCIIroxh8UaDkECkChz+GW5nnAi6U0jzDguimgQH0B+enzCY6n3fsoqqULc1fpI1XwSHNOttRixWZyQGOONc43A5R8Ow2jUGMu9b5n2lY44lra7859pB5a8ny1ypRNYUl5/LparFGApA14LQ63/x8h8fTKXQUt7RPArO2b3wAqBQ8a68PCAAC2SDPgBThgZYSmpcwJx5yVcHClsQL4oYlm8uo0nHwjMygwNo9kcUWWwveI3LDNQXeA99a8GS1avG0BXszlpLtGX4DFu2E6qI+LBbxYYZj63XfIBro8ZBBGCl9x8lZcAN5OXcaxqKKYHmWH3t/tet5t/upEt2lzV8wx9h7RMH/pujbFEFNB2dIfvBR0zDuQjnv70kmLnPbypTOevvSjhy/9iKLoHVT047XhdKZDcxEgrKKTHiprQoSwgNF6nQOvnIGvDXRldMaLW7nHfYPosK8X1fn70P5gOR1Ove4UrX27zTHILc31S/IZgFdpuo3CkzNJocsneNBxI7mc+Ahj0gN0y5gE6kpYKFNIUjbJkkaQv2EwBRuHkTwJ3Suw9Clh3JTMdA+t3WGzeO+f8+ZclH1UJ+S3CrwAN4SeuQ+8NgvU3hrFa/CPLNYR3l8Tj32M7F5+bvyT786t3LGnz5bvT+o27mmIX7mjvk/utJeWAYTRAUNlzLM4KCwWL0K2TBYOE/G18IjDytcXUHBiCQOWtRttURzNL2btWZKFJA9mDwEr8AqeVIcwn8nM0YTPfDoPo7DkbBpgfqIGcbPN9+XsPSzg/uaHavwT7iCFCVY0lpYcIDnXm88jHbQVLFTt1izXHCn2P2fxhvERXdOZJ57r1InF6+BcEw62AgpPLSL/uBGMu+5y5317B42eVzVs7MKqHoPur43uXkyMu9aOI2XCZAqJG8fmA+aikObAK8LoMIKegsXbJ/ehKwh4RVRDyxYv5kiwIYsl7kDngqoB8NqDb6fU8Yy2QcghrFxn86H5NqSa19W1LcngcP9BB/ZeE0hHfBCbG0gnvUApBNKPHYOZgMtFJMNxT555BkCFVYsss//9W0W//FvBkh9AHYgwMxHny0YvBftfweGCx2UcrjfatfNwsR/8lfRNQCDti+xMP/W/fQNVv9WiEdL8vC+b91vr6tpPWfDC7AeeXT17ylPrZ0+Zt2m28db7a5hlpM93SBlmSz074A1kFm0pBRnNNHDMosopz6+fXbHwtdlTnl05e8qzq2dPfqZqDmTcvJVzxs1bMufTo0etFuD9j705N1yXRWE6O4tXn2ehGrjFI6iGiwm8mMBIgvCNH0HK5Jwm3W0Ve99vwTJ989NTvdTJaY0Kw0jmxcfkB83AYmVdAG9IymjyiRlCzy/9wCV/NmPp29MUKWkU3g3Lc/6w4+BYyEE34X5SaCeykLJQUz6FJmXQxtr/tan10fs/nImK7DWcFInDLPQFDzXjQIalPQ81844cRRFdzdSSJd1v1MxaZdII6tRNOOn4NcK+rFSDhXpgHC+LbChgD+Co6/OocOayZe//cL4ltmUfqctmr5ub1HfaufDEcRQQncc7kLgBvPAfcBC+0oAXVAPCyVoG3vW7G3qFduEGAue18ywPeBvwgicH8KoTx5BcV9L03Oo6t4C3rQCEGg2bIw30naeajviH0WGLkwzJDKAWALBIgDjio2AdKdCVAq/rvS01GDw4vQBQ/t5PQfsDQ+wE7xW8OWWAivVpOxAYQfsDO1v6tEXRJ8oo2qGOovciIn/9dtiAz2nVC31d1Y1o67ldNt+fsmDDbAG8SIpw4NbgDDGWksyAZeR4NmIStbUs5NQ56+aGaUeROgFAA84YAM5vJO4QKrQ628BrtWTxzl+5wyGO1+F4LQXdAd5c8qlzj2JSJI+i64bMqHHHo7tlz7legZpBjPdFK3thOQoHnj1HCM5bkQLdZNHCF6pdhpUlDiivgzMONxQDcoA54oUx6qaQUjuNlPpJpDTghsr5rWjGikUXMkGyJy1cojQNI9ZSCTSDcGqxcC4OvD5RPCTs4cUfOw3mf/OLU73UXZBYMoQYl86iI3gih7hW1lFXTL7RpeQXW8J49K4Dp9TsOEitZkRtOdioHlb+ZGXn7qMoSJvpED7GVl+iFrQhn6BjqyBhwGCmW3PcT6Dg88CF8xXz5II5Xu5cEwaKmBdinojRyvEmZNDDy7Y61Tmu9ZIt+wcHaDMt8ceWbtz2jknLtUQsLlupaosp9bbZ9a9sONP/YmRR2s83lHXcHGmi770606HASDroqaJjV4dQY/tQ+rl9BB3/t5q+9w6jfWhyGRxJxzvp6Yy2y6lfu9xwgG4c8DmTm+/4/Leb+33+c99bDpzte8vnZ/vezIQGDPic7hywAdJ056ANNKpsKeVPWkrmsUtp7H1Lac6jM+nZheW0fEk6bV8baX9cf6nXUxa8YwVeZLA1BzLkgcuMZVbgBa9V+aF7nnGhKKfAixsKdIDF2y2iHBjwxme2ENUA4M2yhSA1qxksJjwf88kn/l4K7ZZJG/e4b0FmTli0BuFe8LpzC89244obDCMAISR5TIvAu3zbQRYMD2s3rAsy0iyxlghbA/DqJ3Dw1Vcwy7pTl5JfH1i4bfLyjQf7VG4+2Gft5j193tq8p8/azXV93mLvD/ZZuXF/n5Wbd/dZ++GePmu37u6zfPPuPpt3/9xn5qLqOQpjWhOAl1m67GblCRpI0oD4RCLqpIh6DpnntGHpfYs2zQkwZlGwcQTjZ7kTzBJa6BDXDWAvZY41v9gi6j3i8RpQHuKauzPe90zlIvTig4+BW+Y2J5WYh1bQtcyXPwJ4L4zjbSvwjmwReNd+dpI5X8HxWnnjZsDLunHHF7BECAG+CCVU6osa08qWVE2Z/9a0V7d8098d52lL1wfA+16kieo8Ixn4HvOLptOeUXT4Xyo6FBBL2zzl9NOQ4RvomfnpcHT9nnq4zS1ZvG++raVjvWI/m7qwaraI+YPFa7MWudV4HvAasqjSLh3YnROfOueteWEJOaROKCaFFkkMZVYrRlhlLBQNEQNIamgReD8pQCiVNfaTpdRyx8N5sbpoZ6RLp1uyH3AKMq6Ofd7rH45Hfzg45loDXllSGXNgubJ4579RW4piMUgoCE0dfd5SHTQGLF02GktIpsmmjmGDCKFAcm0aKbT3kDLhHlLGp5NSk0OKuGwKjhtBsoSBpDIOYlXAVPoMtk2hH8Wca1ZeVwAvCzcTGXLlFBRfQoYbHznnzFLqMXxWLR6CqpRsCtYM53oWMd3NgVdfSJE9Kljo045jFONKn662g/pKuqOijmXw6XncrgBcMf5dgPeDgxSDmg7NgdfqE4BzW1tEIZp8ksXnsRG8OOJz/WPSWNhYRGouCxtLuKG4MWfSy8sef2F7wX43/QT210gA7w8e0XTaV0NHO0ZRvXcMfRdqIJowaSZt/gtbovaK+CNfuwe8oBvGccrBmHMFAW8xc1ZMf3GTSxrAmW6fW7NzcLB+KAOUloAXVi8KBAHwXAFvyayVC3lIHn+QOWZ+FVosYFvYWkz3CZawqxK2X4Uhg1T6kaTSYolZxqga3HxwAoYm5lBYYhFzTPl0SqfgOIuly0DMQg8w8LXE0VqAGFXPkLb7zueOYIlwNZkpg4JQLyI1nwLiuTWKGGAhVpoB567PJ5/YNEqb+KLLamHO9Gu/bcqCqtkiqqY5zQDwvRTAm3hn6QVENbhr8VqcawktW7wIR1R3zT2BkENYvCzzT5/nkCkIPSFkUKbJZYI4fIQfhmhHMfD1CBvCYvMxhzonjSV1nJk0ycXnJk9/c1HNgZajY+yvCSzYTVFJ9J1nLB0NMNF+WSLRvYUbqFICXHs9/a7X6EAhYlSRG261NCwcLF9aF1siGxBSlkPL22jxTnls3TxwvAAPLE8BRCLhou1UAyxes6VWA4LxedqyCLlxzE4rZdk/qz4+2abmnLu+/albiP5egpeZ6YP9Bg8l479new3gxdJ+4QvOwX1Y+fNVQQmcqhCVznikAI/TZBwyC83itRq4PvJ5GBjLahtFCr2ZgasN9ITTixc1EsBlv2QXS3fb/3Aghjc8SJPHrKcl1Y7donfuO6hWJWZa0lJ5TQoBuGJsvj+f6Ex6auVul47F1ibnus9+SvWNGcmqmfnFZ3NvPhyvFnHQN+N+Lz7Ha7qz5MKBt6X5h3KNolZDK8ALPRXOWLEIdUgQAsj8C4hOMWWySBWlEaGHI1n8M8AXAuDlhoFYmRWyqBGVYTSF6iElFKYzk6f6Tkq9ZcKJV9b/MLi16yE+33XDnUf2+BloV2AKUdGspX+L5b84+UsxthV4ARoXArwoRymAFyFqgloQN7IDx9tCONn8lW0F3kJataPBWhvYHZ3W7mmIV5jupUCj+8D7tAvgvSl91t7zgZeDLuOzEfZliYllCQmgBfSFFKLLbYLYAJQvxZu/twdd58Dr+H+glUSyzMJ1XznEdn763eH4iMQMBsoB2mJC+CALZXJp8RaSV+dM2rKfLji2EkWG4q6fdA4Wnnc0HJA86+2SAu+AywN4UdLScFtpfYBmBIswQhVA+DMQIsiAVz/KCry28Dv+QBVOYICuTUpYsgpi02EZR3cvpdzJLy9zh4v/cpR5w6ZOqURT5s1sDXS3Ul37DWc+jdr8yx7jB3Qg5s2GnQHu3Gd/6+9MebZqtiiaDIusNYuXAe9WW8lHd5Q35bG185CNptJyZxrKSDLgNaGeAF+yuhtOZgPeLG71tmRxGEoZcKyqOeM0C87VsX+670yUwjiUAg0WZ2MLFm+IaTTjY10Br+GWMYeCtbzCFNev2c6KFqBrq05mX8krJGGMpf6CI3jag29bgVeAMxyps5Zuc0h1/nh/vS5UO4w5bwC6AfrWgdc/Npt+rzPH2OeBOvgWsPL6ywFvYh6LbUcJyZaiGsRcrPryTGpUj5JzSJJAxTrB/bP4ZzSb1SEmG4k+jqsgwQXbQBcAjFBIMyFEERmN4IKVuhGUNWFBpfg9V+O+l58tP7roKVZykWjqeZ0rptLUq0pOvz685+Zxu2OWD6OQZ/oxCX9xICkW9Sf96qymspNL5s2jndai965+62+5vUXgRQETPU9bRBIFKALcHMsvBvA2KwvZduDN/osArw10caPZgJdXF+MPJl7wRhS+sR8dqnfp0LrJ9XfxGbLKUCvCPzaTpjxbdR7wqhOGsrqtsHjdAV5EZlR/Q7/Lwkm4cUq9b1wWqyV7qYEX1JnxjrbX40V1MhZ90NKDH1RDG4EXIIR4cqXJ3Ijax9z5agFRK/DmOgVe0FSsrCgSoyzx4jJNFvlGDiekbKMRQSd0VjENo3e/ONbiKpDIdcJFNR2QdXl/6u5/LB9AnuvvoXav3kCe6++kf626lf7x+o3UYd2d9M8Vfema1/pRwOtpNIXeHv63BNeWTtoV8Nq4TQ68iEQA8GKp2mbgfYJbvHhaA8hF4XTQC8J6axPwshAy1ONtnePF7636hHegaEkP9p9xi3c4L/jTLFzNgXNExTPTGJbp5sri7XLnZEY14P9Q38Ke32URHHb8LoA3ImUCu9l8onjIHEu0EFluLA2X1w3m20VBHNGhwVI1zPI90bmB1S5Geqs+m1CPApXGUFx8+ovVDsC748CxmMiULAa8oINCu0ygIC06YeRbRXC9YuwQNoLW1bRNv/a6hrUMmgGrAeinNeDFw+O27Isbx3vd0Ilt5ngffH7TdHVSkaXiHSrdOZELBF7op3LLkVTTLRP3BmvSKCwJ0QojKViTQUExIygoJp2C40cxB5tCV0jRXSdSZLeJjCISli9GPLQBvHC+yeGQjS+kTomlJItPo4GFj1+QQ/QJ2mBUvTmiqd3KQdTutX7Ubm1/arfmVkdZ3Y/aQVb2p2tev4s6vHgHDT/w1DxYyfbX/m/9+lIBLzzzAngDjbxjxQUB74rPChAZwMDkDwPen6NQzSnAkMe86o5ga3OsAdRtwOs8gWJQ6bNVoBqQYgxKxwa8wrkGxwgoh3Imybc9UgfOdOPXpHt710kdmhT+Htny9S86RyHdh9+TbsvXpENtYPvJX3PgqCw49h4KjkM36bHkn1DUKvBGpI6lR5bucOCK7ffZ2uvKHad6YRXlEzuSYPVeauBFIfTu91Ycau04m38+66X3ZwfEZbUReLe5TKBovn+8R6TD8+s/HZwx8cnKlAFFDcHauyg8ZRSjtuBcC4jJJv+oHCboPiJAV4RoMlpJZwHe+EKSxxeTKqGUfDulU1zPEnKH67U/rlfo8xjZ+iFN/9hwF7XbOITavT2I2r3Zn9qtvdVOLGAMQF49gNqtuIOuXTGQgtcMp7QD8+bZ7+9v/fpyBF5eJMdFWcjmwNvMInVMoOA1a9tu8f4cJTe2DXjnu8hcm/bcljlYKSCWt3mMNEBYlHdU6MYTRNN7yrk/c0Im9i0/4R+TS8rkceQRlXOec01YumIMjMun6+99oLaGai6oB13GlBcroRcAb0vONYSVcf+DO1ENvH4HqACuc1sCjOP8KGRJLWHXDXMa09zSdcidtngJqq+x/dl1PHGIqrGzeNHT7+FlbQNe+99HEZ2NX9fr/vvW1xlTF3ww5+68l7Ya+84+oTJxHhirkoC4XNanj3cz4f3rEOoo12WTPKGE5JoxFKqroDBDOal0ObT5y7OtZhmKY1hBH3tHrktr+sfK/tTu3cHU7uXrLdYugNYOeNf0o3ZrLKC7agD9a80gare0HwNfz8V30OSf3igS+/xbj5cGeN+c667FC4vHLeCFtQu5DIAXnOn8F51bvM+v3zMYN6e941I4MAEM1poNKJajG8cseRTu+bMmZcG0pUsYqBrLyCsmny1fBciePxaxRpsBmqF0/wvLHGgLd46/cscXfVh6spbHrQIkXVm8LJ7X3ZRhrESQcclSyF2BLrYDzM3koxlAS7ZsczvkEIknXe6uOIHr3jLwFrJ+ayj1iPKkvwd4XenznU/Odbu74Jlq31gku+SxTFDO78JpbWax4Ax4NaNJrhlLnU33kzJ+DPlHZtGSqj1uh5cN+fKBeV6rb6d2y2+kduvuoHarb6V2b/R1pBhAOQiaYXV/RjW0e/lmar96IF1VeQf9+7W7SPl6Gi2nrW3KcHR17lf09taAly9bLGmn6Ad2QRyv+8ALvk+lzaRtn7Rk8YquBbYoDAFm3MLhyQripmi7xXsmSm7MoABDQetUg3Esc1bNf/F9p0ka6G8V2gXNM3FM9imxPLrBql8kN+jRlPEemvXShjYtSS/mBFywcmcuCpP7xhdQgKaEAS/68wnQ5c4+HsKEY1ebKgixvIrkob++suUrt2/kDXvOGuNvymtAqUyArbhu4jqKsXkCBYo09cl1zfGCM0a7HHXSOEtVL3tqyBbGx+aGsZAVUfJLGErDJsxd464eX968p0+QdgSLtXXQB8IARRF+Nhay0qlw4CF2etbi1i3eC+nhh+O+s2juOlYLxIDsyGK2ksIcFrG/soTRJI+voODocRSqn8ws4MXr97t9veLWZjR5bxpC7VbezGVVX2q3sg+1w7jaXgC+kL7ss6veuJmuWoHv3srA1+P1QXT/r29JzrY/A3hbcq4xJ4tupOvWPyt2FSBo3OrNh8VrJ+IGto0X5lxrC/AiSP5JF8CLm+LG9Bk1HtGDWUtua+UpS1twUUOB3cCGURRsuJd0t+TWt/UG/PjkSe/Fb72fu2jl9txFKz/Pfb5yd+7zlV/nLq7cm7sY48rduYtXf577/Gs1uUvXfpL78lufZDgDGsSSIl048roJDLyQpuoKePEZuOnQpHJmuYd3zaL7F701eWsLNRuwZH5q9RcZ/nGDG+Hgc+S8BZ1gu6ZtBV7oLaLrFELsNC+n2BLw8q68yBYLSU77ddWnh1v09ENfsHZ7D39oa6Amg3XO4M5hy4PICfAiqgGFeJAW/cza1hNNRk56eknh9GVrvmnGvzu7VvbbXtnyw2BlUn4ToiAY8CIRw5hmAd48AvDKNBUUEjeelNrxjA+u3HbULeCtplpZ6GvDqf27A+mqlb2ZtFvJgdURdO0AeM3N1G71zfz7b9zIAfqNftRh1SAqOf3Kg/bH/rd8famBF1YSi+NtFk6GOqtMNLmEEpLbP3PRZfg84IXlaBN+I4savdwCuWCLV1/klsUL4H2iBeCdvri6VJWaSepU3giSL6fRQwxLQ8tqAvHMKG5jTKMg/T103zPr5rRlQmZMfLxS0zuTVLohpNKmkyohi0I1uaSOy7eImdSxWU2oixyWMIwG5T5a7Wr/g8csWOefkEGhKWOYZxye8+aWHbfUiymy62RmFaO7Le+IkE03pc/Y++za3Rn28b1w5Dz71v7+t2XNrUFFsmBtThPAyGYh4lq5Bl6R6diaxYtziu45sR7OTLQ3b+4Ytf0epyDwoEfFPT/NCOo68L5D61ystLBfPJSGlj23plNXdERG5brz46ttD3x+PuB20SwALZTWfnysRTrj/X1HoxSJdxEqzKUMGHPo2dW7M6ZOJbciAWYv/aA0utcYW/W7xGyW9cYq1bHYXxRJqiCVDt2G0Y24gN7b09jqgwbnvXjP+l5ez/Wjdst72oB05a3MirVatw5WLyiI5sALS/lW8lw7lIbtm/+iq7n3t9l+5QIvWtCDarCBLl5fHOD9OQp90ALcBt6iFoEXVljszeYTvOIX0mL5cTsAr4VqYP3XTOkU1TOXRj+ybNHOgydbDED/4MD/YgYWPbpOlTSMlKZ01rki1FBAYYZSCjOUUSfDWOpsHE+RpgkUmTiWeLGi4bRys+skmKpvzqSGJI1gIWc8Q8o18MLaDYjNIzh5AuN5CjMy43xjMljoWmSPMY3qlIIGABU4Ub5ayaNOXcpZF4XmQGW/esFrYfECeHkp0ZapBty4RTPXLEIBfHUyQiBdW7yKRPTkK2ErJkSchHYpIoVpVFPqnZNqMyf9d9nUhW/PK3tsxdzyx1YvShv3QpUyMZvVaUYxKXQyAe0mwiHF2Px8/OKzWJ3iQO0gqv6mwSGKpDnI9M99oDowYQBFpGazgvjBcflNmp7T6wcXvb7kkZd256KQTvPVBFY6T67ekhF7Y0EDAF5ksKHvGrLeWM8+PDhZdbpyVu8DhZjCu2QTHiTNj8HZ+wWfvdo/7PUR1G75DXTVGzcyAYi2W4mwMQut4Cbwer81nO74bKYEvCiSIyaRfZUo6xLKUliFXbgL5HgnPGHjeO0tXlgv4kZrm8XL24GzrK0/DHhHsQQCWOfNb17be1hNFewGfOLFltu8z1qyYXJot3RmWYV3LWMPDNzs3AONUDJLgXRYUbB8UYw9eSQpkoZQ9tQXlry4aW/Gyg/r+8Aie+uzk/0ffnnr+DvMj9TITcMtDTPR3DLHWk1NeLZFDzbWvdiQT52SR9Edua1Xayuc+fKiAM29LEXVqcXLMg5tNX9RYU2mLWFLWlaEB0tbZOyxBwpC5lBEnXdyFjHIGLEMb0432IMXr46H0qS80zK+e1uu655rAI7Kj37oj4aRnDt2vH7C4nW4hgZeP4QlCFkyKa3Hqke7Jl4XAZQL6klDkCEmWmcJ0MVof+x4DZ8F6kEPHz+vxbjZJRu/GuwXcw97eMJKVerKSamdyAvYo74J6DTjKIq9qZh0txXVJ99TUtt9aNne4MQ7Kdg0mFDcCFyytXaDJZYbqcI4Tj4fYPWiDnQmGfsXuN2DbRvtMQa/NJDztAJ430CcrsXJ1hx08d5i8f5z1Y30T/DC2LaqH3VcfS+L6XUG8H+rbZcCeCc96Qi8LInCiDYu5wMvrKWWqYYvC/BUZ6CLRp1/EPAizIv1mWOZe45Wk8NNa6xgk7014K05SzJ196HngvRpDGxg9eLGFDeEAEobANs68rIymPosgucaVg06FaB6GG40YT2zG9PCMcr0JU1MDEVNADZr5IQhn0JTR9LTb25vtXMBYnyNt41pRAA+AOc8qqEZ8OL4XQKvTvRqswNgCxDbVih8ad4cuC4EeMEjJ9w6ei9vGOl47RyB15YcFKwdQxB2Dtoi6/wCUDFJQI+4ElIklHPR8kpxXC82yqH58SNGWZWaRUuqP2uRZki9o2JvWCJP8VXoCpoUCRVNaI+ESBfw6AhTw4ME1AWiJEJMsKSzSGYcScEGXkAd94J4CIgHHXvwWoG3lEITzRSsHUiPV25yO/YaoYIRKzKp3Yq+Nov3AoH3n8v7U+HJpVJI2YUAb6WbLcLFE0wAL5vAOkz2Yga6zYEXQILvhGlbcq61DXgBkm3neH+Ochd44UHHZH+sFYsXuliw9pNc9KgL7wZLOZ/Cu+KmQnqnSBvmSRQ8mYKnDyM+0z82i1A5TtzUjJfUmln6dgj63Fm6NATqC5qCDUVNwcbC37jk/xZszG1i4IbMKmMxJQ6YuNfdwPmHl7w/jdcFdgK8bCVkX25StG+3UECWcD8OBHjAWNJY2bny85TrRjdxILSBrlgBWUdWiL9tFi90/d9392b4xqdz3tiObrABrwDdcpLpyik4YSwFa2GlA3SREZlJKNIu10MyeVfkhCJWT1qRUEFcyi0WvWvgVSWNpv7m+S3Wg0Z966huJeQXmWsp/Vn2m0Jb/ptCO6bJBrxlrGpcaGoJp0SSeIdk7qwVlJvtOLjlW8ysXVY0HXqHwaIdQbG9MtzqNC3uX4y9P55Wc83bg+yA944Lsnj/79U7aBZ90ObazfbH8pd4zYA3sZDxb8jjR0iTo+Bi2i0pjUVUubXe2kHYHSVMYRZvBim1uazHFvbHLFUArbUAtpkvlfQ5FKYbTts/O5LqbN/zVwjgFXG8LXG83Du+6pM2Fsn54UwU2t4wa8vuphWWrrD+8F5uUvbShwAADQVJREFURAeKbHrMRRxv83MoefT1hUGG4cxqAf/HODkHUAIIC2Dixa/BnwIw/OJzySdmFKM+0OssIAGZddxZyRyWDHiL7UA3r0lmMpPMZFkCm3JomxutecQxg5vuPWTGXnCCACNxrfh8KOWOQVZk3QLA0BUDLVFHQ8ynfLsHjOPDxWqZW9o1WQFXRKpcIPDiHAaWzl8Hi19cN4znAy8K85czaxcZhixsjnUPTieZYQTJ9ZB0kutg+eexdGoU8xeWr6BSxJwQ++djPqm7Zp/7yEn/OaFjjNmTl64JRNZeLFpjjW5SaAG8kNFNct2YJjyYYfHimiOtGs5czB2f2AwWHw5LWOhN3LtW4EWHCh10DuAtpEDtvfTM2po2l/Ec07C81z9evoWuruzL6jAgLhdZaf8Az4uQMifyj1V96Z9v3Er/98atbOzwWj9K3VTe4kPIXi9/6ddTn10/W5VkJpDx8DajfxhrCW4AZyiEAyRAAlbX8jYC79Sn1s5TG0eQUptlqSvL+SpwVnyiWMKH9NmEbgoR+oG0/bPvWwBeLB9xc2dZ/1+AgpXjYs0YeV3bljzVzi7upz8cjVImDyFZomUpD0rDIvgd7nDCA4nzk7hBH1tS5TSOt/n+4aUeP2/V9E7dzeQTM4y1lEdYFdJP+TnYYmSb39T4XByH6HSM1QO4SUiwrqgpMCH/t8ge43+TJxb+hqB93KSgJTR9Suoraw62qUobjh0OmAFmBOgPZYXRVYmFhDRh785mCoyFFWu5qfWw0DkAA7wEELEHi6XjMQrqYOkN3hMPXoy+cdm/YcR2pAwLABE9+QRoMqvejQQKe30jqiKt4uV13IrNI9baSmepYWt52LGoEvHwsPC7bE4ynl3MfzHiPhDLeWGMCH6Yr+QAkL6xuYR2SNE9yxpW7drbos6RDt65ewmr9+EbmUYhCflNCm3pbwptSRMDYRwn0x8vms9/32Yc8Qei7b2gGPiIrs7jqVPK/WwMTS6lCfPWz7bXUVteD9g7Z573q4OoY+Ug8lh1L1396u10TWU/Bqz/WHkr2QvA9v9W9KerXr2b2r1wG3ks60dd1uU2LT/zvrUJblt++y/33anPvjNblZjPmi8CAABooriKw4gsGPQYY/V422bxcuBNJ6U22wZa/794uA14AaSct1UbMi3A25LFK4AXFpXFIrdwjvY3OiYf4nHX7apvcfI3v6gAXlXqvRSShFCjnKbghPwmkUAAR5NNuMMoWD/cbeAVv/XKlv39w7unNfrHD2bB7gjvQfFrh/MRy3nLuQHMxHFw4C3ioKsrwzK5KVhX0qRMLGuCJYwHJMKkwAf3TptRs2VfY4vREeK4nI2IXc2euniJOiWT8JAG+Adr0PF2soUm4TSCDXiLrCBsz1njeqBnX+cepSy0Dnz17TnPr2PRHaYiRqdcTOAV55JWsWwd4m5x7IiuAFgJi1Acs3hQ8FEs2S2AxkDYVoiI3RcWAOYPPg667CGBSAytmVmkq3acajVcq+LJlQth9IQlFVDsdeN4FxFt4W8KXTETub6oSa4vaILuEBXSHHibv+eAa3FkGoopPGkSBWvKGF31yNJP3OZ1he6ajzmH/jsv8OUh1PHlO+mal2+n9q/1Z+D7zzf6MesXFjBeA5DbvzaAPF8fRl6LB5HutaymStohUQxCoVMXbpitMiEjrcTSmcBmrbBJaPFKAxC4F/oCWv88VTVPjcmryWdFOuAV5gBjsR4YwJSSPKGIwg15LM50y86W4njBVSGbCje4YzNHsUxnIzgtQ/oFAO+ZKFVyBoUkWlprw0NvEbbMZI4VOFc4LYCl+Bw3qQahd4xVX36fev2QqfUABDz8+E0kLClYj2I5b+NSmfUGHpJJiTVMCO3bEU3AiqWAftDkMkBPm/DcGnc5Xftjc/b66VWflIamjmIxoD7RIyjC2kNOOM84z2sPYhzgRDRDDgutCu+eT/7a4VQ2Z8PcjXsoXp1SzEAXy+g/AnhBmaC2AosSgUMS4MtWdrBg7fVto0ycAvB5NJyguSzxwoZ88tOkU9dBk/e6WxwejsBZi2vGx/ccew5lG9FFmEVP6HObFPrsJrk+j4GuANTmQNv8vfgeH/GgLmGJHo8s+eB3g66YEw/+tLbI76V76NrldzJwvaayP7EaDqjjsJK/xraOywdQ8LJ7qO/GKbtX/vypZOkKBWJs7lyDNcNBUTz1LYBgGEmKxBEUkjSEKj/c0yaO9/4Fb82DJSvX5LAuFOhEgar4zakMcGgRRjOFaYeQS+BlHSgszS7tlrTiZneweBE1YRxC63a1bYn96Q8/R6lT00meDAuNt8kRgKfQomGnnejLWYm+CwFe6B/LYSz/YnrlNwbr0/hqwwoGAF5HMBAW73nAC5DWFzJQCU/No4hu5hOPLm89esF+Lrjz+s1Pj/Uy9RtzCCAWrBtpCROztZ5xnDtYJVlA19JJwTv+DtLeln/o1Y9+YF7+976mGFAiiKdF65+WgJd/1nKRnJbOYf0Xx3rdlDatRpE4jGUIcucZHv5O4pTZNnEPuLZ8EVXAQrlMGRRsHNYw48XqyQD6lo7D2WfoiTb+iXfmhiebG1D+Eam+LPmhWSlQh1WoE0vcPlQPDuIbh8+qrdz+fauWt7Njamnb1FOVvbpvKtunWHwXBb90F3m/chd1eJULXmNb6H/voor6/z648AILKLX0+1f8Z8+u3ZGB4PCBRQuqBhUv5FL6bBXKGUIGj36uavDoBVWDy+dUDR07u+qusgerNn/7rdtVjaCgJyurcwcVzqm6K2du1aC856oGFz5XNajo6apBpfOqBo1+vGpQ2dyqQaMXVA0pfbYqs/y5qvTiJ6o++Pyg02XJq9t29x9a/nTVgPx5VUPLXqy6K3+Bg9xduLDKKkVzqzKnPF21cc/hNhWdqT16VjZ07CNVA4oer7q7aEHV3YXPWWUQjt0qz1eljV5edVfe01VLNu5yK/3S1YQBAD/88qbxyXeMrYU1hgdIcAIAgS8xUfs1PKWEUBELPCsAjQGGFtWpxrKAfnVKNg0bt6Dqicrq3Itl5To7XgTxP71qV+nNaY/XAghwLFgG47hwfPYC7hpgENkDPHNu/YyX1423B6b3DlAM2vz4JeSwFYYAXjE6Oqv4effLaTmO19kx22+rrPmqW95D/1mmTEK9hQyWyIGkCAhWCghpZE5CB0chaDju/wCggR5QJeUQMhJ1/Qvr5ry6YfLF0Dn28czaL3L7Zy/YyqgnUHJ6/tt40EHgi4GwY9dkMO5dvPeKHEKhKfk0avIba17ZcrjFEDZ7nVzo6yVH1xgfO7j8QfNXT71456ez1vb94L61+XsXzFvcuGn4VqkYzoWqVfq/P0MD7x34X8wr1d/1f/ilbeMLHlr6XNqEBVV35M/a2jttcs0tWdNq+ptn1NxdMqd68Jj5leOfqJr3+Gu7Std+erqPu5lIF/Octuwj9ZKN+wdPfGrdnBEVC9f0z5u9tb95dg2TvFlVudNeWvTI0vdL3919qpczYALwwpEG4JUn8YpiAnQx/hHAK84fD4DN3/5ifHXL4cGzFr8/vmTWawtvNz+8pn/uw9W285jB9N0/76Gt/c3Tq4eNe3LNuCdem7fwzU8KVu442Ke2kS6YOxfH4WqsPUuyVTuO9Xpm7ee54+aumDOi4qk1t+dOr+5nfqhGSH/zjOrMyQvXTHhq9TzoGU0Kdh5yrLPsav/SdkkDkgb+phpgVENCrjWiQcQq20ZeU4ED8MWxeP+mqpZOW9KApAFJA1wDsHhh2SIphHfosCVTcPCVgFeaK5IGJA1IGrioGgDwAmABvHCw2SxdDsAOzlJLbPbv5Xgv6glIO5M0IGlA0sCVpgEJeK+0KyYdr6QBSQNXvAYk4L3iL6F0ApIGJA1caRqQgPdKu2LS8UoakDRwxWvggwMUI+o3IHMNxcUd623YkjPYdqOZ+uXM2HrFn7h0ApIGJA1IGvizNNA24OVZcBLw/llXS/pdSQOSBv4SGpCA9y9xGaWTkDQgaeBK0oAEvFfS1ZKOVdKApIG/hAaaAy/4XsdYXtExmo8oJXlb3kMSx/uXuPrSSUgakDTwp2igTcBrMrOecxLw/imXSvpRSQOSBv4qGpCA969yJaXzkDQgaeCK0YAEvFfMpZIOVNKApIG/igZ2HKQYFMdBwXkhaJ1jFV0Oa2GENkYQVUou9c6cJHG8f5UJIJ2HpAFJA5deA+98/b8YtK4H0Aqnmn09XtGNWma09OhLyqabRk6RgPfSXyrpFyUNSBr4q2jg/X0Upe37wImEPtNO6Po8UC9e4z2XqScS+k6yyIQTMTeMOZE2ecGav8r5S+chaUDSgKSBP0UDNTV0NToZo/FjqzKVf+dPOVDpRyUNSBqQNCBpQNKApAFJA5IGJA1IGpA0IGlA0oCkAUkDkgYkDUgakDQgaUDSgKQBSQOSBiQNSBqQNCBpoG0a+H/6UyAIW5ha6AAAAABJRU5ErkJggg==" alt="Finequs Logo" style="height: 50px; margin-right: 15px;">
-            <div style="color: white; font-size: 3rem; margin-right: 15px;">🧠</div>
-            <div style="color: white; font-size: 2.5rem; font-weight: 700;">CreditIQ Pro</div>
-        </div>
-        <div class="main-subtitle">Multi-Tenant Credit Risk Platform with AI-Designed Institution-Specific Scorecards</div>
-        <div style="margin-top: 20px;">
-            <span style="background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 20px; margin: 0 5px;">
-                🤖 AI Weight Optimization
-            </span>
-            <span style="background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 20px; margin: 0 5px;">
-                📊 Dynamic Scoring
-            </span>
-            <span style="background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 20px; margin: 0 5px;">
-                ⚡ Real-time Intelligence
-            </span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Clean, professional CSS for financial services, sent with the main header
+    # (gradient background and Finequs logo) as one element
+    st.markdown(_LOGIN_CSS + _LOGIN_HERO_HTML.format(logo_src=_logo_src()), unsafe_allow_html=True)
     
     # Three column layout for features and login
     col1, col2, col3 = st.columns([1, 1.2, 1])
     
     with col1:
-        st.markdown("""
-        <div class="feature-card" style="background: linear-gradient(135deg, #2C5530 0%, #416B47 100%);">
-            <div style="font-size: 2.5rem; margin-bottom: 15px;">📊</div>
-            <h3 style="color: white;">Risk Assessment</h3>
-            <p style="color: white;">Advanced credit scoring with 20 behavioral and financial variables for precise risk evaluation</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="stats-card" style="background: linear-gradient(135deg, #1a365d 0%, #2d5aa0 100%);">
-            <h2 style="color: white; font-size: 3rem; margin-bottom: 10px;">AI</h2>
-            <h3 style="color: white;">ML Optimization</h3>
-            <p style="color: white;">Machine learning engine automatically calibrates weights based on loan performance data</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_LEFT_COLUMN_HTML, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div class="login-container">
-            <h2 style="text-align: center; color: #667eea; margin-bottom: 30px;">
-                🔐 Secure Access Portal
-            </h2>
-        """, unsafe_allow_html=True)
+        st.markdown(_LOGIN_CONTAINER_OPEN_HTML, unsafe_allow_html=True)
         
         with st.form("login_form"):
             username = st.text_input(
@@ -1578,12 +1926,12 @@ def render_login():
             if login_button:
                 if username and password:
                     # Admin authentication
-                    if username == "Finequsadmin" and password == "Password321#":
+                    if _verify_admin(username, password):
                         st.session_state.logged_in = True
                         st.session_state.username = username
                         st.session_state.user_type = "admin"
                         st.session_state.user_data = {
-                            'username': 'Finequsadmin',
+                            'username': _ADMIN_USERNAME,
                             'type': 'admin'
                         }
                         st.success("Admin access granted")
@@ -1591,8 +1939,6 @@ def render_login():
                     else:
                         # Database authentication for company users using backend system
                         try:
-                            from backend_auth_system import backend_auth
-                            
                             user_data = backend_auth.authenticate_user(username, password)
                             
                             if user_data:
@@ -1623,9 +1969,7 @@ def render_login():
         if st.session_state.get('user_type') != 'company_user':
             with st.expander("🏢 Select Company"):
                 try:
-                    from backend_auth_system import backend_auth
-                    companies = backend_auth.get_companies()
-                    registered_companies = [company['company_name'] for company in companies]
+                    registered_companies = _registered_company_names(_database_version(backend_auth.db_path))
                     
                     # Create options list
                     company_options = registered_companies + ["New Company"]
@@ -1647,20 +1991,13 @@ def render_login():
                             st.session_state.creating_new_company = True
                     else:
                         # Clear the flag if not creating new company
-                        if 'creating_new_company' in st.session_state:
-                            del st.session_state.creating_new_company
+                        st.session_state.pop('creating_new_company', None)
                     
                     
                     # Clear any existing company data when starting fresh
                     if selected_company == "New Company":
-                        if 'onboarding_data' in st.session_state:
-                            del st.session_state.onboarding_data
-                        if 'user_profile' in st.session_state:
-                            del st.session_state.user_profile
-                        if 'onboarding_completed' in st.session_state:
-                            del st.session_state.onboarding_completed
-                        if 'onboarding_step' in st.session_state:
-                            del st.session_state.onboarding_step
+                        for key in ('onboarding_data', 'user_profile', 'onboarding_completed', 'onboarding_step'):
+                            st.session_state.pop(key, None)
                     else:
                         st.session_state.company_name = selected_company
                         st.session_state.force_onboarding = False
@@ -1672,21 +2009,7 @@ def render_login():
                     st.session_state.force_onboarding = True
     
     with col3:
-        st.markdown("""
-        <div class="feature-card" style="background: linear-gradient(135deg, #744210 0%, #B7791F 100%);">
-            <div style="font-size: 2.5rem; margin-bottom: 15px;">⚡</div>
-            <h3 style="color: white;">High-Volume Processing</h3>
-            <p style="color: white;">Process up to 25,000 applications with RESTful API integration for loan origination systems</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="stats-card" style="background: linear-gradient(135deg, #8B2635 0%, #C73E1D 100%);">
-            <h2 style="color: white; font-size: 3rem; margin-bottom: 10px;">A/B</h2>
-            <h3 style="color: white;">Testing Framework</h3>
-            <p style="color: white;">Statistical validation of weight configurations with performance tracking</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_RIGHT_COLUMN_HTML, unsafe_allow_html=True)
     
     # Bottom features section
     st.markdown("---")
@@ -1728,36 +2051,42 @@ def render_login():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; padding: 20px; color: #666;">
-        <p>🏆 <strong>CreditIQ Pro</strong> - Professional Credit Risk Assessment Platform</p>
-        <p>Powered by <strong>Finequs</strong></p>
+    st.markdown(_LOGIN_FOOTER_HTML, unsafe_allow_html=True)
+
+# Sidebar markup; only the welcome banner varies, by username
+_SIDEBAR_HEADER_HTML = """
+<div style="text-align: center; margin-bottom: 20px;">
+    <h1 style="font-size: 28px; color: #333; margin: 0;">🎯 CreditIQ Pro</h1>
+</div>
+"""
+
+_SIDEBAR_WELCOME_HTML = """
+<div style="
+    background: linear-gradient(90deg, #e8f5e8, #f0f8f0);
+    padding: 12px 16px;
+    border-radius: 8px;
+    border-left: 4px solid #28a745;
+    margin-bottom: 16px;
+    text-align: center;
+">
+    <div style="color: #155724; font-weight: 600;">
+        👤 Welcome, {username}!
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+_SIDEBAR_FOOTER_HTML = """
+<div style="text-align: center; margin-top: 20px;">
+    <p style="font-size: 12px; color: #666; margin: 0;">🏆 <strong>CreditIQ Pro</strong> | Powered by Finequs</p>
+</div>
+"""
 
 def render_sidebar():
     """Render sidebar"""
-    st.sidebar.markdown("""
-    <div style="text-align: center; margin-bottom: 20px;">
-        <h1 style="font-size: 28px; color: #333; margin: 0;">🎯 CreditIQ Pro</h1>
-    </div>
-    """, unsafe_allow_html=True)
+    st.sidebar.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
     # Professional user header with integrated logout
     if st.session_state.get('username'):
-        st.sidebar.markdown(f"""
-        <div style="
-            background: linear-gradient(90deg, #e8f5e8, #f0f8f0);
-            padding: 12px 16px;
-            border-radius: 8px;
-            border-left: 4px solid #28a745;
-            margin-bottom: 16px;
-            text-align: center;
-        ">
-            <div style="color: #155724; font-weight: 600;">
-                👤 Welcome, {st.session_state.username}!
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.sidebar.markdown(_SIDEBAR_WELCOME_HTML.format(username=st.session_state.username), unsafe_allow_html=True)
         
         if st.sidebar.button("🚪 Logout", key="logout_btn", use_container_width=True, type="secondary"):
             st.session_state.logged_in = False
@@ -1771,7 +2100,6 @@ def render_sidebar():
         st.session_state.selected_mode = "Individual Scoring"
     
     # Render user profile and preferences using quick preferences system
-    from quick_preferences_update import render_preferences_button
     render_preferences_button()
     
     # Intelligent Engine Selection
@@ -1853,14 +2181,20 @@ def render_sidebar():
     mode = st.session_state.selected_mode
     
     st.sidebar.markdown("")
-    st.sidebar.markdown("""
-    <div style="text-align: center; margin-top: 20px;">
-        <p style="font-size: 12px; color: #666; margin: 0;">🏆 <strong>CreditIQ Pro</strong> | Powered by Finequs</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.sidebar.checkbox(
+        "⚡ Lite visuals",
+        key="lite_mode",
+        help="Skip shadows, gradients and hover animations for faster rendering on slower devices"
+    )
+    st.sidebar.markdown(_SIDEBAR_FOOTER_HTML, unsafe_allow_html=True)
     
     return mode
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _company_additional_fields(company_id, company_db_version):
+    """SimplifiedAdditionalFields for a company, rebuilt only when its stored preferences change"""
+    return SimplifiedAdditionalFields(company_id)
+
 def render_individual_scoring():
     """Individual scoring interface with comprehensive 20-variable scorecard and dynamic additional data sources"""
     # Get company ID from session state
@@ -1877,16 +2211,21 @@ def render_individual_scoring():
     # Initialize simplified dynamic weight system ONLY if company has additional data sources
     simplified_fields = None
     if company_id:
-        from simplified_additional_fields import SimplifiedAdditionalFields
-        temp_simplified_fields = SimplifiedAdditionalFields(company_id)
+        # Company preferences (additional sources) live in user_management.db
+        company_db_version = _database_version("user_management.db")
+        temp_simplified_fields = _company_additional_fields(company_id, company_db_version)
         
         # Only use simplified fields if company actually has additional data sources selected
         if temp_simplified_fields.weight_config['has_additional_sources']:
             simplified_fields = temp_simplified_fields
             st.info(f"✨ Enhanced Scorecard: Your organization has access to {len(simplified_fields.weight_config['selected_sources'])} additional data sources with {simplified_fields.weight_config['additional_weight']:.1f}% additional weight")
         
-        # Update scoring engine with company ID
-        st.session_state.scoring_engine = LoanScoringEngine(company_id=company_id)
+        # Update scoring engine with company ID; company weights combine the weights
+        # file with the additional sources
+        engine_key = (company_id, _weights_file_version(), company_db_version)
+        if st.session_state.get('_scoring_engine_key') != engine_key:
+            st.session_state.scoring_engine = LoanScoringEngine(company_id=company_id)
+            st.session_state._scoring_engine_key = engine_key
     
     # System capabilities overview
     col1, col2, col3, col4 = st.columns(4)
@@ -1970,7 +2309,6 @@ def render_individual_scoring():
         # Render clean dynamic additional data source fields ONLY if company has them configured
         additional_data = {}
         if company_id:
-            from clean_dynamic_system import render_clean_dynamic_scorecard
             additional_data = render_clean_dynamic_scorecard(company_id)
         
         submitted = st.form_submit_button("🚀 Calculate Comprehensive Score", type="primary", use_container_width=True)
@@ -2065,10 +2403,10 @@ def render_individual_scoring():
                 for var, details in result['variable_scores'].items():
                     score_data.append({
                         'Variable': var,
-                        'Weight': f"{details['weight']:.1%}",
-                        'Band Score': f"{details['band_score']:.2f}",
-                        'Weighted Score': f"{details['weighted_score']:.2f}",
-                        'Value': str(details['value'])
+                        'Weight': f"{details.weight:.1%}",
+                        'Band Score': f"{details.band_score:.2f}",
+                        'Weighted Score': f"{details.weighted_score:.2f}",
+                        'Value': str(details.value)
                     })
                 
                 df_scores = pd.DataFrame(score_data)
@@ -2079,6 +2417,7 @@ def render_individual_scoring():
                 simplified_fields.display_weight_breakdown(result['additional_score_breakdown'])
             
             # Generate Excel output
+            from utils import create_excel_output
             excel_buffer = create_excel_output([applicant_data], [result], is_bulk=False)
             st.download_button(
                 label="📥 Download Results (Excel)",
@@ -2261,6 +2600,7 @@ def render_company_registration():
                     result = user_manager.register_company(company_data)
                     
                     if result['success']:
+                        _registered_company_names.clear()
                         st.success(f"Company registered successfully! Company ID: {result['company_id']}")
                         st.session_state.company_name = company_name
                         st.session_state.show_company_registration = False
@@ -2309,6 +2649,7 @@ def main():
     if company_name:
         if company_name == "New Company" or force_onboarding:
             # Show onboarding for new company
+            from personalized_onboarding import render_personalized_onboarding
             onboarding_complete = render_personalized_onboarding()
             if onboarding_complete:
                 # Save the company to the list after onboarding completes
@@ -2356,6 +2697,7 @@ def main():
                             st.session_state.scoring_engine_preference = prefs_result[1]
                 else:
                     # Company exists but hasn't completed onboarding
+                    from personalized_onboarding import render_personalized_onboarding
                     onboarding_complete = render_personalized_onboarding()
                     if onboarding_complete:
                         # Update database to mark onboarding complete
@@ -2391,12 +2733,16 @@ def main():
     
     # Handle Modular Engine routing
     elif mode == "Individual Application Scoring (Modular Engine)":
+        from modular_scoring_ui import render_modular_individual_scoring
         render_modular_individual_scoring()
     elif mode == "Dynamic Configuration":
+        from dynamic_config_ui1 import render_dynamic_scorecard_config
         render_dynamic_scorecard_config()
     elif mode == "Bulk Upload (Modular Engine)":
+        from modular_scoring_ui import render_modular_bulk_upload
         render_modular_bulk_upload()
     elif mode == "Field Mapping Management":
+        from field_mapping_manager import render_field_mapping_management
         render_field_mapping_management()
     elif mode == "Field Scoring":
         # Field Scoring functionality (formerly DSA Field Scoring)
@@ -2521,6 +2867,7 @@ def main():
         from ab_testing_fixed import render_working_ab_testing
         render_working_ab_testing()
     elif mode == "API Management":
+        from api_integration import render_api_management
         render_api_management()
 
 if __name__ == "__main__":
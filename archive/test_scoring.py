@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
 
+import math
+
+import numpy as np
+import pandas as pd
+
+import scoring_engine
 from scoring_engine import LoanScoringEngine
 
 def test_scoring_engine():
@@ -41,7 +47,7 @@ def test_scoring_engine():
     if result['variable_scores']:
         print("\nVariable Score Breakdown:")
         for var, score_info in result['variable_scores'].items():
-            print(f"  {var}: {score_info['weighted_score']:.4f} (band: {score_info['band_score']}, weight: {score_info['weight']:.1%})")
+            print(f"  {var}: {score_info.weighted_score:.4f} (band: {score_info.band_score}, weight: {score_info.weight:.1%})")
     
     print("\n" + "="*50 + "\n")
     
@@ -78,7 +84,152 @@ def test_scoring_engine():
     if result2['variable_scores']:
         print("\nVariable Score Breakdown:")
         for var, score_info in result2['variable_scores'].items():
-            print(f"  {var}: {score_info['weighted_score']:.4f} (band: {score_info['band_score']}, weight: {score_info['weight']:.1%})")
+            print(f"  {var}: {score_info.weighted_score:.4f} (band: {score_info.band_score}, weight: {score_info.weight:.1%})")
+
+# Fixed weights over every scored variable, so pinned scores do not depend on
+# the scoring_weights.json in the working directory
+_PINNED_WEIGHTS = {
+    'credit_score': 0.10, 'foir': 0.07, 'dpd30plus': 0.06, 'enquiry_count': 0.05,
+    'monthly_income': 0.06, 'age': 0.03, 'credit_vintage': 0.03, 'loan_mix_type': 0.02,
+    'loan_completion_ratio': 0.03, 'defaulted_loans': 0.06, 'unsecured_loan_amount': 0.06,
+    'outstanding_amount_percent': 0.06, 'our_lender_exposure': 0.06, 'channel_type': 0.02,
+    'job_type': 0.03, 'employment_tenure': 0.04, 'company_stability': 0.02, 'account_vintage': 0.03,
+    'avg_monthly_balance': 0.05, 'bounce_frequency': 0.04, 'geographic_risk': 0.02,
+    'mobile_number_vintage': 0.03, 'digital_engagement': 0.03
+}
+
+_GOLDEN_BASE = {
+    'pan': 'ABCDE1234F', 'age': 35, 'monthly_income': 45000, 'credit_score': 780, 'foir': 0.3,
+    'dpd30plus': 0, 'enquiry_count': 1, 'credit_vintage': 60, 'loan_mix_type': 'PL/HL/CC',
+    'loan_completion_ratio': 0.9, 'defaulted_loans': 0, 'unsecured_loan_amount': 50000,
+    'outstanding_amount_percent': 0.2, 'our_lender_exposure': 0, 'channel_type': 'Merchant/Referral',
+    'job_type': 'Government/PSU', 'employment_tenure': 60, 'company_stability': 'Fortune 500',
+    'account_vintage': 60, 'avg_monthly_balance': 50000, 'bounce_frequency': 0,
+    'geographic_risk': 'Metro Tier 1', 'mobile_number_vintage': 60, 'digital_engagement': 0.9,
+    'writeoff_flag': False
+}
+
+# (case, changes from _GOLDEN_BASE, final_score, final_bucket, decision) under
+# _PINNED_WEIGHTS. These match the original scorer except the FOIR gap rows:
+# FOIR 0.355 and 0.455 scored band 0.0 there and now take bands 0.6 and 0.3.
+_GOLDEN_CASES = [
+    ('strong', {}, 90.0, 'A', 'Auto-approve'),
+    ('a_to_b', {'dpd30plus': 1, 'enquiry_count': 4}, 83.0, 'B', 'Recommend'),
+    ('foir_gap_low', {'foir': 0.355}, 87.2, 'A', 'Auto-approve'),
+    ('foir_gap_high', {'foir': 0.455}, 85.1, 'A', 'Auto-approve'),
+    ('b_to_a', {'our_lender_exposure': 10000, 'job_type': 'Business Owner', 'company_stability': 'Startup',
+                'avg_monthly_balance': 5000, 'bounce_frequency': 3, 'geographic_risk': 'Rural',
+                'unsecured_loan_amount': 200000, 'outstanding_amount_percent': 0.8}, 79.7, 'A', 'Auto-approve'),
+    ('b_stays', {'credit_score': 700, 'foir': 0.5, 'job_type': 'Business Owner', 'avg_monthly_balance': 10000,
+                 'geographic_risk': 'Urban'}, 79.0, 'B', 'Recommend'),
+    ('c_stays', {'credit_score': 650, 'foir': 0.5, 'enquiry_count': 3, 'credit_vintage': 12,
+                 'loan_completion_ratio': 0.4, 'job_type': 'Freelancer/Contract', 'company_stability': 'Startup',
+                 'avg_monthly_balance': 5000, 'unsecured_loan_amount': 200000, 'outstanding_amount_percent': 0.8,
+                 'bounce_frequency': 3}, 60.6, 'C', 'Refer'),
+    ('c_to_b', {'credit_score': 740, 'foir': 0.5, 'enquiry_count': 3, 'job_type': 'Freelancer/Contract',
+                'company_stability': 'Startup', 'avg_monthly_balance': 5000, 'unsecured_loan_amount': 200000,
+                'outstanding_amount_percent': 0.8, 'bounce_frequency': 3, 'geographic_risk': 'Remote',
+                'digital_engagement': 0.1}, 64.8, 'B', 'Recommend'),
+    ('d_to_c', {'credit_score': 760, 'dpd30plus': 2, 'enquiry_count': 6, 'monthly_income': 30000,
+                'credit_vintage': 6, 'loan_mix_type': 'Only Gold', 'loan_completion_ratio': 0.2,
+                'unsecured_loan_amount': 400000, 'outstanding_amount_percent': 0.95, 'channel_type': 'Digital/Other',
+                'job_type': 'Freelancer/Contract', 'company_stability': 'Unknown', 'employment_tenure': 2,
+                'account_vintage': 3, 'avg_monthly_balance': 1000, 'bounce_frequency': 5, 'geographic_risk': 'Remote',
+                'mobile_number_vintage': 2, 'digital_engagement': 0.05}, 43.2, 'C', 'Refer'),
+    ('d_stays', {'credit_score': 600, 'foir': 0.7, 'dpd30plus': 2, 'enquiry_count': 6, 'loan_mix_type': 'Only Gold',
+                 'monthly_income': 16000, 'job_type': 'Freelancer/Contract', 'company_stability': 'Startup',
+                 'avg_monthly_balance': 2000, 'bounce_frequency': 4, 'geographic_risk': 'Remote',
+                 'digital_engagement': 0.1, 'outstanding_amount_percent': 0.9}, 44.5, 'D', 'Decline'),
+    ('declined_writeoff', {'writeoff_flag': True}, 0.0, 'D', 'Decline'),
+    ('declined_age', {'age': 65}, 0.0, 'D', 'Decline'),
+]
+
+def test_golden_scores():
+    """Scalar, batch and portfolio scoring must reproduce the pinned golden table"""
+    
+    engine = LoanScoringEngine()
+    engine.variable_weights = dict(_PINNED_WEIGHTS)
+    applicants = pd.DataFrame([{**_GOLDEN_BASE, **changes} for _, changes, _, _, _ in _GOLDEN_CASES])
+    batch = engine.score_applications_batch(applicants)
+    portfolio = engine.score_portfolio(applicants)
+    
+    for i, (case, changes, final_score, final_bucket, decision) in enumerate(_GOLDEN_CASES):
+        scalar = engine.score_application({**_GOLDEN_BASE, **changes})
+        for path, scored in (('scalar', scalar), ('batch', batch.iloc[i]), ('portfolio', portfolio.iloc[i])):
+            assert math.isclose(scored['final_score'], final_score, abs_tol=1e-6), (case, path, scored['final_score'])
+            assert scored['final_bucket'] == final_bucket, (case, path)
+            assert scored['decision'] == decision, (case, path)
+    
+    print(f"Scalar, batch and portfolio scoring match {len(_GOLDEN_CASES)} golden cases")
+
+def _sample_applicants(count=500, seed=7):
+    """A fixed spread of applicants across every band, including clearance failures"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'pan': [f'ABCDE{i:04d}F' for i in range(count)],
+        'age': rng.integers(19, 63, count),
+        'monthly_income': rng.choice([10000, 15000, 18000, 25000, 35000, 60000], count).astype(float),
+        'credit_score': rng.integers(550, 900, count),
+        'foir': rng.choice([0.2, 0.3, 0.35, 0.355, 0.4, 0.455, 0.5, 0.6, 0.8], count),
+        'dpd30plus': rng.choice([0, 0, 0, 1, 2, 3], count),
+        'enquiry_count': rng.integers(0, 6, count),
+        'credit_vintage': rng.integers(0, 120, count),
+        'loan_mix_type': rng.choice(['PL/HL/CC', 'Gold + Consumer Durable', 'Only Gold', 'Agri/Other loans'], count),
+        'loan_completion_ratio': rng.uniform(0, 1, count).round(2),
+        'defaulted_loans': rng.choice([0] * 9 + [1], count),
+        'unsecured_loan_amount': rng.choice([0, 50000, 75000, 150000, 300000], count).astype(float),
+        'outstanding_amount_percent': rng.uniform(0, 1, count).round(2),
+        'our_lender_exposure': rng.choice([0, 10000, 50000], count).astype(float),
+        'job_type': rng.choice(['Government/PSU', 'Private Company (MNC)', 'Private Company (Local)',
+                                'Self Employed Professional', 'Business Owner', 'Freelancer/Contract'], count),
+        'employment_tenure': rng.integers(0, 120, count),
+        'company_stability': rng.choice(['Fortune 500', 'Large Enterprise', 'Mid-size Company',
+                                         'Small Company', 'Startup', 'Unknown'], count),
+        'account_vintage': rng.integers(0, 120, count),
+        'avg_monthly_balance': rng.choice([2000, 10000, 25000, 50000, 100000], count).astype(float),
+        'bounce_frequency': rng.integers(0, 5, count),
+        'geographic_risk': rng.choice(['Metro Tier 1', 'Metro Tier 2', 'Urban', 'Semi-Urban', 'Rural', 'Remote'], count),
+        'mobile_number_vintage': rng.integers(0, 120, count),
+        'digital_engagement': rng.uniform(0, 1, count).round(2),
+        'channel_type': rng.choice(['Merchant/Referral', 'Digital/Other'], count),
+        'writeoff_flag': rng.random(count) < 0.02
+    })
+
+def test_batch_matches_scalar():
+    """Batch and portfolio scoring must agree with score_application row for row"""
+    
+    engine = LoanScoringEngine()
+    engine.variable_weights = dict(_PINNED_WEIGHTS)
+    applicants = _sample_applicants()
+    records = applicants.to_dict('records')
+    
+    # Compare with the compiled band kernel (when numba is installed) and the numpy fallback
+    kernels = [('numpy', scoring_engine._band_matrix_numpy)]
+    if scoring_engine.NUMBA_AVAILABLE:
+        kernels.insert(0, ('numba', scoring_engine._band_matrix))
+    original_kernel = scoring_engine._band_matrix
+    
+    try:
+        for kernel_name, kernel in kernels:
+            scoring_engine._band_matrix = kernel
+            batch = engine.score_applications_batch(applicants)
+            portfolio = engine.score_portfolio(applicants)
+            
+            for i, record in enumerate(records):
+                expected = engine.score_application(record)
+                for scored in (batch.iloc[i], portfolio.iloc[i]):
+                    assert math.isclose(scored['final_score'], expected['final_score'], abs_tol=1e-9), (kernel_name, i)
+                    assert scored['final_bucket'] == expected['final_bucket'], (kernel_name, i)
+                    assert scored['decision'] == expected['decision'], (kernel_name, i)
+                for var, score_info in expected['variable_scores'].items():
+                    assert math.isclose(batch.iloc[i][f'{var}_score'], score_info.weighted_score, abs_tol=1e-12), (kernel_name, i, var)
+            
+            print(f"Batch and portfolio match scalar scoring for {len(records)} applicants ({kernel_name} kernel)")
+    finally:
+        scoring_engine._band_matrix = original_kernel
 
 if __name__ == "__main__":
-    test_scoring_engine()
\ No newline at end of file
+    test_scoring_engine()
+    print("\n" + "="*50 + "\n")
+    test_golden_scores()
+    test_batch_matches_scalar()
\ No newline at end of file
@@ -153,7 +153,7 @@ def create_excel_output(applicant_data_list: List[Dict[str, Any]],
     for i, (applicant, result) in enumerate(zip(applicant_data_list, results_list)):
         movements = ""
         if result.get('bucket_movements'):
-            movements = "; ".join([f"{m['from']}→{m['to']}" for m in result['bucket_movements']])
+            movements = "; ".join([f"{m.from_bucket}→{m.to_bucket}" for m in result['bucket_movements']])
         
         row = [
             applicant.get('pan', ''),
@@ -213,8 +213,8 @@ def create_excel_output(applicant_data_list: List[Dict[str, Any]],
             if result.get('variable_scores'):
                 row = [applicant.get('pan', '')]
                 for var_name in variable_headers[1:]:
-                    var_score = result['variable_scores'].get(var_name, {})
-                    row.append(f"{var_score.get('weighted_score', 0):.2f}")
+                    vs = result['variable_scores'].get(var_name)
+                    row.append(f"{vs.weighted_score if vs else 0:.2f}")
                 scores_data.append(row)
         
         # Write variable scores data
@@ -1,6 +1,32 @@
 import re
 from typing import Dict, Any, List
 
+import numpy as np
+import pandas as pd
+
+_PAN_PATTERN = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$')
+_VALID_LOAN_TYPES = ["PL/HL/CC", "Gold + Consumer Durable", "Only Gold", "Agri/Other loans"]
+_VALID_CHANNELS = ["Merchant/Referral", "Digital/Other"]
+
+# Checks in validate_individual_data order: (field, default, low, high) ranges
+# or (field, default, allowed values) choices, each with its message
+_BATCH_CHECKS = (
+    ('age', 0, 18, 80, "Age must be between 18 and 80"),
+    ('monthly_income', 0, 0, None, "Monthly income must be a positive number"),
+    ('credit_score', 0, -1, 900, "Credit score must be between -1 and 900"),
+    ('foir', 0, 0, 2, "FOIR must be between 0 and 2"),
+    ('dpd30plus', 0, 0, 50, "DPD30Plus must be between 0 and 50"),
+    ('enquiry_count', 0, 0, 100, "Enquiry count must be between 0 and 100"),
+    ('credit_vintage', 0, 0, 600, "Credit vintage must be between 0 and 600 months"),
+    ('loan_mix_type', '', _VALID_LOAN_TYPES, f"Loan mix type must be one of: {', '.join(_VALID_LOAN_TYPES)}"),
+    ('loan_completion_ratio', 0, 0, 1, "Loan completion ratio must be between 0 and 1"),
+    ('defaulted_loans', 0, 0, 50, "Defaulted loans count must be between 0 and 50"),
+    ('unsecured_loan_amount', 0, 0, None, "Unsecured loan amount must be a positive number"),
+    ('outstanding_amount_percent', 0, 0, 1, "Outstanding amount percent must be between 0 and 1"),
+    ('our_lender_exposure', 0, 0, None, "Our lender exposure must be a positive number"),
+    ('channel_type', '', _VALID_CHANNELS, f"Channel type must be one of: {', '.join(_VALID_CHANNELS)}")
+)
+
 def validate_individual_data(data: Dict[str, Any]) -> List[str]:
     """Validate individual application data"""
     errors = []
@@ -49,9 +75,8 @@ def validate_individual_data(data: Dict[str, Any]) -> List[str]:
     
     # Loan mix type validation
     loan_mix = data.get('loan_mix_type', '')
-    valid_loan_types = ["PL/HL/CC", "Gold + Consumer Durable", "Only Gold", "Agri/Other loans"]
-    if loan_mix not in valid_loan_types:
-        errors.append(f"Loan mix type must be one of: {', '.join(valid_loan_types)}")
+    if loan_mix not in _VALID_LOAN_TYPES:
+        errors.append(f"Loan mix type must be one of: {', '.join(_VALID_LOAN_TYPES)}")
     
     # Loan completion ratio validation
     completion = data.get('loan_completion_ratio', 0)
@@ -80,9 +105,8 @@ def validate_individual_data(data: Dict[str, Any]) -> List[str]:
     
     # Channel type validation
     channel = data.get('channel_type', '')
-    valid_channels = ["Merchant/Referral", "Digital/Other"]
-    if channel not in valid_channels:
-        errors.append(f"Channel type must be one of: {', '.join(valid_channels)}")
+    if channel not in _VALID_CHANNELS:
+        errors.append(f"Channel type must be one of: {', '.join(_VALID_CHANNELS)}")
     
     # Write-off flag validation
     writeoff = data.get('writeoff_flag', False)
@@ -97,8 +121,58 @@ def validate_pan_format(pan: str) -> bool:
         return False
     
     # PAN format: 5 letters, 4 digits, 1 letter
-    pattern = r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$'
-    return bool(re.match(pattern, pan.upper()))
+    return bool(_PAN_PATTERN.match(pan.upper()))
+
+def validate_batch(df: pd.DataFrame) -> List[List[str]]:
+    """Column-wise validate_individual_data over a frame of applicant fields
+    
+    Returns one error list per row, with the same messages in the same order
+    as validating each row on its own. Missing columns take the same defaults.
+    """
+    def column(field, default):
+        return df[field] if field in df else pd.Series(default, index=df.index)
+    
+    def not_numeric(values):
+        # isinstance(value, (int, float)) fails for anything that is not a number
+        if pd.api.types.is_numeric_dtype(values):
+            return np.zeros(len(values), dtype=bool)
+        return ~values.map(lambda value: isinstance(value, (int, float))).to_numpy(dtype=bool)
+    
+    checks = []
+    pans = column('pan', '').map(str).str.strip()
+    missing_pan = (pans == '').to_numpy()
+    valid_pan = (pans.str.len() == 10) & pans.str.upper().str.match(_PAN_PATTERN)
+    checks.append(("PAN number is required", missing_pan))
+    checks.append((
+        "PAN number format is invalid (should be like ABCDE1234F)",
+        ~missing_pan & ~valid_pan.to_numpy(dtype=bool)
+    ))
+    
+    for field, default, *bounds, message in _BATCH_CHECKS:
+        values = column(field, default)
+        if len(bounds) == 1:
+            checks.append((message, ~values.isin(bounds[0]).to_numpy()))
+            continue
+        low, high = bounds
+        invalid = not_numeric(values)
+        numbers = pd.to_numeric(values.where(~invalid), errors='coerce').to_numpy(dtype=np.float64)
+        invalid |= numbers < low
+        if high is not None:
+            invalid |= numbers > high
+        checks.append((message, invalid))
+    
+    writeoff = column('writeoff_flag', False)
+    if not pd.api.types.is_bool_dtype(writeoff):
+        checks.append((
+            "Write-off flag must be true or false",
+            ~writeoff.map(lambda value: isinstance(value, (bool, np.bool_))).to_numpy(dtype=bool)
+        ))
+    
+    errors = [[] for _ in range(len(df))]
+    for message, invalid in checks:
+        for row in np.flatnonzero(invalid):
+            errors[row].append(message)
+    return errors
 
 def validate_bulk_data_row(row: Dict[str, Any], row_index: int) -> Dict[str, Any]:
     """Validate a single row from bulk data"""